@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Microbenchmark for mapping library_items rows to LibraryItem entities.
+
+Compares the per-row mapping LibraryService used to inline in every query
+method (nested parse_datetime closure, formatted-string UUID, enum
+constructor with try/except) against the shared mapper in
+``infrastructure.database.library_item_mapper``. The legacy mapping left
+``content_type`` unset; here it converts it like the shared mapper does, so
+both produce the same items.
+
+Usage: python benchmarks/row_mapper_benchmark.py [rows] [repeats]
+"""
+
+import sys
+import time
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from doctor_who_library.domain.entities.library_item import LibraryItem
+from doctor_who_library.domain.value_objects.content_type import ContentType
+from doctor_who_library.domain.value_objects.enrichment_status import EnrichmentStatus
+from doctor_who_library.infrastructure.database.library_item_mapper import (
+    rows_to_library_items,
+)
+
+STATUSES = ["pending", "enriched", "failed", "skipped", None]
+
+
+def make_rows(count: int) -> list[tuple]:
+    rows = []
+    for i in range(count):
+        rows.append(
+            (
+                uuid4().hex,
+                f"Episode {i % 6} of Story {i // 6}",
+                f"Story {i // 6}",
+                f"Episode {i % 6}",
+                f"Serial {i // 24}",
+                "BBC Television",
+                "1st Doctor",
+                f"Season {i // 100}",
+                "First Doctor",
+                "Susan, Ian, Barbara",
+                "Terry Nation",
+                None,
+                None,
+                str(i // 6),
+                None,
+                None,
+                "25 min",
+                "1963-11-23" if i % 3 else None,
+                None,
+                None,
+                STATUSES[i % len(STATUSES)],
+                0.85 if i % 2 else None,
+                None,
+                f"https://tardis.fandom.com/wiki/Story_{i // 6}" if i % 2 else None,
+                "Summary" if i % 2 else None,
+                None,
+                None,
+                "2025-07-01 12:00:00",
+                "2025-07-02 08:30:00",
+            )
+        )
+    return rows
+
+
+def legacy_map(rows: list[tuple]) -> list[LibraryItem]:
+    """The mapping LibraryService performed before the shared mapper."""
+    items = []
+    for row in rows:
+        (
+            hex_id,
+            title,
+            story_title,
+            episode_title,
+            serial_title,
+            content_type,
+            section_name,
+            group_name,
+            doctor,
+            companions,
+            writer,
+            director,
+            producer,
+            story_number,
+            series,
+            format,
+            duration,
+            broadcast_date,
+            release_date,
+            cover_date,
+            enrichment_status,
+            enrichment_confidence,
+            enrichment_error,
+            wiki_url,
+            wiki_summary,
+            wiki_image_url,
+            wiki_search_term,
+            created_at,
+            updated_at,
+        ) = row
+
+        formatted_id = (
+            f"{hex_id[:8]}-{hex_id[8:12]}-{hex_id[12:16]}-{hex_id[16:20]}-{hex_id[20:]}"
+        )
+        uuid_id = UUID(formatted_id)
+
+        try:
+            status = (
+                EnrichmentStatus(enrichment_status)
+                if enrichment_status
+                else EnrichmentStatus.PENDING
+            )
+        except ValueError:
+            status = EnrichmentStatus.PENDING
+
+        # Same conversion the shared mapper does, so both do equal work
+        try:
+            content = ContentType(content_type) if content_type else None
+        except ValueError:
+            content = None
+
+        def parse_datetime(date_str):
+            if date_str:
+                try:
+                    return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+                except ValueError:
+                    return None
+            return None
+
+        items.append(
+            LibraryItem(
+                id=uuid_id,
+                title=title or "Unknown Title",
+                display_title=title,
+                story_title=story_title,
+                episode_title=episode_title,
+                serial_title=serial_title,
+                content_type=content,
+                section_name=section_name,
+                group_name=group_name,
+                doctor=doctor,
+                companions=companions,
+                writer=writer,
+                director=director,
+                producer=producer,
+                story_number=story_number,
+                series=series,
+                format=format,
+                duration=duration,
+                broadcast_date=parse_datetime(broadcast_date),
+                release_date=parse_datetime(release_date),
+                cover_date=parse_datetime(cover_date),
+                enrichment_status=status,
+                enrichment_confidence=enrichment_confidence or 0.0,
+                enrichment_error=enrichment_error,
+                wiki_url=wiki_url,
+                wiki_summary=wiki_summary,
+                wiki_image_url=wiki_image_url,
+                wiki_search_term=wiki_search_term,
+                created_at=parse_datetime(created_at) or datetime.utcnow(),
+                updated_at=parse_datetime(updated_at) or datetime.utcnow(),
+            )
+        )
+    return items
+
+
+def rows_per_second(mapper, rows: list[tuple], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        mapper(rows)
+        best = min(best, time.perf_counter() - start)
+    return len(rows) / best
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    rows = make_rows(count)
+
+    before = rows_per_second(legacy_map, rows, repeats)
+    after = rows_per_second(rows_to_library_items, rows, repeats)
+
+    print(f"rows: {count}, best of {repeats}")
+    print(f"legacy mapper: {before:>12,.0f} rows/sec")
+    print(f"shared mapper: {after:>12,.0f} rows/sec")
+    print(f"speedup:       {after / before:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
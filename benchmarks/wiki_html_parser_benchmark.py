@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Benchmark for scraping rendered TARDIS Wiki pages.
+
+Compares the scrape TardisWikiService used to run on every page (a full
+BeautifulSoup ``html.parser`` tree) against each installed backend in
+``infrastructure.external.wiki_html_parser``, and checks that every backend
+extracts the same summary, infobox, categories and images.
+
+Pages are read from a directory of saved ``*.html`` files, for example
+fetched with ``curl -o "Blink.html" https://tardis.fandom.com/wiki/Blink``.
+Without one, synthetic pages shaped like fandom story pages are used.
+
+Usage: python benchmarks/wiki_html_parser_benchmark.py [pages_dir] [repeats]
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from doctor_who_library.infrastructure.external.wiki_html_parser import (
+    MAX_IMAGES,
+    ScrapedPage,
+    available_backends,
+    get_html_parser,
+    is_summary_paragraph,
+)
+
+SYNTHETIC_PAGES = 12
+
+
+def make_page(index: int) -> str:
+    """A page with the layout and rough weight of a fandom story page."""
+    title = f"Story {index}"
+    head = "".join(
+        f'<script>window.config{n} = {{"key": "{"x" * 900}", "n": {n}}};</script>'
+        f'<link rel="stylesheet" href="/load.php?modules=site{n}">'
+        for n in range(40)
+    )
+    head += "<style>" + ".wds-button{color:#000}" * 400 + "</style>"
+    icons = "".join(
+        f'<svg class="wds-icon" viewBox="0 0 24 24"><path d="M{n} 0L24 {n}z"/>'
+        f'<use xlink:href="#wds-icons-{n}"></use></svg>'
+        for n in range(60)
+    )
+    nav = "".join(
+        f'<li><a href="/wiki/Portal:{n}">Portal {n}</a></li>' for n in range(120)
+    )
+    header_categories = "".join(
+        f'<a href="/wiki/Category:{title}_category_{n}">{title} category {n}</a>'
+        for n in range(4)
+    )
+    infobox = "".join(
+        f"<tr><th>Field {n}</th><td><a href='/wiki/Value_{n}'>Value {n}</a>"
+        f"<sup>[{n}]</sup></td></tr>"
+        for n in range(18)
+    )
+    paragraphs = "".join(
+        f"<p>{title} paragraph {n}: the Doctor and companions arrive on "
+        f"<a href='/wiki/Planet_{n}'>Planet {n}</a> where the "
+        f"<a href='/wiki/Dalek'>Daleks</a> are waiting.<sup>[{n}]</sup></p>"
+        for n in range(40)
+    )
+    navboxes = "".join(
+        "<table class='navbox'><tr><td>"
+        + "".join(f"<a href='/wiki/Story_{n}'>Story {n}</a> · " for n in range(80))
+        + "</td></tr></table>"
+        for _ in range(4)
+    )
+    footer_categories = "".join(
+        f'<li><a href="/wiki/Category:Footer_{n}">Footer {n}</a></li>'
+        for n in range(25)
+    )
+    footer = "".join(f'<a href="/f/{n}">Footer link {n}</a>' for n in range(200))
+    return (
+        f"<!DOCTYPE html><html><head><title>{title}</title>{head}</head><body>"
+        f'<div class="global-navigation">{icons}'
+        '<img src="https://static.wikia.nocookie.net/logo.png" alt="Fandom">'
+        f"<ul>{nav}</ul></div>"
+        f'<main class="page__main"><div class="page-header__categories">'
+        f"{header_categories}</div>"
+        '<div id="mw-content-text"><div class="mw-parser-output">'
+        '<p class="caption">Short caption</p>'
+        f'<table class="infobox"><tr><th colspan="2">{title}</th></tr>'
+        f'<tr><td colspan="2"><img src="https://static.wikia.nocookie.net/story_{index}.jpg"'
+        f' alt="{title}"></td></tr>{infobox}</table>'
+        f"{paragraphs}{navboxes}</div></div>"
+        f'<div class="page-footer__categories"><ul>{footer_categories}</ul></div>'
+        f"</main><footer>{footer}</footer>{head}</body></html>"
+    )
+
+
+def legacy_scrape(html: str) -> ScrapedPage:
+    """The scrape TardisWikiService performed before the parser backends."""
+    soup = BeautifulSoup(html, "html.parser")
+    page = ScrapedPage()
+
+    content_div = soup.find("div", {"class": "mw-parser-output"}) or soup.find(
+        "div", {"id": "mw-content-text"}
+    )
+    if content_div and hasattr(content_div, "find_all"):
+        for p in content_div.find_all("p"):
+            text = p.get_text().strip()
+            if text and is_summary_paragraph(text):
+                page.summary = text
+                break
+
+    infobox = soup.find("table", {"class": "infobox"})
+    if infobox:
+        for row in infobox.find_all("tr"):
+            header = row.find("th")
+            data_cell = row.find("td")
+            if header and data_cell:
+                page.infobox.append((header.get_text(), data_cell.get_text()))
+
+    categories = soup.find_all("a", href=re.compile(r"/wiki/Category:"))
+    page.categories = [cat.get_text() for cat in categories]
+    images = soup.find_all("img", src=re.compile(r"\.jpg|\.png|\.gif", re.I))
+    page.images = [str(img["src"]) for img in images[:MAX_IMAGES] if img.get("src")]
+    return page
+
+
+def normalized(page: ScrapedPage) -> tuple:
+    def clean(text: str) -> str:
+        return " ".join(text.split())
+
+    return (
+        clean(page.summary),
+        [(clean(key), clean(value)) for key, value in page.infobox],
+        [clean(category) for category in page.categories],
+        page.images,
+    )
+
+
+def pages_per_second(scrape, pages: list[str], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for html in pages:
+            scrape(html)
+        best = min(best, time.perf_counter() - start)
+    return len(pages) / best
+
+
+def load_pages(directory: str | None) -> list[str]:
+    if directory is None:
+        return [make_page(index) for index in range(SYNTHETIC_PAGES)]
+    paths = sorted(Path(directory).glob("*.html"))
+    if not paths:
+        sys.exit(f"No .html pages in {directory}")
+    return [path.read_text(encoding="utf-8", errors="replace") for path in paths]
+
+
+def main() -> None:
+    directory = sys.argv[1] if len(sys.argv) > 1 else None
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    pages = load_pages(directory)
+    size = sum(len(html) for html in pages) / len(pages)
+
+    expected = [normalized(legacy_scrape(html)) for html in pages]
+    baseline = pages_per_second(legacy_scrape, pages, repeats)
+
+    print(f"pages: {len(pages)} ({size / 1024:.0f} KiB avg), best of {repeats}")
+    print(f"{'legacy html.parser':<20} {baseline:>9,.1f} pages/sec")
+    for backend in available_backends():
+        parser = get_html_parser(backend)
+        mismatches = sum(
+            normalized(parser.parse(html)) != want
+            for html, want in zip(pages, expected, strict=True)
+        )
+        rate = pages_per_second(parser.parse, pages, repeats)
+        note = f", {mismatches} pages differ" if mismatches else ""
+        speedup = rate / baseline
+        print(f"{backend:<20} {rate:>9,.1f} pages/sec  {speedup:>5.1f}x{note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,10 +11,10 @@
 
 import { useState, useEffect, useCallback } from 'react';
 import { useQuery } from '@tanstack/react-query';
-import { searchLibraryItems } from '../services/api';
-import type { LibraryItemResponse } from '../types/api';
+import { suggestLibraryItems } from '../services/api';
+import type { LibrarySuggestion } from '../types/api';
 
-type SearchResult = LibraryItemResponse;
+type SearchResult = LibrarySuggestion;
 
 interface UseSearchOptions {
   minLength?: number;
@@ -68,8 +68,8 @@ export const useSearch = ({
     isError,
     error
   } = useQuery({
-    queryKey: ['search', debouncedQuery],
-    queryFn: () => searchLibraryItems(debouncedQuery, limit),
+    queryKey: ['suggest', debouncedQuery, limit],
+    queryFn: () => suggestLibraryItems(debouncedQuery, limit),
     enabled: debouncedQuery.length >= minLength,
     staleTime: 5 * 60 * 1000, // 5 minutes
     gcTime: 10 * 60 * 1000, // 10 minutes
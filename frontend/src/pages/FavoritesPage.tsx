@@ -24,19 +24,15 @@ const FavoritesPage: React.FC = () => {
     queryFn: async () => {
       if (favorites.length === 0) return [];
       
-      // Fetch each favorite item
-      const items = await Promise.all(
-        favorites.map(async (fav) => {
-          try {
-            return await libraryApi.getLibraryItem(fav.library_item_id);
-          } catch (error) {
-            console.error(`Error fetching item ${fav.library_item_id}:`, error);
-            return null;
-          }
-        })
+      // Fetch all favorite items in one batch request
+      const { items, missing } = await libraryApi.getLibraryItemsBatch(
+        favorites.map(fav => fav.library_item_id)
       );
-      
-      return items.filter(item => item !== null);
+      if (missing.length > 0) {
+        console.error('Favorite items not found:', missing);
+      }
+
+      return items;
     },
     enabled: favorites.length > 0,
     staleTime: 5 * 60 * 1000,
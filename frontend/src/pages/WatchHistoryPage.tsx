@@ -24,24 +24,21 @@ const WatchHistoryPage: React.FC = () => {
     queryFn: async () => {
       if (watchHistory.length === 0) return [];
       
-      // Fetch each watched item
-      const items = await Promise.all(
-        watchHistory.map(async (watch) => {
-          try {
-            const item = await libraryApi.getLibraryItem(watch.library_item_id);
-            return {
-              ...item,
-              watched_at: watch.watched_at,
-              progress: watch.progress || 100
-            };
-          } catch (error) {
-            console.error(`Error fetching item ${watch.library_item_id}:`, error);
-            return null;
-          }
-        })
+      // Fetch all watched items in one batch request
+      const { items, missing } = await libraryApi.getLibraryItemsBatch(
+        watchHistory.map(watch => watch.library_item_id)
       );
-      
-      return items.filter(item => item !== null);
+      if (missing.length > 0) {
+        console.error('Watched items not found:', missing);
+      }
+
+      const itemsById = new Map(items.map(item => [item.id, item]));
+      return watchHistory.flatMap((watch) => {
+        const item = itemsById.get(watch.library_item_id);
+        return item
+          ? [{ ...item, watched_at: watch.watched_at, progress: watch.progress || 100 }]
+          : [];
+      });
     },
     enabled: watchHistory.length > 0,
     staleTime: 5 * 60 * 1000,
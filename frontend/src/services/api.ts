@@ -13,12 +13,16 @@
 
 import axios, { type AxiosResponse } from 'axios';
 import type {
+  LibraryFacetsQuery,
+  LibraryFacetsResponse,
+  LibraryItemBatchResponse,
   LibraryItemResponse,
   LibraryItemsQuery,
   LibrarySearchQuery,
   LibrarySearchResponse,
   LibraryStatsResponse,
   LibrarySectionResponse,
+  LibrarySuggestion,
   ApiError
 } from '../types/api';
 
@@ -94,6 +98,21 @@ export const libraryApi = {
     return response.data;
   },
 
+  /**
+   * Get many library items by ID in request order (max 500 per request)
+   */
+  async getLibraryItemsBatch(itemIds: string[]): Promise<LibraryItemBatchResponse> {
+    const result: LibraryItemBatchResponse = { items: [], missing: [] };
+    for (let start = 0; start < itemIds.length; start += 500) {
+      const response = await api.post<LibraryItemBatchResponse>('/library/items:batch', {
+        ids: itemIds.slice(start, start + 500),
+      });
+      result.items.push(...response.data.items);
+      result.missing.push(...response.data.missing);
+    }
+    return result;
+  },
+
   /**
    * Get library statistics
    */
@@ -102,6 +121,14 @@ export const libraryApi = {
     return response.data;
   },
 
+  /**
+   * Get item counts per section, group, content type, doctor and status
+   */
+  async getLibraryFacets(params: LibraryFacetsQuery = {}): Promise<LibraryFacetsResponse> {
+    const response = await api.get<LibraryFacetsResponse>('/library/facets', { params });
+    return response.data;
+  },
+
   /**
    * Get all library sections
    */
@@ -117,6 +144,16 @@ export const libraryApi = {
     const response = await api.get<LibrarySearchResponse>('/library/search', { params });
     return response.data;
   },
+
+  /**
+   * Title suggestions for search-as-you-type
+   */
+  async suggestLibrary(query: string, limit: number = 8): Promise<LibrarySuggestion[]> {
+    const response = await api.get<LibrarySuggestion[]>('/library/suggest', {
+      params: { q: query, limit },
+    });
+    return response.data;
+  },
 };
 
 // Admin API
@@ -203,4 +240,8 @@ export const searchLibraryItems = async (query: string, limit: number = 8): Prom
   return response.results;
 };
 
+// Helper function for search-as-you-type
+export const suggestLibraryItems = (query: string, limit: number = 8): Promise<LibrarySuggestion[]> =>
+  libraryApi.suggestLibrary(query, limit);
+
 export default api;
\ No newline at end of file
@@ -54,6 +54,24 @@ export interface LibrarySectionResponse {
   display_name?: string;
 }
 
+export interface LibraryItemBatchResponse {
+  items: LibraryItemResponse[];
+  missing: string[];
+}
+
+export interface LibraryFacetsResponse {
+  total: number;
+  facets: Record<'section' | 'group' | 'content_type' | 'doctor' | 'enrichment_status', Record<string, number>>;
+}
+
+export interface LibraryFacetsQuery {
+  section?: string;
+  group?: string;
+  content_type?: string;
+  doctor?: string;
+  enrichment_status?: EnrichmentStatus;
+}
+
 export interface LibrarySearchResponse {
   query: string;
   total_results: number;
@@ -74,6 +92,8 @@ export interface LibraryItemsQuery {
   enrichment_status?: EnrichmentStatus;
   limit?: number;
   offset?: number;
+  cursor?: string;
+  fields?: string;
   sortBy?: string;
   sortOrder?: 'asc' | 'desc';
 }
@@ -81,6 +101,20 @@ export interface LibraryItemsQuery {
 export interface LibrarySearchQuery {
   q: string;
   limit?: number;
+  fields?: string;
+}
+
+export interface LibrarySuggestion {
+  id: string;
+  title: string | null;
+  story_title: string | null;
+  episode_title: string | null;
+  serial_title: string | null;
+  content_type: string | null;
+  section_name: string | null;
+  doctor: string | null;
+  matched_field: 'title' | 'story_title' | 'serial_title';
+  matched: string | null;
 }
 
 // API Error Response
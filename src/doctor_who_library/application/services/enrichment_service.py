@@ -5,11 +5,18 @@ from typing import Any
 
 from structlog import get_logger
 
+from doctor_who_library.application.services.enrichment_write_buffer import (
+    EnrichmentWriteBuffer,
+)
+from doctor_who_library.application.services.library_catalog import LibraryCatalog
+from doctor_who_library.application.services.library_facets import FacetCache
+from doctor_who_library.application.services.library_item_cache import LibraryItemCache
 from doctor_who_library.domain.entities.library_item import LibraryItem
 from doctor_who_library.domain.services.wiki_service import WikiService
 from doctor_who_library.domain.value_objects.enrichment_status import EnrichmentStatus
 from doctor_who_library.shared.config.settings import EnrichmentSettings
 from doctor_who_library.shared.exceptions.application import ServiceException
+from doctor_who_library.shared.exceptions.infrastructure import WikiUnavailableException
 
 logger = get_logger()
 
@@ -21,24 +28,28 @@ class EnrichmentService:
         self,
         wiki_service: WikiService,
         config: EnrichmentSettings,
+        write_buffer: EnrichmentWriteBuffer | None = None,
+        item_cache: LibraryItemCache | None = None,
+        catalog: LibraryCatalog | None = None,
+        facet_cache: FacetCache | None = None,
     ):
         self.wiki_service = wiki_service
         self.config = config
+        self.write_buffer = write_buffer or EnrichmentWriteBuffer.from_settings(config)
+        self.item_cache = item_cache
+        self.catalog = catalog
+        self.facet_cache = facet_cache
         self._enrichment_counter = self._get_current_enriched_count()
 
     def _get_current_enriched_count(self) -> int:
         """Get the current count of enriched items for sequential numbering."""
         try:
-            from doctor_who_library.shared.database.connection import execute_query
-
-            query = """
-                SELECT COUNT(*) FROM library_items
-                WHERE enrichment_status = 'enriched'
-                ORDER BY updated_at ASC
-            """
+            from doctor_who_library.infrastructure.database.library_stats import (
+                get_library_counters_sync,
+            )
 
-            result = execute_query(query)
-            return int(result[0][0]) if result else 0
+            counters = get_library_counters_sync()
+            return int(counters["status_counts"].get("enriched", 0))
 
         except Exception:
             return 0
@@ -81,7 +92,7 @@ class EnrichmentService:
             from datetime import datetime
             from uuid import UUID
 
-            from doctor_who_library.shared.database.connection import execute_query
+            from doctor_who_library.shared.database.executor import fetch_all
 
             query = """
                 SELECT id, title, story_title, section_name, enrichment_status, enrichment_confidence,
@@ -94,7 +105,7 @@ class EnrichmentService:
             if limit:
                 query += f" LIMIT {limit}"
 
-            rows = execute_query(query)
+            rows = await fetch_all(query)
 
             items = []
             for row in rows:
@@ -156,33 +167,17 @@ class EnrichmentService:
             ) from e
 
     async def save_enriched_item(self, item: LibraryItem) -> None:
-        """Save enriched item to database."""
+        """Queue an enriched item for batched persistence.
+
+        Writes are buffered and flushed together; call ``flush_writes`` when
+        the result must be visible in the database immediately.
+        """
         try:
-            from doctor_who_library.shared.database.connection import execute_update
+            await self.write_buffer.add(item)
 
-            # Remove dashes from UUID for database storage
-            hex_id = str(item.id).replace("-", "")
-
-            execute_update(
-                """UPDATE library_items SET
-                   enrichment_status = ?,
-                   enrichment_confidence = ?,
-                   wiki_url = ?,
-                   wiki_summary = ?,
-                   wiki_search_term = ?,
-                   enrichment_error = ?,
-                   updated_at = datetime('now')
-                   WHERE id = ?""",
-                (
-                    item.enrichment_status.value,
-                    item.enrichment_confidence,
-                    item.wiki_url,
-                    item.wiki_summary,
-                    item.wiki_search_term,
-                    item.enrichment_error,
-                    hex_id,
-                ),
-            )
+            # The buffer invalidates again once the write is committed
+            if self.item_cache is not None:
+                self.item_cache.invalidate(str(item.id).replace("-", ""))
 
         except Exception as e:
             raise ServiceException(
@@ -192,6 +187,20 @@ class EnrichmentService:
                 cause=e,
             ) from e
 
+    async def flush_writes(self) -> int:
+        """Persist all buffered enrichment results."""
+        return await self.write_buffer.flush()
+
+    async def _enrich_when_available(self, item: LibraryItem) -> LibraryItem:
+        """Enrich an item, pausing through wiki outages instead of failing it."""
+        while True:
+            try:
+                return await self.wiki_service.enrich_item(item)
+            except WikiUnavailableException as e:
+                logger.warning(f"Pausing enrichment, TARDIS Wiki unavailable: {e}")
+                await self.wiki_service.wait_until_available()
+                logger.info(f"Resuming enrichment with item {item.id}")
+
     async def enrich_pending_items(
         self,
         batch_size: int | None = None,
@@ -236,7 +245,7 @@ class EnrichmentService:
                 async with self.wiki_service:
                     for item in batch:
                         try:
-                            enriched_item = await self.wiki_service.enrich_item(item)
+                            enriched_item = await self._enrich_when_available(item)
                             await self.save_enriched_item(enriched_item)
 
                             # Log individual item completion in MONITOR format
@@ -284,6 +293,8 @@ class EnrichmentService:
 
                 logger.info(f"Batch {batch_num} complete")
 
+            await self.flush_writes()
+
             avg_confidence = (
                 sum(confidence_scores) / len(confidence_scores)
                 if confidence_scores
@@ -316,12 +327,12 @@ class EnrichmentService:
             from datetime import datetime
             from uuid import UUID
 
-            from doctor_who_library.shared.database.connection import execute_query
+            from doctor_who_library.shared.database.executor import fetch_all
 
             # Remove dashes from UUID for database lookup
             hex_id = item_id.replace("-", "")
 
-            rows = execute_query(
+            rows = await fetch_all(
                 "SELECT id, title, story_title, section_name, enrichment_status, enrichment_confidence, "
                 "wiki_url, wiki_summary, episode_title, serial_title, content_type "
                 "FROM library_items WHERE id = ?",
@@ -386,6 +397,7 @@ class EnrichmentService:
 
             # Save the result
             await self.save_enriched_item(enriched_item)
+            await self.flush_writes()
 
             return enriched_item
 
@@ -402,10 +414,13 @@ class EnrichmentService:
     ) -> int:
         """Reset enrichment status for all items."""
         try:
-            from doctor_who_library.shared.database.connection import execute_update
+            # Land buffered results first so they cannot overwrite the reset
+            await self.flush_writes()
+
+            from doctor_who_library.shared.database.executor import execute
 
             # Reset enrichment fields for all items
-            affected_rows = execute_update(
+            affected_rows = await execute(
                 """UPDATE library_items SET
                    enrichment_status = ?,
                    enrichment_confidence = 0.0,
@@ -418,6 +433,8 @@ class EnrichmentService:
                 (status.value,),
             )
 
+            await self._items_changed(None)
+
             logger.info(f"Reset enrichment status for {affected_rows} items")
             return affected_rows
 
@@ -434,10 +451,13 @@ class EnrichmentService:
     ) -> int:
         """Reset enrichment status for a single item."""
         try:
-            from doctor_who_library.shared.database.connection import execute_update
+            # Land buffered results first so they cannot overwrite the reset
+            await self.flush_writes()
+
+            from doctor_who_library.shared.database.executor import execute
 
             # Reset enrichment fields for specific item
-            affected_rows = execute_update(
+            affected_rows = await execute(
                 """UPDATE library_items SET
                    enrichment_status = ?,
                    enrichment_confidence = 0.0,
@@ -454,6 +474,8 @@ class EnrichmentService:
                 ),  # Remove dashes for database storage
             )
 
+            await self._items_changed([item_id.replace("-", "")])
+
             logger.info(f"Reset enrichment status for item {item_id}")
             return affected_rows
 
@@ -465,13 +487,34 @@ class EnrichmentService:
                 cause=e,
             ) from e
 
+    async def _items_changed(self, hex_ids: list[str] | None) -> None:
+        """Bring read caches up to date after a direct write (``None`` = all items)."""
+        if self.facet_cache is not None:
+            self.facet_cache.invalidate()
+
+        # The item cache goes last: a read between the two steps could
+        # otherwise cache the catalog's old row again
+        if hex_ids is None:
+            if self.catalog is not None:
+                self.catalog.invalidate()
+            if self.item_cache is not None:
+                self.item_cache.clear()
+            return
+
+        if self.catalog is not None:
+            from doctor_who_library.shared.database.executor import run_blocking
+
+            await run_blocking(self.catalog.refresh_items, hex_ids)
+        if self.item_cache is not None:
+            self.item_cache.invalidate_many(hex_ids)
+
     async def get_processed_items(self, limit: int | None = None) -> list[LibraryItem]:
         """Get already processed library items (enriched, failed, or skipped)."""
         try:
             from datetime import datetime
             from uuid import UUID
 
-            from doctor_who_library.shared.database.connection import execute_query
+            from doctor_who_library.shared.database.executor import fetch_all
 
             query = """
                 SELECT id, title, story_title, section_name, enrichment_status, enrichment_confidence,
@@ -484,7 +527,7 @@ class EnrichmentService:
             if limit:
                 query += f" LIMIT {limit}"
 
-            rows = execute_query(query)
+            rows = await fetch_all(query)
 
             items = []
             for row in rows:
@@ -596,7 +639,7 @@ class EnrichmentService:
                     for item in batch:
                         try:
                             logger.info(f"🔍 Enriching: {item.title}")
-                            enriched_item = await self.wiki_service.enrich_item(item)
+                            enriched_item = await self._enrich_when_available(item)
                             await self.save_enriched_item(enriched_item)
 
                             # Log the result with detailed information
@@ -665,6 +708,8 @@ class EnrichmentService:
 
                 logger.info(f"Batch {batch_num} complete")
 
+            await self.flush_writes()
+
             avg_confidence = (
                 sum(confidence_scores) / len(confidence_scores)
                 if confidence_scores
@@ -736,7 +781,7 @@ class EnrichmentService:
                     for item in batch:
                         try:
                             logger.info(f"🔍 Enriching: {item.title}")
-                            enriched_item = await self.wiki_service.enrich_item(item)
+                            enriched_item = await self._enrich_when_available(item)
                             await self.save_enriched_item(enriched_item)
 
                             # Log the result with detailed information
@@ -801,6 +846,8 @@ class EnrichmentService:
 
                 logger.info(f"Batch {batch_num} complete")
 
+            await self.flush_writes()
+
             avg_confidence = (
                 sum(confidence_scores) / len(confidence_scores)
                 if confidence_scores
@@ -829,24 +876,14 @@ class EnrichmentService:
     async def get_enrichment_stats(self) -> dict[str, Any]:
         """Get enrichment statistics."""
         try:
-            from doctor_who_library.shared.database.connection import execute_query
-
-            stats = {}
+            from doctor_who_library.infrastructure.database.library_stats import (
+                get_library_counters,
+            )
 
-            # Count by status
-            for status in EnrichmentStatus:
-                count_result = execute_query(
-                    "SELECT COUNT(*) FROM library_items WHERE enrichment_status = ?",
-                    (status.value,),
-                )
-                stats[status.value] = count_result[0][0]
+            counters = await get_library_counters()
 
-            # Calculate average confidence for enriched items
-            avg_result = execute_query(
-                "SELECT AVG(enrichment_confidence) FROM library_items WHERE enrichment_status = ? AND enrichment_confidence IS NOT NULL",
-                (EnrichmentStatus.ENRICHED.value,),
-            )
-            stats["avg_confidence"] = avg_result[0][0] if avg_result[0][0] else 0.0
+            stats: dict[str, Any] = dict(counters["status_counts"])
+            stats["avg_confidence"] = counters["avg_confidence"]
 
             return stats
 
@@ -0,0 +1,158 @@
+"""Write-behind buffer for enrichment results."""
+
+import asyncio
+import threading
+from collections.abc import Callable, Sequence
+
+from structlog import get_logger
+
+from doctor_who_library.domain.entities.library_item import LibraryItem
+from doctor_who_library.shared.config.settings import EnrichmentSettings
+from doctor_who_library.shared.database.connection import execute_many
+from doctor_who_library.shared.database.executor import run_blocking
+from doctor_who_library.shared.exceptions.application import ServiceException
+
+logger = get_logger()
+
+SAVE_ENRICHMENT_SQL = """UPDATE library_items SET
+   enrichment_status = ?,
+   enrichment_confidence = ?,
+   wiki_url = ?,
+   wiki_summary = ?,
+   wiki_search_term = ?,
+   enrichment_error = ?,
+   updated_at = datetime('now')
+   WHERE id = ?"""
+
+
+class EnrichmentWriteBuffer:
+    """Collects enrichment results and persists them in batched transactions.
+
+    Results are keyed by item ID, so a later result for the same item
+    replaces an earlier unflushed one. The buffer is flushed with a single
+    ``executemany`` once ``flush_size`` items are pending or
+    ``flush_interval_ms`` after the first unflushed write, whichever comes
+    first. Callers must ``flush()`` at the end of a run and ``close()`` on
+    shutdown so nothing is left behind. Each of ``flush_listeners`` is
+    called with the IDs of every batch once it is committed.
+    """
+
+    def __init__(
+        self,
+        flush_size: int = 50,
+        flush_interval_ms: int = 500,
+        flush_listeners: Sequence[Callable[[list[str]], None]] = (),
+    ):
+        self.flush_size = max(1, flush_size)
+        self.flush_interval_ms = flush_interval_ms
+        self.flush_listeners = list(flush_listeners)
+        self._pending: dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        # Serializes flushes so batches land in the order they were taken
+        self._flush_lock = threading.Lock()
+        self._timer: asyncio.Task | None = None
+        self._flushed_items = 0
+        self._flush_count = 0
+
+    @classmethod
+    def from_settings(cls, config: EnrichmentSettings) -> "EnrichmentWriteBuffer":
+        return cls(
+            flush_size=config.write_batch_size,
+            flush_interval_ms=config.write_flush_interval_ms,
+        )
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def add(self, item: LibraryItem) -> None:
+        """Queue an item's enrichment result for persistence."""
+        hex_id = str(item.id).replace("-", "")
+        params = (
+            item.enrichment_status.value,
+            item.enrichment_confidence,
+            item.wiki_url,
+            item.wiki_summary,
+            item.wiki_search_term,
+            item.enrichment_error,
+            hex_id,
+        )
+
+        with self._lock:
+            self._pending[hex_id] = params
+            pending = len(self._pending)
+
+        if pending >= self.flush_size:
+            await self.flush()
+        elif self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> int:
+        """Persist all pending results in one transaction."""
+        self._cancel_timer()
+        try:
+            return await run_blocking(self._flush_sync)
+        except Exception as e:
+            raise ServiceException(
+                service_name="EnrichmentService",
+                operation="flush_enrichment_writes",
+                message=f"Failed to persist {self.pending_count} enrichment results",
+                cause=e,
+            ) from e
+
+    async def close(self) -> int:
+        """Cancel the pending flush timer and flush outstanding writes."""
+        self._cancel_timer()
+        return await self.flush()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "pending": self.pending_count,
+            "flushed_items": self._flushed_items,
+            "flushes": self._flush_count,
+        }
+
+    def _flush_sync(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                batch = self._pending
+                self._pending = {}
+
+            if not batch:
+                return 0
+
+            try:
+                execute_many(SAVE_ENRICHMENT_SQL, list(batch.values()))
+            except Exception:
+                # Put the batch back without clobbering newer results
+                with self._lock:
+                    for hex_id, params in batch.items():
+                        self._pending.setdefault(hex_id, params)
+                raise
+
+            self._flushed_items += len(batch)
+            self._flush_count += 1
+
+            # The batch is committed; one failing listener must not keep the
+            # others (e.g. cache invalidation) from seeing it
+            flushed_ids = list(batch)
+            for listener in self.flush_listeners:
+                try:
+                    listener(flushed_ids)
+                except Exception as e:
+                    logger.error(f"Enrichment flush listener {listener!r} failed: {e}")
+            return len(batch)
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval_ms / 1000)
+        self._timer = None
+        try:
+            await run_blocking(self._flush_sync)
+        except Exception as e:
+            logger.error(f"Background flush of enrichment results failed: {e}")
+
+    def _cancel_timer(self) -> None:
+        timer = self._timer
+        self._timer = None
+        if timer is not None and not timer.done():
+            timer.cancel()
@@ -0,0 +1,330 @@
+"""Read-optimized in-memory snapshot of the library catalog."""
+
+import math
+import sys
+import threading
+from array import array
+from bisect import bisect_right, insort
+from collections.abc import Iterable
+from itertools import repeat
+from typing import Any
+
+from structlog import get_logger
+
+from doctor_who_library.application.services.library_facets import (
+    FACET_COLUMNS,
+    count_facets,
+)
+from doctor_who_library.domain.entities.library_item import LibraryItem
+from doctor_who_library.domain.value_objects.enrichment_status import EnrichmentStatus
+from doctor_who_library.infrastructure.database.library_item_mapper import (
+    LIBRARY_ITEM_COLUMNS,
+    row_to_library_item,
+)
+from doctor_who_library.shared.database.connection import execute_query
+from doctor_who_library.shared.database.executor import run_blocking
+
+logger = get_logger()
+
+CATALOG_SELECT = f"SELECT rowid, {', '.join(LIBRARY_ITEM_COLUMNS)} FROM library_items"
+
+# Low-cardinality columns whose values are shared between many rows
+INTERNED_COLUMNS = frozenset(
+    {
+        "content_type",
+        "section_name",
+        "group_name",
+        "doctor",
+        "companions",
+        "writer",
+        "director",
+        "producer",
+        "series",
+        "format",
+        "duration",
+        "enrichment_status",
+    }
+)
+
+_ID = LIBRARY_ITEM_COLUMNS.index("id")
+_CONFIDENCE = LIBRARY_ITEM_COLUMNS.index("enrichment_confidence")
+_SECTION = LIBRARY_ITEM_COLUMNS.index("section_name")
+_GROUP = LIBRARY_ITEM_COLUMNS.index("group_name")
+_STATUS = LIBRARY_ITEM_COLUMNS.index("enrichment_status")
+_INTERNED = tuple(name in INTERNED_COLUMNS for name in LIBRARY_ITEM_COLUMNS)
+
+# SQLite's default limit on host parameters is 999
+_REFRESH_CHUNK = 500
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _store_confidence(value) -> float:
+    return math.nan if value is None else float(value)
+
+
+class LibraryCatalog:
+    """Columnar snapshot of ``library_items`` answering list/filter/count reads.
+
+    Rows are stored by position in chronology (rowid) order: one list per
+    column, strings in low-cardinality columns interned, rowids and
+    confidence in typed arrays. Section, group and status each map to a
+    sorted list of positions, so a filtered page is a list intersection
+    plus a slice.
+
+    The snapshot loads lazily on first use. ``refresh_items`` patches rows
+    in place after enrichment writes land. Anything it cannot patch (new or
+    deleted rows) marks the snapshot stale, so the next read reloads it.
+    Every refresh and invalidation bumps a generation counter; a load that
+    overlapped one may have read rows from before the write, so it leaves
+    the snapshot stale instead of losing the refresh.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.RLock()
+        self._stale = True
+        self._generation = 0
+        self._loads = 0
+        self._refreshed_items = 0
+        self._clear()
+
+    def _clear(self) -> None:
+        self._rowids = array("q")
+        self._columns: list = [[] for _ in LIBRARY_ITEM_COLUMNS]
+        # Confidence is numeric; NaN stands in for NULL
+        self._columns[_CONFIDENCE] = array("d")
+        # Entities are mapped from the columns on first read and memoized
+        self._items: list[LibraryItem | None] = []
+        self._positions: dict[str, int] = {}
+        self._by_section: dict[str | None, list[int]] = {}
+        self._by_group: dict[str | None, list[int]] = {}
+        self._by_status: dict[str | None, list[int]] = {}
+
+    @property
+    def loaded(self) -> bool:
+        return not self._stale
+
+    async def ensure_loaded(self) -> None:
+        """Load the snapshot if it has never been loaded or went stale."""
+        if self._stale:
+            await run_blocking(self.load_sync)
+
+    def load_sync(self) -> None:
+        """Rebuild the snapshot from the database."""
+        with self._lock:
+            generation = self._generation
+        rows = execute_query(f"{CATALOG_SELECT} ORDER BY rowid")
+        with self._lock:
+            self._clear()
+            for position, row in enumerate(rows):
+                self._rowids.append(row[0])
+                for index, value in enumerate(row[1:]):
+                    self._columns[index].append(self._store(index, value))
+                self._items.append(None)
+                self._positions[row[1 + _ID]] = position
+                self._by_section.setdefault(row[1 + _SECTION], []).append(position)
+                self._by_group.setdefault(row[1 + _GROUP], []).append(position)
+                self._by_status.setdefault(row[1 + _STATUS], []).append(position)
+            # Serve this snapshot, but reload on the next read if a write
+            # landed while the rows were being read
+            self._stale = self._generation != generation
+            self._loads += 1
+        logger.info(f"Loaded library catalog snapshot with {len(rows)} items")
+
+    def invalidate(self) -> None:
+        """Mark the snapshot stale so the next read reloads it."""
+        with self._lock:
+            self._generation += 1
+            self._stale = True
+
+    def refresh_items(self, hex_ids: Iterable[str]) -> None:
+        """Re-read the given items and patch them into the snapshot.
+
+        Never raises: on failure the snapshot is marked stale instead, since
+        the writes it mirrors have already been committed.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._generation += 1
+            if self._stale:
+                return
+        hex_ids = list(hex_ids)
+        try:
+            rows = []
+            for start in range(0, len(hex_ids), _REFRESH_CHUNK):
+                chunk = hex_ids[start : start + _REFRESH_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
+                rows.extend(
+                    execute_query(
+                        f"{CATALOG_SELECT} WHERE id IN ({placeholders})", tuple(chunk)
+                    )
+                )
+
+            with self._lock:
+                if len(rows) != len(hex_ids):
+                    self._stale = True
+                    return
+                for row in rows:
+                    if not self._patch_row(row):
+                        self._stale = True
+                        return
+                self._refreshed_items += len(rows)
+        except Exception as e:
+            logger.error(f"Failed to refresh library catalog, reloading later: {e}")
+            self._stale = True
+
+    def _patch_row(self, row) -> bool:
+        position = self._positions.get(row[1 + _ID])
+        if position is None or self._rowids[position] != row[0]:
+            return False
+
+        for index, value in enumerate(row[1:]):
+            column = self._columns[index]
+            value = self._store(index, value)
+            previous = column[position]
+            column[position] = value
+            if previous != value:
+                if index == _SECTION:
+                    self._move(self._by_section, previous, value, position)
+                elif index == _GROUP:
+                    self._move(self._by_group, previous, value, position)
+                elif index == _STATUS:
+                    self._move(self._by_status, previous, value, position)
+        self._items[position] = None
+        return True
+
+    @staticmethod
+    def _store(index: int, value):
+        if index == _CONFIDENCE:
+            return _store_confidence(value)
+        if _INTERNED[index]:
+            return _intern(value)
+        return value
+
+    @staticmethod
+    def _move(index: dict[str | None, list[int]], old, new, position: int) -> None:
+        positions = index.get(old)
+        if positions is not None:
+            at = bisect_right(positions, position) - 1
+            if at >= 0 and positions[at] == position:
+                del positions[at]
+            if not positions:
+                del index[old]
+        insort(index.setdefault(new, []), position)
+
+    # Reads (call ensure_loaded first)
+
+    def get_item(self, hex_id: str) -> LibraryItem | None:
+        with self._lock:
+            position = self._positions.get(hex_id)
+            return None if position is None else self._item_at(position)
+
+    def get_rowid(self, hex_id: str) -> int | None:
+        with self._lock:
+            position = self._positions.get(hex_id)
+            return None if position is None else self._rowids[position]
+
+    def find(
+        self,
+        section_name: str | None = None,
+        group_name: str | None = None,
+        status: EnrichmentStatus | None = None,
+        limit: int | None = 50,
+        offset: int = 0,
+        after_rowid: int | None = None,
+    ) -> tuple[list[LibraryItem], int | None]:
+        """Same contract as ``LibraryService.find_items``; ``None`` means no limit."""
+        with self._lock:
+            positions = self._matching(section_name, group_name, status)
+            start = 0
+            if after_rowid is not None:
+                first = bisect_right(self._rowids, after_rowid)
+                start = bisect_right(positions, first - 1)
+            start += offset
+            if limit is None:
+                limit = max(0, len(positions) - start)
+
+            page = positions[start : start + limit + 1]
+            has_more = len(page) > limit
+            page = page[:limit]
+            items = [self._item_at(position) for position in page]
+            next_rowid = self._rowids[page[-1]] if has_more else None
+            return items, next_rowid
+
+    def count(
+        self,
+        section_name: str | None = None,
+        group_name: str | None = None,
+        status: EnrichmentStatus | None = None,
+    ) -> int:
+        with self._lock:
+            return len(self._matching(section_name, group_name, status))
+
+    def status_counts(self) -> dict[str, int]:
+        with self._lock:
+            counts = {status.value: 0 for status in EnrichmentStatus}
+            for status, positions in self._by_status.items():
+                if status is not None:
+                    counts[status] = len(positions)
+            return counts
+
+    def facets(self, filters: dict[str, str | None]) -> dict[str, Any]:
+        """Facet counts, see ``count_facets``."""
+        with self._lock:
+            columns = [
+                self._columns[LIBRARY_ITEM_COLUMNS.index(column)]
+                for column in FACET_COLUMNS.values()
+            ]
+            return count_facets(zip(*columns, repeat(1)), filters)
+
+    def stats(self) -> dict[str, int | bool]:
+        with self._lock:
+            return {
+                "loaded": not self._stale,
+                "total_items": len(self._rowids),
+                "total_sections": sum(1 for key in self._by_section if key),
+                "total_groups": sum(1 for key in self._by_group if key),
+                "loads": self._loads,
+                "refreshed_items": self._refreshed_items,
+            }
+
+    def _matching(
+        self,
+        section_name: str | None,
+        group_name: str | None,
+        status: EnrichmentStatus | None,
+    ) -> list[int] | range:
+        candidates = []
+        if section_name is not None:
+            candidates.append(self._by_section.get(section_name, []))
+        if group_name is not None:
+            candidates.append(self._by_group.get(group_name, []))
+        if status is not None:
+            candidates.append(self._by_status.get(status.value, []))
+
+        if not candidates:
+            return range(len(self._rowids))
+        if len(candidates) == 1:
+            return candidates[0]
+
+        # Walk the smallest list, probing the others as sets
+        candidates.sort(key=len)
+        others = [set(positions) for positions in candidates[1:]]
+        return [
+            position
+            for position in candidates[0]
+            if all(position in other for other in others)
+        ]
+
+    def _item_at(self, position: int) -> LibraryItem:
+        item = self._items[position]
+        if item is None:
+            row = [column[position] for column in self._columns]
+            if math.isnan(row[_CONFIDENCE]):
+                row[_CONFIDENCE] = None
+            item = self._items[position] = row_to_library_item(row)
+        return item
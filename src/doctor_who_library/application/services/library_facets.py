@@ -0,0 +1,146 @@
+"""Faceted counts over the library catalog."""
+
+import threading
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+# Facet name (as used in query parameters and responses) -> column
+FACET_COLUMNS = {
+    "section": "section_name",
+    "group": "group_name",
+    "content_type": "content_type",
+    "doctor": "doctor",
+    "enrichment_status": "enrichment_status",
+}
+
+# One grouped pass; each row carries the number of items it stands for
+FACET_ROWS_SQL = (
+    f"SELECT {', '.join(FACET_COLUMNS.values())}, COUNT(*) FROM library_items "
+    f"GROUP BY {', '.join(FACET_COLUMNS.values())}"
+)
+
+# Distinct non-empty sections and groups, each read off its column index
+DISTINCT_SECTIONS_GROUPS_SQL = (
+    "SELECT "
+    "(SELECT COUNT(DISTINCT section_name) FROM library_items "
+    "WHERE section_name <> ''), "
+    "(SELECT COUNT(DISTINCT group_name) FROM library_items WHERE group_name <> '')"
+)
+
+
+def count_facets(
+    rows: Iterable[Sequence], filters: dict[str, str | None]
+) -> dict[str, Any]:
+    """Count facet values over ``(section, group, content_type, doctor,
+    status, weight)`` rows in a single pass.
+
+    Each facet's counts honour every filter except its own, so the selected
+    section still lists its sibling sections while groups, doctors and so on
+    are conditioned on it. ``total`` honours all filters.
+    """
+    names = list(FACET_COLUMNS)
+    active = [
+        (index, filters[name])
+        for index, name in enumerate(names)
+        if filters.get(name) is not None
+    ]
+    counts: list[Counter[str | None]] = [Counter() for _ in names]
+    total = 0
+
+    for row in rows:
+        weight = row[-1]
+        mismatched = None
+        for index, value in active:
+            if row[index] != value:
+                if mismatched is not None:
+                    break
+                mismatched = index
+        else:
+            if mismatched is None:
+                total += weight
+                for index in range(len(names)):
+                    counts[index][row[index]] += weight
+            else:
+                # Fails only its own filter: counts toward that facet alone
+                counts[mismatched][row[mismatched]] += weight
+
+    return {
+        "total": total,
+        "facets": {name: _ranked(counts[index]) for index, name in enumerate(names)},
+    }
+
+
+def _ranked(counts: Counter[str | None]) -> dict[str, int]:
+    """Non-null values by descending count, ties by value."""
+    entries: list[tuple[int, str]] = [
+        (-count, value) for value, count in counts.items() if value is not None
+    ]
+    entries.sort()
+    return {value: -negated for negated, value in entries}
+
+
+class FacetCache:
+    """Facet results keyed by filter combination, cleared on every write.
+
+    Like ``LibraryItemCache``, readers take ``generation`` before computing
+    and pass it to ``put``, so a result computed across an invalidation
+    (and possibly from pre-write rows) is not stored.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max(0, max_entries)
+        self._entries: dict[tuple, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._generation = 0
+        self._rejected_puts = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation."""
+        return self._generation
+
+    def get(self, key: tuple) -> dict[str, Any] | None:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return result
+
+    def put(
+        self, key: tuple, result: dict[str, Any], generation: int | None = None
+    ) -> None:
+        if self.max_entries == 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                self._rejected_puts += 1
+                return
+            if len(self._entries) >= self.max_entries:
+                # Oldest first: dicts keep insertion order
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = result
+
+    def invalidate(self, hex_ids: Iterable[str] | None = None) -> None:
+        """Drop every cached result; any write can move any facet count."""
+        with self._lock:
+            self._generation += 1
+            if self._entries:
+                self._invalidations += 1
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+                "rejected_puts": self._rejected_puts,
+            }
@@ -0,0 +1,113 @@
+"""In-process read-through cache of mapped library items."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from doctor_who_library.domain.entities.library_item import LibraryItem
+from doctor_who_library.shared.config.settings import CacheSettings
+
+
+class LibraryItemCache:
+    """Bounded LRU cache of ``LibraryItem``s with a per-entry TTL.
+
+    Keys are the 32-character hex IDs used in the database. The TTL only
+    bounds staleness from writes made outside this process; writes made
+    through the application invalidate their entries explicitly.
+
+    Readers take ``generation`` before reading an item and pass it to
+    ``put``; if an invalidation happened in between, what they read may
+    predate the write and is not cached.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 300.0):
+        self.max_size = max(0, max_size)
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, LibraryItem]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._generation = 0
+        self._rejected_puts = 0
+
+    @classmethod
+    def from_settings(cls, config: CacheSettings) -> "LibraryItemCache":
+        return cls(
+            max_size=config.item_cache_size,
+            ttl_seconds=config.item_cache_ttl,
+        )
+
+    def get(self, hex_id: str) -> LibraryItem | None:
+        """Return the cached item, or ``None`` on a miss or expired entry."""
+        with self._lock:
+            entry = self._entries.get(hex_id)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, item = entry
+            if expires_at <= time.monotonic():
+                del self._entries[hex_id]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(hex_id)
+            self._hits += 1
+            return item
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation."""
+        return self._generation
+
+    def put(
+        self, hex_id: str, item: LibraryItem, generation: int | None = None
+    ) -> None:
+        if self.max_size == 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                self._rejected_puts += 1
+                return
+            self._entries[hex_id] = (time.monotonic() + self.ttl_seconds, item)
+            self._entries.move_to_end(hex_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, hex_id: str) -> None:
+        with self._lock:
+            self._generation += 1
+            if self._entries.pop(hex_id, None) is not None:
+                self._invalidations += 1
+
+    def invalidate_many(self, hex_ids: Iterable[str]) -> None:
+        with self._lock:
+            self._generation += 1
+            for hex_id in hex_ids:
+                if self._entries.pop(hex_id, None) is not None:
+                    self._invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "rejected_puts": self._rejected_puts,
+            }
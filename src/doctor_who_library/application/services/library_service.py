@@ -1,13 +1,43 @@
 """Application service for library operations."""
 
+import sqlite3
 from typing import Any
 from uuid import UUID
 
+from doctor_who_library.application.services.library_catalog import LibraryCatalog
+from doctor_who_library.application.services.library_facets import (
+    DISTINCT_SECTIONS_GROUPS_SQL,
+    FACET_ROWS_SQL,
+    FacetCache,
+    count_facets,
+)
+from doctor_who_library.application.services.library_item_cache import LibraryItemCache
+from doctor_who_library.application.services.library_suggest import (
+    SUGGEST_COLUMNS,
+    LibrarySuggestIndex,
+)
 from doctor_who_library.domain.entities.library_item import LibraryItem
 from doctor_who_library.domain.services.section_validation_service import (
     SectionValidationService,
 )
 from doctor_who_library.domain.value_objects.enrichment_status import EnrichmentStatus
+from doctor_who_library.infrastructure.database.library_item_mapper import (
+    LIBRARY_ITEM_COLUMNS,
+    LIBRARY_ITEM_SELECT,
+    columns_for_fields,
+    compile_row_mapper,
+    row_to_library_item,
+    rows_to_library_items,
+)
+from doctor_who_library.infrastructure.database.library_search import (
+    build_fallback_search_sql,
+    build_match_expression,
+    build_search_sql,
+)
+from doctor_who_library.infrastructure.database.library_stats import (
+    get_library_counters,
+)
+from doctor_who_library.shared.database.executor import fetch_all, fetch_one
 from doctor_who_library.shared.exceptions.application import ServiceException
 from doctor_who_library.shared.exceptions.domain import EntityNotFoundException
 
@@ -15,117 +45,51 @@ from doctor_who_library.shared.exceptions.domain import EntityNotFoundException
 class LibraryService:
     """Application service for library operations."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        item_cache: LibraryItemCache | None = None,
+        catalog: LibraryCatalog | None = None,
+        facet_cache: FacetCache | None = None,
+        suggest_index: LibrarySuggestIndex | None = None,
+    ):
         self._section_validator = SectionValidationService()
+        self.item_cache = item_cache
+        self.catalog = catalog
+        self.facet_cache = facet_cache
+        self.suggest_index = suggest_index
+
+    async def _loaded_catalog(self) -> LibraryCatalog | None:
+        """Return the in-memory catalog if enabled, loading it if needed."""
+        if self.catalog is None or not self.catalog.enabled:
+            return None
+        await self.catalog.ensure_loaded()
+        return self.catalog
 
     async def get_item_by_id(self, item_id: UUID) -> LibraryItem:
         """Get a library item by ID."""
         try:
-            from datetime import datetime
-
-            from doctor_who_library.shared.database.connection import execute_query
-
             # Remove dashes from UUID for database lookup
             hex_id = str(item_id).replace("-", "")
 
-            rows = execute_query(
-                "SELECT id, title, story_title, episode_title, serial_title, "
-                "content_type, section_name, group_name, doctor, companions, writer, director, producer, "
-                "story_number, series, format, duration, broadcast_date, release_date, cover_date, "
-                "enrichment_status, enrichment_confidence, enrichment_error, "
-                "wiki_url, wiki_summary, wiki_image_url, wiki_search_term, created_at, updated_at "
-                "FROM library_items WHERE id = ?",
-                (hex_id,),
-            )
+            generation = None
+            if self.item_cache is not None:
+                cached = self.item_cache.get(hex_id)
+                if cached is not None:
+                    return cached
+                generation = self.item_cache.generation
 
-            if not rows:
-                raise EntityNotFoundException("LibraryItem", item_id)
-
-            row = rows[0]
-            (
-                hex_id,
-                title,
-                story_title,
-                episode_title,
-                serial_title,
-                content_type,
-                section_name,
-                group_name,
-                doctor,
-                companions,
-                writer,
-                director,
-                producer,
-                story_number,
-                series,
-                format,
-                duration,
-                broadcast_date,
-                release_date,
-                cover_date,
-                enrichment_status,
-                enrichment_confidence,
-                enrichment_error,
-                wiki_url,
-                wiki_summary,
-                wiki_image_url,
-                wiki_search_term,
-                created_at,
-                updated_at,
-            ) = row
-
-            # Safe enrichment status conversion
-            try:
-                status = (
-                    EnrichmentStatus(enrichment_status)
-                    if enrichment_status
-                    else EnrichmentStatus.PENDING
-                )
-            except ValueError:
-                status = EnrichmentStatus.PENDING
-
-            # Convert date strings to datetime objects if needed
-            def parse_datetime(date_str):
-                if date_str:
-                    try:
-                        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                    except ValueError:
-                        return None
-                return None
-
-            item = LibraryItem(
-                id=item_id,
-                title=title or "Unknown Title",
-                display_title=title,  # Use title as display_title since it doesn't exist in DB
-                story_title=story_title,
-                episode_title=episode_title,
-                serial_title=serial_title,
-                content_type=None,  # ContentType enum handling can be added later
-                section_name=section_name,
-                group_name=group_name,
-                doctor=doctor,
-                companions=companions,
-                writer=writer,
-                director=director,
-                producer=producer,
-                story_number=story_number,
-                series=series,
-                format=format,
-                duration=duration,
-                broadcast_date=parse_datetime(broadcast_date),
-                release_date=parse_datetime(release_date),
-                cover_date=parse_datetime(cover_date),
-                enrichment_status=status,
-                enrichment_confidence=enrichment_confidence or 0.0,
-                enrichment_error=enrichment_error,
-                wiki_url=wiki_url,
-                wiki_summary=wiki_summary,
-                wiki_image_url=wiki_image_url,
-                wiki_search_term=wiki_search_term,
-                created_at=parse_datetime(created_at) or datetime.utcnow(),
-                updated_at=parse_datetime(updated_at) or datetime.utcnow(),
-            )
+            catalog = await self._loaded_catalog()
+            item = catalog.get_item(hex_id) if catalog is not None else None
+
+            if item is None:
+                rows = await fetch_all(f"{LIBRARY_ITEM_SELECT} WHERE id = ?", (hex_id,))
 
+                if not rows:
+                    raise EntityNotFoundException("LibraryItem", item_id)
+
+                item = row_to_library_item(rows[0])
+            if self.item_cache is not None:
+                self.item_cache.put(hex_id, item, generation)
             return item
         except EntityNotFoundException:
             raise
@@ -137,125 +101,89 @@ class LibraryService:
                 cause=e,
             ) from e
 
+    async def get_item_rowid(self, item_id: UUID) -> int | None:
+        """Get the rowid (chronology position) of an item, if it exists."""
+        try:
+            catalog = await self._loaded_catalog()
+            if catalog is not None:
+                return catalog.get_rowid(item_id.hex)
+
+            row = await fetch_one(
+                "SELECT rowid FROM library_items WHERE id = ?", (item_id.hex,)
+            )
+            return row[0] if row is not None else None
+        except Exception as e:
+            raise ServiceException(
+                service_name="LibraryService",
+                operation="get_item_rowid",
+                message=f"Failed to get rowid for item: {item_id}",
+                cause=e,
+            ) from e
+
+    async def get_items_by_ids(self, item_ids: list[UUID]) -> dict[UUID, LibraryItem]:
+        """Resolve many items at once; missing IDs are absent from the result.
+
+        IDs are looked up in the item cache, then the in-memory catalog, and
+        whatever remains is read with one ``IN`` query per 500 IDs.
+        """
+        try:
+            found: dict[UUID, LibraryItem] = {}
+            remaining: dict[str, UUID] = {}
+            generation = (
+                self.item_cache.generation if self.item_cache is not None else None
+            )
+            catalog = await self._loaded_catalog()
+
+            for item_id in dict.fromkeys(item_ids):
+                hex_id = item_id.hex
+                item = None
+                if self.item_cache is not None:
+                    item = self.item_cache.get(hex_id)
+                if item is None and catalog is not None:
+                    item = catalog.get_item(hex_id)
+                if item is None:
+                    remaining[hex_id] = item_id
+                else:
+                    found[item_id] = item
+
+            hex_ids = list(remaining)
+            for start in range(0, len(hex_ids), 500):
+                chunk = hex_ids[start : start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = await fetch_all(
+                    f"{LIBRARY_ITEM_SELECT} WHERE id IN ({placeholders})",
+                    tuple(chunk),
+                )
+                for row in rows:
+                    item = row_to_library_item(row)
+                    found[item.id] = item
+                    if self.item_cache is not None:
+                        self.item_cache.put(item.id.hex, item, generation)
+
+            return found
+        except Exception as e:
+            raise ServiceException(
+                service_name="LibraryService",
+                operation="get_items_by_ids",
+                message=f"Failed to get {len(item_ids)} items by ID",
+                cause=e,
+            ) from e
+
     async def get_all_items(
         self, limit: int | None = None, offset: int = 0
     ) -> list[LibraryItem]:
         """Get all library items with optional pagination."""
         try:
-            from datetime import datetime
-            from uuid import UUID
+            limit = limit if limit is not None else 50
+            catalog = await self._loaded_catalog()
+            if catalog is not None:
+                return catalog.find(limit=limit, offset=offset)[0]
 
-            from doctor_who_library.domain.value_objects.enrichment_status import (
-                EnrichmentStatus,
+            rows = await fetch_all(
+                f"{LIBRARY_ITEM_SELECT} LIMIT ? OFFSET ?", (limit, offset)
             )
-            from doctor_who_library.shared.database.connection import execute_query
-
-            # Get complete data with all fields
-            rows = execute_query(
-                "SELECT id, title, story_title, episode_title, serial_title, "
-                "content_type, section_name, group_name, doctor, companions, writer, director, producer, "
-                "story_number, series, format, duration, broadcast_date, release_date, cover_date, "
-                "enrichment_status, enrichment_confidence, enrichment_error, "
-                "wiki_url, wiki_summary, wiki_image_url, wiki_search_term, created_at, updated_at "
-                "FROM library_items LIMIT ? OFFSET ?",
-                (limit if limit is not None else 50, offset),
-            )
-
-            items = []
-            for row in rows:
-                (
-                    hex_id,
-                    title,
-                    story_title,
-                    episode_title,
-                    serial_title,
-                    content_type,
-                    section_name,
-                    group_name,
-                    doctor,
-                    companions,
-                    writer,
-                    director,
-                    producer,
-                    story_number,
-                    series,
-                    format,
-                    duration,
-                    broadcast_date,
-                    release_date,
-                    cover_date,
-                    enrichment_status,
-                    enrichment_confidence,
-                    enrichment_error,
-                    wiki_url,
-                    wiki_summary,
-                    wiki_image_url,
-                    wiki_search_term,
-                    created_at,
-                    updated_at,
-                ) = row
-
-                # Convert hex ID to UUID
-                formatted_id = f"{hex_id[:8]}-{hex_id[8:12]}-{hex_id[12:16]}-{hex_id[16:20]}-{hex_id[20:]}"
-                uuid_id = UUID(formatted_id)
-
-                # Safe enrichment status conversion
-                try:
-                    status = (
-                        EnrichmentStatus(enrichment_status)
-                        if enrichment_status
-                        else EnrichmentStatus.PENDING
-                    )
-                except ValueError:
-                    status = EnrichmentStatus.PENDING
-
-                # Convert date strings to datetime objects if needed
-                def parse_datetime(date_str):
-                    if date_str:
-                        try:
-                            return datetime.fromisoformat(
-                                date_str.replace("Z", "+00:00")
-                            )
-                        except ValueError:
-                            return None
-                    return None
-
-                item = LibraryItem(
-                    id=uuid_id,
-                    title=title or "Unknown Title",
-                    display_title=title,  # Use title as display_title since it doesn't exist in DB
-                    story_title=story_title,
-                    episode_title=episode_title,
-                    serial_title=serial_title,
-                    content_type=None,  # ContentType enum handling can be added later
-                    section_name=section_name,
-                    group_name=group_name,
-                    doctor=doctor,
-                    companions=companions,
-                    writer=writer,
-                    director=director,
-                    producer=producer,
-                    story_number=story_number,
-                    series=series,
-                    format=format,
-                    duration=duration,
-                    broadcast_date=parse_datetime(broadcast_date),
-                    release_date=parse_datetime(release_date),
-                    cover_date=parse_datetime(cover_date),
-                    enrichment_status=status,
-                    enrichment_confidence=enrichment_confidence or 0.0,
-                    enrichment_error=enrichment_error,
-                    wiki_url=wiki_url,
-                    wiki_summary=wiki_summary,
-                    wiki_image_url=wiki_image_url,
-                    wiki_search_term=wiki_search_term,
-                    created_at=parse_datetime(created_at) or datetime.utcnow(),
-                    updated_at=parse_datetime(updated_at) or datetime.utcnow(),
-                )
-                items.append(item)
-
-            return items
 
+            return rows_to_library_items(rows)
         except Exception as e:
             raise ServiceException(
                 service_name="LibraryService",
@@ -265,13 +193,38 @@ class LibraryService:
             ) from e
 
     async def search_items(
-        self, query: str, limit: int | None = None
+        self,
+        query: str,
+        limit: int | None = None,
+        columns: tuple[str, ...] | None = None,
     ) -> list[LibraryItem]:
-        """Search library items by query."""
+        """Search library items by query, best matches first.
+
+        Uses the FTS5 index maintained by migration 0004 (BM25 ranking with
+        prefix matching on the last word). ``columns`` narrows the select to a
+        subset of the item columns; other fields are left at their defaults.
+        """
         try:
-            # TODO: Implement search functionality with direct database queries
-            # For now, return empty list
-            return []
+            match = build_match_expression(query)
+            if match is None:
+                return []
+
+            limit = limit if limit is not None else 50
+            columns = columns or LIBRARY_ITEM_COLUMNS
+
+            try:
+                rows = await fetch_all(build_search_sql(columns), (match, limit))
+            except sqlite3.OperationalError as e:
+                # Database not migrated to 0004 yet (e.g. CLI before first serve)
+                if "no such table" not in str(e):
+                    raise
+                pattern = f"%{query.strip()}%"
+                rows = await fetch_all(
+                    build_fallback_search_sql(columns), (pattern,) * 4 + (limit,)
+                )
+
+            map_row = compile_row_mapper(columns)
+            return [map_row(row) for row in rows]
         except Exception as e:
             raise ServiceException(
                 service_name="LibraryService",
@@ -280,6 +233,35 @@ class LibraryService:
                 cause=e,
             ) from e
 
+    async def suggest(self, query: str, limit: int = 8) -> list[dict[str, Any]]:
+        """Autocomplete suggestions for a partially typed title.
+
+        Served from the in-memory prefix index; without one, falls back to
+        full-text search.
+        """
+        try:
+            if self.suggest_index is not None:
+                await self.suggest_index.ensure_loaded()
+                return self.suggest_index.suggest(query, limit)
+
+            columns = columns_for_fields(SUGGEST_COLUMNS)
+            items = await self.search_items(query, limit=limit, columns=columns)
+            return [
+                {
+                    **{column: getattr(item, column) for column in SUGGEST_COLUMNS},
+                    "matched_field": "title",
+                    "matched": item.title,
+                }
+                for item in items
+            ]
+        except Exception as e:
+            raise ServiceException(
+                service_name="LibraryService",
+                operation="suggest",
+                message=f"Failed to get suggestions: {query}",
+                cause=e,
+            ) from e
+
     async def get_items_by_section(self, section_name: str) -> list[LibraryItem]:
         """Get items by section name."""
         try:
@@ -288,116 +270,16 @@ class LibraryService:
                 section_name
             )
 
-            from datetime import datetime
-            from uuid import UUID
+            catalog = await self._loaded_catalog()
+            if catalog is not None:
+                return catalog.find(section_name=validated_section, limit=None)[0]
 
-            from doctor_who_library.shared.database.connection import execute_query
-
-            # Get complete data filtered by section
-            rows = execute_query(
-                "SELECT id, title, story_title, episode_title, serial_title, "
-                "content_type, section_name, group_name, doctor, companions, writer, director, producer, "
-                "story_number, series, format, duration, broadcast_date, release_date, cover_date, "
-                "enrichment_status, enrichment_confidence, enrichment_error, "
-                "wiki_url, wiki_summary, wiki_image_url, wiki_search_term, created_at, updated_at "
-                "FROM library_items WHERE section_name = ?",
+            rows = await fetch_all(
+                f"{LIBRARY_ITEM_SELECT} WHERE section_name = ?",
                 (validated_section,),
             )
 
-            items = []
-            for row in rows:
-                (
-                    hex_id,
-                    title,
-                    story_title,
-                    episode_title,
-                    serial_title,
-                    content_type,
-                    section_name,
-                    group_name,
-                    doctor,
-                    companions,
-                    writer,
-                    director,
-                    producer,
-                    story_number,
-                    series,
-                    format,
-                    duration,
-                    broadcast_date,
-                    release_date,
-                    cover_date,
-                    enrichment_status,
-                    enrichment_confidence,
-                    enrichment_error,
-                    wiki_url,
-                    wiki_summary,
-                    wiki_image_url,
-                    wiki_search_term,
-                    created_at,
-                    updated_at,
-                ) = row
-
-                # Convert hex ID to UUID
-                formatted_id = f"{hex_id[:8]}-{hex_id[8:12]}-{hex_id[12:16]}-{hex_id[16:20]}-{hex_id[20:]}"
-                uuid_id = UUID(formatted_id)
-
-                # Safe enrichment status conversion
-                try:
-                    status = (
-                        EnrichmentStatus(enrichment_status)
-                        if enrichment_status
-                        else EnrichmentStatus.PENDING
-                    )
-                except ValueError:
-                    status = EnrichmentStatus.PENDING
-
-                # Convert date strings to datetime objects if needed
-                def parse_datetime(date_str):
-                    if date_str:
-                        try:
-                            return datetime.fromisoformat(
-                                date_str.replace("Z", "+00:00")
-                            )
-                        except ValueError:
-                            return None
-                    return None
-
-                item = LibraryItem(
-                    id=uuid_id,
-                    title=title or "Unknown Title",
-                    display_title=title,  # Use title as display_title since it doesn't exist in DB
-                    story_title=story_title,
-                    episode_title=episode_title,
-                    serial_title=serial_title,
-                    content_type=None,  # ContentType enum handling can be added later
-                    section_name=section_name,
-                    group_name=group_name,
-                    doctor=doctor,
-                    companions=companions,
-                    writer=writer,
-                    director=director,
-                    producer=producer,
-                    story_number=story_number,
-                    series=series,
-                    format=format,
-                    duration=duration,
-                    broadcast_date=parse_datetime(broadcast_date),
-                    release_date=parse_datetime(release_date),
-                    cover_date=parse_datetime(cover_date),
-                    enrichment_status=status,
-                    enrichment_confidence=enrichment_confidence or 0.0,
-                    enrichment_error=enrichment_error,
-                    wiki_url=wiki_url,
-                    wiki_summary=wiki_summary,
-                    wiki_image_url=wiki_image_url,
-                    wiki_search_term=wiki_search_term,
-                    created_at=parse_datetime(created_at) or datetime.utcnow(),
-                    updated_at=parse_datetime(updated_at) or datetime.utcnow(),
-                )
-                items.append(item)
-
-            return items
+            return rows_to_library_items(rows)
         except ValueError as e:
             # Section validation error
             raise ServiceException(
@@ -417,9 +299,15 @@ class LibraryService:
     async def get_items_by_group(self, group_name: str) -> list[LibraryItem]:
         """Get items by group name."""
         try:
-            # TODO: Implement group filtering with direct database queries
-            # For now, return empty list
-            return []
+            catalog = await self._loaded_catalog()
+            if catalog is not None:
+                return catalog.find(group_name=group_name, limit=None)[0]
+
+            rows = await fetch_all(
+                f"{LIBRARY_ITEM_SELECT} WHERE group_name = ?", (group_name,)
+            )
+
+            return rows_to_library_items(rows)
         except Exception as e:
             raise ServiceException(
                 service_name="LibraryService",
@@ -431,106 +319,16 @@ class LibraryService:
     async def get_items_by_status(self, status: EnrichmentStatus) -> list[LibraryItem]:
         """Get items by enrichment status."""
         try:
-            from datetime import datetime
-            from uuid import UUID
-
-            from doctor_who_library.shared.database.connection import execute_query
-
-            # Get complete data filtered by status
-            rows = execute_query(
-                "SELECT id, title, story_title, episode_title, serial_title, "
-                "content_type, section_name, group_name, doctor, companions, writer, director, producer, "
-                "story_number, series, format, duration, broadcast_date, release_date, cover_date, "
-                "enrichment_status, enrichment_confidence, enrichment_error, "
-                "wiki_url, wiki_summary, wiki_image_url, wiki_search_term, created_at, updated_at "
-                "FROM library_items WHERE enrichment_status = ?",
+            catalog = await self._loaded_catalog()
+            if catalog is not None:
+                return catalog.find(status=status, limit=None)[0]
+
+            rows = await fetch_all(
+                f"{LIBRARY_ITEM_SELECT} WHERE enrichment_status = ?",
                 (status.value,),
             )
 
-            items = []
-            for row in rows:
-                (
-                    hex_id,
-                    title,
-                    story_title,
-                    episode_title,
-                    serial_title,
-                    content_type,
-                    section_name,
-                    group_name,
-                    doctor,
-                    companions,
-                    writer,
-                    director,
-                    producer,
-                    story_number,
-                    series,
-                    format,
-                    duration,
-                    broadcast_date,
-                    release_date,
-                    cover_date,
-                    enrichment_status,
-                    enrichment_confidence,
-                    enrichment_error,
-                    wiki_url,
-                    wiki_summary,
-                    wiki_image_url,
-                    wiki_search_term,
-                    created_at,
-                    updated_at,
-                ) = row
-
-                # Convert hex ID to UUID
-                formatted_id = f"{hex_id[:8]}-{hex_id[8:12]}-{hex_id[12:16]}-{hex_id[16:20]}-{hex_id[20:]}"
-                uuid_id = UUID(formatted_id)
-
-                # Convert date strings to datetime objects if needed
-                def parse_datetime(date_str):
-                    if date_str:
-                        try:
-                            return datetime.fromisoformat(
-                                date_str.replace("Z", "+00:00")
-                            )
-                        except ValueError:
-                            return None
-                    return None
-
-                item = LibraryItem(
-                    id=uuid_id,
-                    title=title or "Unknown Title",
-                    display_title=title,  # Use title as display_title since it doesn't exist in DB
-                    story_title=story_title,
-                    episode_title=episode_title,
-                    serial_title=serial_title,
-                    content_type=None,  # ContentType enum handling can be added later
-                    section_name=section_name,
-                    group_name=group_name,
-                    doctor=doctor,
-                    companions=companions,
-                    writer=writer,
-                    director=director,
-                    producer=producer,
-                    story_number=story_number,
-                    series=series,
-                    format=format,
-                    duration=duration,
-                    broadcast_date=parse_datetime(broadcast_date),
-                    release_date=parse_datetime(release_date),
-                    cover_date=parse_datetime(cover_date),
-                    enrichment_status=status,  # Use the input status directly
-                    enrichment_confidence=enrichment_confidence or 0.0,
-                    enrichment_error=enrichment_error,
-                    wiki_url=wiki_url,
-                    wiki_summary=wiki_summary,
-                    wiki_image_url=wiki_image_url,
-                    wiki_search_term=wiki_search_term,
-                    created_at=parse_datetime(created_at) or datetime.utcnow(),
-                    updated_at=parse_datetime(updated_at) or datetime.utcnow(),
-                )
-                items.append(item)
-
-            return items
+            return rows_to_library_items(rows)
         except Exception as e:
             raise ServiceException(
                 service_name="LibraryService",
@@ -539,13 +337,203 @@ class LibraryService:
                 cause=e,
             ) from e
 
+    async def find_items(
+        self,
+        section_name: str | None = None,
+        group_name: str | None = None,
+        status: EnrichmentStatus | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        after_rowid: int | None = None,
+        columns: tuple[str, ...] | None = None,
+    ) -> tuple[list[LibraryItem], int | None]:
+        """Get one page of items matching all of the given filters.
+
+        Items come in chronology (rowid) order. Pass ``after_rowid`` to page
+        by key instead of offset. Returns the page and the rowid of its last
+        item when more items follow, else ``None``. ``columns`` narrows the
+        database read to a subset of the item columns; the in-memory catalog
+        always returns complete items.
+        """
+        try:
+            limit = limit if limit is not None else 50
+            catalog = await self._loaded_catalog()
+            if catalog is not None:
+                if section_name is not None:
+                    section_name = self._section_validator.validate_section_name(
+                        section_name
+                    )
+                return catalog.find(
+                    section_name, group_name, status, limit, offset, after_rowid
+                )
+
+            columns = columns or LIBRARY_ITEM_COLUMNS
+            where, params = self._build_filters(
+                section_name, group_name, status, after_rowid
+            )
+            rows = await fetch_all(
+                f"SELECT rowid, {', '.join(columns)} FROM library_items"
+                f"{where} ORDER BY rowid LIMIT ? OFFSET ?",
+                (*params, limit + 1, offset),
+            )
+
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            map_row = compile_row_mapper(columns)
+            items = [map_row(row[1:]) for row in rows]
+            return items, rows[-1][0] if has_more else None
+        except ValueError as e:
+            # Section validation error
+            raise ServiceException(
+                service_name="LibraryService",
+                operation="find_items",
+                message=str(e),
+                cause=e,
+            ) from e
+        except Exception as e:
+            raise ServiceException(
+                service_name="LibraryService",
+                operation="find_items",
+                message="Failed to find library items",
+                cause=e,
+            ) from e
+
+    async def count_items(
+        self,
+        section_name: str | None = None,
+        group_name: str | None = None,
+        status: EnrichmentStatus | None = None,
+    ) -> int:
+        """Count items matching all of the given filters."""
+        try:
+            catalog = await self._loaded_catalog()
+            if catalog is not None:
+                if section_name is not None:
+                    section_name = self._section_validator.validate_section_name(
+                        section_name
+                    )
+                return catalog.count(section_name, group_name, status)
+
+            if section_name is None and group_name is None:
+                # Unfiltered and status-only counts are materialized
+                counters = await get_library_counters()
+                if status is None:
+                    return counters["total_items"]
+                return counters["status_counts"].get(status.value, 0)
+
+            where, params = self._build_filters(section_name, group_name, status)
+            rows = await fetch_all(f"SELECT COUNT(*) FROM library_items{where}", params)
+            return rows[0][0]
+        except ValueError as e:
+            raise ServiceException(
+                service_name="LibraryService",
+                operation="count_items",
+                message=str(e),
+                cause=e,
+            ) from e
+        except Exception as e:
+            raise ServiceException(
+                service_name="LibraryService",
+                operation="count_items",
+                message="Failed to count library items",
+                cause=e,
+            ) from e
+
+    def _build_filters(
+        self,
+        section_name: str | None,
+        group_name: str | None,
+        status: EnrichmentStatus | None,
+        after_rowid: int | None = None,
+    ) -> tuple[str, tuple]:
+        """Build a WHERE clause (with leading space) and its parameters."""
+        conditions = []
+        params: list[Any] = []
+        if section_name is not None:
+            conditions.append("section_name = ?")
+            params.append(self._section_validator.validate_section_name(section_name))
+        if group_name is not None:
+            conditions.append("group_name = ?")
+            params.append(group_name)
+        if status is not None:
+            conditions.append("enrichment_status = ?")
+            params.append(status.value)
+        if after_rowid is not None:
+            conditions.append("rowid > ?")
+            params.append(after_rowid)
+
+        if not conditions:
+            return "", ()
+        return " WHERE " + " AND ".join(conditions), tuple(params)
+
+    async def get_facets(
+        self,
+        section_name: str | None = None,
+        group_name: str | None = None,
+        status: EnrichmentStatus | None = None,
+        content_type: str | None = None,
+        doctor: str | None = None,
+    ) -> dict[str, Any]:
+        """Get item counts per section, group, content type, doctor and status.
+
+        Each facet is conditioned on every filter except its own; ``total``
+        honours them all. Results are cached until the next write.
+        """
+        try:
+            if section_name is not None:
+                section_name = self._section_validator.validate_section_name(
+                    section_name
+                )
+            filters = {
+                "section": section_name,
+                "group": group_name,
+                "content_type": content_type,
+                "doctor": doctor,
+                "enrichment_status": status.value if status is not None else None,
+            }
+            key = tuple(filters.values())
+
+            generation = None
+            if self.facet_cache is not None:
+                cached = self.facet_cache.get(key)
+                if cached is not None:
+                    return cached
+                generation = self.facet_cache.generation
+
+            catalog = await self._loaded_catalog()
+            if catalog is not None:
+                result = catalog.facets(filters)
+            else:
+                result = count_facets(await fetch_all(FACET_ROWS_SQL), filters)
+
+            if self.facet_cache is not None:
+                self.facet_cache.put(key, result, generation)
+            return result
+        except ValueError as e:
+            # Section validation error
+            raise ServiceException(
+                service_name="LibraryService",
+                operation="get_facets",
+                message=str(e),
+                cause=e,
+            ) from e
+        except Exception as e:
+            raise ServiceException(
+                service_name="LibraryService",
+                operation="get_facets",
+                message="Failed to get facet counts",
+                cause=e,
+            ) from e
+
     async def get_total_count(self) -> int:
         """Get total count of library items."""
         try:
-            from doctor_who_library.shared.database.connection import execute_query
+            catalog = await self._loaded_catalog()
+            if catalog is not None:
+                return catalog.count()
 
-            total_result = execute_query("SELECT COUNT(*) FROM library_items")
-            return total_result[0][0]
+            counters = await get_library_counters()
+            return counters["total_items"]
         except Exception as e:
             raise ServiceException(
                 service_name="LibraryService",
@@ -559,28 +547,25 @@ class LibraryService:
     async def get_library_stats(self) -> dict[str, Any]:
         """Get library statistics."""
         try:
-            from doctor_who_library.domain.value_objects.enrichment_status import (
-                EnrichmentStatus,
-            )
-            from doctor_who_library.shared.database.connection import execute_query
-
-            # Get total count
-            total_result = execute_query("SELECT COUNT(*) FROM library_items")
-            total_count = total_result[0][0]
-
-            # Get enrichment stats
-            enrichment_stats = {}
-            for status in EnrichmentStatus:
-                count_result = execute_query(
-                    "SELECT COUNT(*) FROM library_items WHERE enrichment_status = ?",
-                    (status.value,),
-                )
-                enrichment_stats[status.value] = count_result[0][0]
+            catalog = await self._loaded_catalog()
+            if catalog is not None:
+                catalog_stats = catalog.stats()
+                total_count = catalog_stats["total_items"]
+                enrichment_stats = catalog.status_counts()
+                total_sections = catalog_stats["total_sections"]
+                total_groups = catalog_stats["total_groups"]
+            else:
+                # Read the trigger-maintained counters instead of scanning
+                counters = await get_library_counters()
+                total_count = counters["total_items"]
+                enrichment_stats = counters["status_counts"]
+                rows = await fetch_all(DISTINCT_SECTIONS_GROUPS_SQL)
+                total_sections, total_groups = rows[0]
 
             stats = {
                 "total_items": total_count,
-                "total_sections": 0,  # Placeholder
-                "total_groups": 0,  # Placeholder
+                "total_sections": total_sections,
+                "total_groups": total_groups,
                 "enrichment_stats": enrichment_stats,
                 "note": f"Doctor Who Library contains {total_count} items",
             }
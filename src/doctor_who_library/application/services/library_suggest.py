@@ -0,0 +1,319 @@
+"""In-memory prefix index for search-as-you-type suggestions."""
+
+import heapq
+import re
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from typing import Any
+from uuid import UUID
+
+from structlog import get_logger
+
+from doctor_who_library.shared.database.connection import execute_query
+from doctor_who_library.shared.database.executor import run_blocking
+
+logger = get_logger()
+
+SUGGEST_COLUMNS = (
+    "id",
+    "title",
+    "story_title",
+    "episode_title",
+    "serial_title",
+    "content_type",
+    "section_name",
+    "doctor",
+)
+
+# Fields whose prefixes are indexed, in tie-break order
+SUGGEST_FIELDS = ("title", "story_title", "serial_title")
+
+SUGGEST_SELECT = f"SELECT rowid, {', '.join(SUGGEST_COLUMNS)} FROM library_items"
+
+# Inner words that never start a suggestion ("of" in "Genesis of the Daleks")
+STOP_WORDS = frozenset({"a", "an", "and", "in", "of", "on", "the", "to"})
+
+# Match tiers: whole field, start of field, start of a later word
+EXACT, FIELD_START, WORD_START = 0, 1, 2
+
+# Prefixes up to this length keep a precomputed top-K, since they match the
+# most keys; longer ones are answered by walking the (short) key range
+SHORT_PREFIX_LENGTH = 3
+MAX_SUGGESTIONS = 50
+
+# Sorts after every normalized key sharing a prefix
+_PREFIX_END = "\U0010ffff"
+_NON_WORD = re.compile(r"[\W_]+")
+_FIELD_INDEXES = tuple(SUGGEST_COLUMNS.index(field) for field in SUGGEST_FIELDS)
+_STORY, _SERIAL, _TITLE = (
+    SUGGEST_COLUMNS.index(field) for field in ("story_title", "serial_title", "title")
+)
+
+# SQLite's default limit on host parameters is 999
+_REFRESH_CHUNK = 500
+
+
+def normalize_title(value: str | None) -> str:
+    """Casefold, strip accents and punctuation, collapse whitespace."""
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(_NON_WORD.sub(" ", stripped.casefold()).split())
+
+
+def _word_starts(text: str) -> Iterable[str]:
+    """Suffixes of ``text`` starting at the field start or a non-stop word."""
+    yield text
+    words = text.split(" ")
+    offset = len(words[0]) + 1
+    for word in words[1:]:
+        if word not in STOP_WORDS:
+            yield text[offset:]
+        offset += len(word) + 1
+
+
+class LibrarySuggestIndex:
+    """Sorted prefix index over normalized title, story and serial titles.
+
+    Every field start and every later non-stop word start is a key in one
+    sorted list, so a prefix lookup is two bisections plus a walk over the
+    matching keys. Candidates rank by match tier, then popularity (how many
+    items share the story), then chronology (rowid).
+
+    Short prefixes match a large share of the keys, so their best
+    ``MAX_SUGGESTIONS`` are precomputed. Queries never touch SQLite: the
+    index loads once, and ``refresh_items`` re-reads only the items a write
+    touched, updating their keys and the affected short-prefix lists in place.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._stale = True
+        # Bumped by every refresh and invalidation, see load_sync
+        self._generation = 0
+        self._loads = 0
+        self._refreshed_items = 0
+        self._queries = 0
+        self._clear()
+
+    def _clear(self) -> None:
+        # hex id -> (rowid, row, story key, keys contributed)
+        self._entries: dict[str, tuple[int, tuple, str, tuple]] = {}
+        self._keys: list[str] = []
+        # key -> {(hex id, field index, tier)}
+        self._postings: dict[str, set[tuple[str, int, int]]] = {}
+        # story key -> hex ids; popularity is the size of the set
+        self._stories: dict[str, set[str]] = {}
+        # short prefix -> best (hex id, matched field index), best first
+        self._top: dict[str, list[tuple[str, int]]] = {}
+
+    @property
+    def loaded(self) -> bool:
+        return not self._stale
+
+    async def ensure_loaded(self) -> None:
+        """Load the index if it has never been loaded or went stale."""
+        if self._stale:
+            await run_blocking(self.load_sync)
+
+    def load_sync(self) -> None:
+        """Rebuild the index from the database."""
+        with self._lock:
+            generation = self._generation
+        rows = execute_query(SUGGEST_SELECT)
+        with self._lock:
+            self._clear()
+            for row in rows:
+                self._add(row[1], row[0], tuple(row[1:]))
+            self._keys = sorted(self._postings)
+            self._rebuild_top(
+                {
+                    key[:length]
+                    for key in self._keys
+                    for length in range(1, SHORT_PREFIX_LENGTH + 1)
+                }
+            )
+            # A refresh that landed while reading may be missing from rows;
+            # serve this index but rebuild it on the next query
+            self._stale = self._generation != generation
+            self._loads += 1
+        logger.info(f"Built suggestion index with {len(self._keys)} keys")
+
+    def invalidate(self) -> None:
+        """Mark the index stale so the next query rebuilds it."""
+        with self._lock:
+            self._generation += 1
+            self._stale = True
+
+    def refresh_items(self, hex_ids: Iterable[str]) -> None:
+        """Re-read the given items and update their keys in place.
+
+        Items no longer in the database are dropped and unseen ones added.
+        Never raises: on failure the index is marked stale instead.
+        """
+        with self._lock:
+            self._generation += 1
+            if self._stale:
+                return
+        hex_ids = list(hex_ids)
+        try:
+            rows = {}
+            for start in range(0, len(hex_ids), _REFRESH_CHUNK):
+                chunk = hex_ids[start : start + _REFRESH_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
+                for row in execute_query(
+                    f"{SUGGEST_SELECT} WHERE id IN ({placeholders})", tuple(chunk)
+                ):
+                    rows[row[1]] = row
+
+            with self._lock:
+                # Items whose keys or popularity change, before and after
+                affected: set[str] = set()
+                changed = []
+                for hex_id in hex_ids:
+                    row = rows.get(hex_id)
+                    previous = self._entries.get(hex_id)
+                    if row is not None and previous is not None:
+                        if previous[0] == row[0] and previous[1] == tuple(row[1:]):
+                            continue
+                    if previous is not None:
+                        affected.update(self._stories[previous[2]])
+                    changed.append((hex_id, row))
+
+                prefixes = self._short_prefixes(affected)
+                for hex_id, row in changed:
+                    if hex_id in self._entries:
+                        self._remove(hex_id, index_keys=True)
+                    if row is not None:
+                        self._add(hex_id, row[0], tuple(row[1:]), index_keys=True)
+                        affected.update(self._stories[self._entries[hex_id][2]])
+                prefixes |= self._short_prefixes(affected)
+
+                self._rebuild_top(prefixes)
+                self._refreshed_items += len(hex_ids)
+        except Exception as e:
+            logger.error(f"Failed to refresh suggestion index, rebuilding later: {e}")
+            self._stale = True
+
+    def _add(self, hex_id: str, rowid: int, row: tuple, index_keys: bool = False):
+        keys = []
+        for field_index in _FIELD_INDEXES:
+            text = normalize_title(row[field_index])
+            if not text:
+                continue
+            for tier, key in enumerate(_word_starts(text), start=FIELD_START):
+                tier = min(tier, WORD_START)
+                posting = (hex_id, field_index, tier)
+                postings = self._postings.get(key)
+                if postings is None:
+                    postings = self._postings[key] = set()
+                    if index_keys:
+                        insort(self._keys, key)
+                postings.add(posting)
+                keys.append((key, posting))
+
+        story = self._story_key(row)
+        self._stories.setdefault(story, set()).add(hex_id)
+        self._entries[hex_id] = (rowid, row, story, tuple(keys))
+
+    def _remove(self, hex_id: str, index_keys: bool = False) -> None:
+        _, _, story, keys = self._entries.pop(hex_id)
+        for key, posting in keys:
+            postings = self._postings[key]
+            postings.discard(posting)
+            if not postings:
+                del self._postings[key]
+                if index_keys:
+                    del self._keys[bisect_left(self._keys, key)]
+        members = self._stories[story]
+        members.discard(hex_id)
+        if not members:
+            del self._stories[story]
+
+    @staticmethod
+    def _story_key(row: tuple) -> str:
+        return normalize_title(row[_STORY] or row[_SERIAL] or row[_TITLE])
+
+    def _short_prefixes(self, hex_ids: Iterable[str]) -> set[str]:
+        return {
+            key[:length]
+            for hex_id in hex_ids
+            if hex_id in self._entries
+            for key, _ in self._entries[hex_id][3]
+            for length in range(1, SHORT_PREFIX_LENGTH + 1)
+        }
+
+    def _rebuild_top(self, prefixes: Iterable[str]) -> None:
+        for prefix in prefixes:
+            top = self._rank(prefix, MAX_SUGGESTIONS)
+            if top:
+                self._top[prefix] = top
+            else:
+                self._top.pop(prefix, None)
+
+    def _rank(self, prefix: str, limit: int) -> list[tuple[str, int]]:
+        """Best ``(hex id, matched field index)`` pairs for ``prefix``."""
+        # Best (tier, field) per item across every matching key
+        best: dict[str, tuple[int, int]] = {}
+        keys = self._keys
+        start = bisect_left(keys, prefix)
+        end = bisect_left(keys, prefix + _PREFIX_END, start)
+        for key in keys[start:end]:
+            exact = key == prefix
+            for hex_id, field_index, tier in self._postings[key]:
+                if exact and tier == FIELD_START:
+                    tier = EXACT
+                match = (tier, field_index)
+                current = best.get(hex_id)
+                if current is None or match < current:
+                    best[hex_id] = match
+
+        entries = self._entries
+        stories = self._stories
+
+        def rank(hex_id: str) -> tuple:
+            rowid, _, story, _ = entries[hex_id]
+            return best[hex_id][0], -len(stories[story]), rowid
+
+        return [
+            (hex_id, best[hex_id][1])
+            for hex_id in heapq.nsmallest(limit, best, key=rank)
+        ]
+
+    def suggest(self, query: str, limit: int = 8) -> list[dict[str, Any]]:
+        """Best ``limit`` items whose indexed titles have a word starting with
+        ``query`` (call ``ensure_loaded`` first)."""
+        prefix = normalize_title(query)
+        if not prefix or limit < 1:
+            return []
+
+        with self._lock:
+            self._queries += 1
+            if len(prefix) <= SHORT_PREFIX_LENGTH and limit <= MAX_SUGGESTIONS:
+                top = self._top.get(prefix, [])[:limit]
+            else:
+                top = self._rank(prefix, limit)
+            return [self._suggestion(hex_id, field) for hex_id, field in top]
+
+    def _suggestion(self, hex_id: str, field_index: int) -> dict[str, Any]:
+        row = self._entries[hex_id][1]
+        suggestion = dict(zip(SUGGEST_COLUMNS, row, strict=True))
+        suggestion["id"] = UUID(hex=hex_id)
+        suggestion["matched_field"] = SUGGEST_COLUMNS[field_index]
+        suggestion["matched"] = row[field_index]
+        return suggestion
+
+    def stats(self) -> dict[str, int | bool]:
+        with self._lock:
+            return {
+                "loaded": not self._stale,
+                "total_items": len(self._entries),
+                "total_keys": len(self._keys),
+                "short_prefixes": len(self._top),
+                "queries": self._queries,
+                "loads": self._loads,
+                "refreshed_items": self._refreshed_items,
+            }
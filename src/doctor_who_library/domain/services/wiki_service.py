@@ -48,6 +48,10 @@ class WikiService(ABC):
         """Enrich a library item with wiki data."""
         pass
 
+    async def wait_until_available(self) -> None:
+        """Wait until the wiki can be queried again after an outage."""
+        return None
+
     @abstractmethod
     async def enrich_items(self, items: list[LibraryItem]) -> list[LibraryItem]:
         """Enrich multiple library items with wiki data."""
@@ -0,0 +1,194 @@
+"""Mapping of ``library_items`` rows to ``LibraryItem`` entities.
+
+Everything that does not depend on the row (column list, SELECT prefix,
+enum lookup tables) is built once at import time, so mapping a row is a
+single tuple unpack plus dictionary lookups.
+"""
+
+from collections.abc import Callable, Iterable, Sequence
+from datetime import datetime
+from functools import lru_cache
+from uuid import UUID
+
+from doctor_who_library.domain.entities.library_item import LibraryItem
+from doctor_who_library.domain.value_objects.content_type import ContentType
+from doctor_who_library.domain.value_objects.enrichment_status import EnrichmentStatus
+
+LIBRARY_ITEM_COLUMNS = (
+    "id",
+    "title",
+    "story_title",
+    "episode_title",
+    "serial_title",
+    "content_type",
+    "section_name",
+    "group_name",
+    "doctor",
+    "companions",
+    "writer",
+    "director",
+    "producer",
+    "story_number",
+    "series",
+    "format",
+    "duration",
+    "broadcast_date",
+    "release_date",
+    "cover_date",
+    "enrichment_status",
+    "enrichment_confidence",
+    "enrichment_error",
+    "wiki_url",
+    "wiki_summary",
+    "wiki_image_url",
+    "wiki_search_term",
+    "created_at",
+    "updated_at",
+)
+
+LIBRARY_ITEM_SELECT = f"SELECT {', '.join(LIBRARY_ITEM_COLUMNS)} FROM library_items"
+
+# Unknown or missing values fall back to PENDING / None, as before
+_ENRICHMENT_STATUSES = {status.value: status for status in EnrichmentStatus}
+_CONTENT_TYPES = {content_type.value: content_type for content_type in ContentType}
+
+_fromisoformat = datetime.fromisoformat
+
+
+def parse_timestamp(value: str | None) -> datetime | None:
+    """Parse an ISO-8601 / SQLite ``datetime()`` string, or return ``None``."""
+    if not value:
+        return None
+    try:
+        # Python 3.11 accepts a trailing "Z" and the space separator natively
+        return _fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def row_to_library_item(row: Sequence) -> LibraryItem:
+    """Build a ``LibraryItem`` from a row selected with ``LIBRARY_ITEM_COLUMNS``."""
+    (
+        hex_id,
+        title,
+        story_title,
+        episode_title,
+        serial_title,
+        content_type,
+        section_name,
+        group_name,
+        doctor,
+        companions,
+        writer,
+        director,
+        producer,
+        story_number,
+        series,
+        format,
+        duration,
+        broadcast_date,
+        release_date,
+        cover_date,
+        enrichment_status,
+        enrichment_confidence,
+        enrichment_error,
+        wiki_url,
+        wiki_summary,
+        wiki_image_url,
+        wiki_search_term,
+        created_at,
+        updated_at,
+    ) = row
+
+    return LibraryItem(
+        id=UUID(hex=hex_id),
+        title=title or "Unknown Title",
+        display_title=title,  # Use title as display_title since it doesn't exist in DB
+        story_title=story_title,
+        episode_title=episode_title,
+        serial_title=serial_title,
+        content_type=_CONTENT_TYPES.get(content_type),
+        section_name=section_name,
+        group_name=group_name,
+        doctor=doctor,
+        companions=companions,
+        writer=writer,
+        director=director,
+        producer=producer,
+        story_number=story_number,
+        series=series,
+        format=format,
+        duration=duration,
+        broadcast_date=parse_timestamp(broadcast_date),
+        release_date=parse_timestamp(release_date),
+        cover_date=parse_timestamp(cover_date),
+        enrichment_status=_ENRICHMENT_STATUSES.get(
+            enrichment_status, EnrichmentStatus.PENDING
+        ),
+        enrichment_confidence=enrichment_confidence or 0.0,
+        enrichment_error=enrichment_error,
+        wiki_url=wiki_url,
+        wiki_summary=wiki_summary,
+        wiki_image_url=wiki_image_url,
+        wiki_search_term=wiki_search_term,
+        created_at=parse_timestamp(created_at) or datetime.utcnow(),
+        updated_at=parse_timestamp(updated_at) or datetime.utcnow(),
+    )
+
+
+def rows_to_library_items(rows: Iterable[Sequence]) -> list[LibraryItem]:
+    """Map a batch of rows selected with ``LIBRARY_ITEM_COLUMNS``."""
+    return [row_to_library_item(row) for row in rows]
+
+
+# Per-column conversions shared by partial-row mappers
+_CONVERTERS: dict[str, Callable] = {
+    "id": lambda value: UUID(hex=value),
+    "title": lambda value: value or "Unknown Title",
+    "content_type": _CONTENT_TYPES.get,
+    "broadcast_date": parse_timestamp,
+    "release_date": parse_timestamp,
+    "cover_date": parse_timestamp,
+    "enrichment_status": lambda value: _ENRICHMENT_STATUSES.get(
+        value, EnrichmentStatus.PENDING
+    ),
+    "enrichment_confidence": lambda value: value or 0.0,
+    "created_at": lambda value: parse_timestamp(value) or datetime.utcnow(),
+    "updated_at": lambda value: parse_timestamp(value) or datetime.utcnow(),
+}
+
+
+def columns_for_fields(fields: Iterable[str]) -> tuple[str, ...]:
+    """Columns needed to populate the given ``LibraryItem`` fields.
+
+    The ID is always included. Columns keep ``LIBRARY_ITEM_COLUMNS`` order so
+    equal field sets share one compiled mapper.
+    """
+    wanted = {"title" if field == "display_title" else field for field in fields}
+    wanted.add("id")
+    return tuple(column for column in LIBRARY_ITEM_COLUMNS if column in wanted)
+
+
+@lru_cache(maxsize=64)
+def compile_row_mapper(columns: tuple[str, ...]) -> Callable[[Sequence], LibraryItem]:
+    """Build a mapper for rows selected with a subset of the item columns.
+
+    Fields outside ``columns`` keep their ``LibraryItem`` defaults, so the
+    result is only meant for serializing the selected fields.
+    """
+    if columns == LIBRARY_ITEM_COLUMNS:
+        return row_to_library_item
+
+    converters = [(column, _CONVERTERS.get(column)) for column in columns]
+    title_index = columns.index("title") if "title" in columns else None
+
+    def map_row(row: Sequence) -> LibraryItem:
+        values = {
+            column: convert(value) if convert is not None else value
+            for (column, convert), value in zip(converters, row, strict=True)
+        }
+        if title_index is not None:
+            values["display_title"] = row[title_index]
+        return LibraryItem(**values)
+
+    return map_row
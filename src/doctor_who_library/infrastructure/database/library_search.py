@@ -0,0 +1,95 @@
+"""Full-text search over library items backed by SQLite FTS5.
+
+The index (migration 0004) is keyed on the implicit rowid of
+``library_items``. That table has a string primary key, so the rowid is not
+an alias for it and ``VACUUM`` may renumber it, leaving the index pointing at
+the wrong rows. Vacuum through ``vacuum_database``, which rebuilds the index
+afterwards; keyset cursors issued before a vacuum may stop matching their
+rows and are then rejected.
+"""
+
+import re
+import sqlite3
+from collections.abc import Sequence
+
+from doctor_who_library.shared.database.connection import get_sqlite_connection
+
+# Column weights for bm25(), in library_items_fts column order
+BM25_WEIGHTS = {
+    "title": 10.0,
+    "story_title": 8.0,
+    "episode_title": 6.0,
+    "serial_title": 6.0,
+    "writer": 2.0,
+    "companions": 2.0,
+    "wiki_summary": 1.0,
+}
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+REBUILD_INDEX_SQL = (
+    "INSERT INTO library_items_fts(library_items_fts) VALUES ('rebuild')"
+)
+
+
+def build_match_expression(query: str) -> str | None:
+    """Turn free text into an FTS5 MATCH expression.
+
+    Every word must match, and the last word is matched as a prefix so
+    results keep up with search-as-you-type. Words are quoted so user input
+    can never be parsed as FTS5 syntax. Returns ``None`` when the query has
+    no searchable words.
+    """
+    tokens = _TOKEN_RE.findall(query)
+    if not tokens:
+        return None
+
+    terms = [f'"{token}"' for token in tokens[:-1]]
+    terms.append(f'"{tokens[-1]}"*')
+    return " ".join(terms)
+
+
+def build_search_sql(columns: Sequence[str]) -> str:
+    """Build the ranked search query selecting ``columns`` from library_items.
+
+    Parameters are the MATCH expression and the result limit.
+    """
+    selected = ", ".join(f"library_items.{column}" for column in columns)
+    weights = ", ".join(str(weight) for weight in BM25_WEIGHTS.values())
+    return (
+        f"SELECT {selected} FROM library_items_fts "
+        "JOIN library_items ON library_items.rowid = library_items_fts.rowid "
+        "WHERE library_items_fts MATCH ? "
+        f"ORDER BY bm25(library_items_fts, {weights}) "
+        "LIMIT ?"
+    )
+
+
+def build_fallback_search_sql(columns: Sequence[str]) -> str:
+    """Unranked substring search for databases without the FTS index.
+
+    Parameters are one ``%query%`` pattern per title column and the limit.
+    """
+    selected = ", ".join(columns)
+    return (
+        f"SELECT {selected} FROM library_items "
+        "WHERE title LIKE ? OR story_title LIKE ? "
+        "OR episode_title LIKE ? OR serial_title LIKE ? "
+        "ORDER BY rowid LIMIT ?"
+    )
+
+
+def vacuum_database() -> None:
+    """VACUUM the library database and rebuild the full-text index.
+
+    The rebuild re-reads every row under its current rowid, so the index is
+    correct whether or not the vacuum renumbered anything.
+    """
+    with get_sqlite_connection() as conn:
+        conn.execute("VACUUM")
+        try:
+            conn.execute(REBUILD_INDEX_SQL)
+        except sqlite3.OperationalError as e:
+            if "no such table" not in str(e):
+                raise
+        conn.commit()
@@ -0,0 +1,152 @@
+"""Materialized library statistics.
+
+Counts per enrichment status, confidence bucket and wiki coverage live in the
+``library_stats`` table and are kept current by triggers on
+``library_items`` (migration 0003), so reading them costs a handful of
+primary-key rows no matter how large the library grows. The full-scan
+aggregate is kept as a consistency check and repair path.
+"""
+
+import sqlite3
+from typing import Any
+
+from doctor_who_library.domain.value_objects.enrichment_status import EnrichmentStatus
+from doctor_who_library.shared.database.connection import (
+    execute_query,
+    get_sqlite_connection,
+)
+from doctor_who_library.shared.database.executor import run_blocking
+
+# Same bucket layout the triggers maintain, computed with a full scan
+SCAN_BUCKETS_SQL = """
+    SELECT 'total', COUNT(*), 0 FROM library_items
+    UNION ALL
+    SELECT 'status:' || enrichment_status, COUNT(*), 0
+    FROM library_items GROUP BY enrichment_status
+    UNION ALL
+    SELECT 'confidence:' || CASE
+               WHEN enrichment_confidence >= 0.8 THEN 'high'
+               WHEN enrichment_confidence >= 0.6 THEN 'medium'
+               ELSE 'low'
+           END AS bucket,
+           COUNT(*),
+           SUM(enrichment_confidence)
+    FROM library_items
+    WHERE enrichment_status = 'enriched' AND enrichment_confidence IS NOT NULL
+    GROUP BY bucket
+    UNION ALL
+    SELECT 'wiki', COUNT(*), 0
+    FROM library_items
+    WHERE enrichment_status = 'enriched'
+      AND (wiki_url IS NOT NULL OR wiki_summary IS NOT NULL OR wiki_image_url IS NOT NULL)
+"""
+
+MATERIALIZED_BUCKETS_SQL = (
+    "SELECT bucket, item_count, confidence_sum FROM library_stats"
+)
+
+CONFIDENCE_BUCKETS = ("high", "medium", "low")
+
+
+def _read_buckets(sql: str) -> dict[str, tuple[int, float]]:
+    return {
+        bucket: (int(count or 0), float(confidence_sum or 0.0))
+        for bucket, count, confidence_sum in execute_query(sql)
+    }
+
+
+def _read_materialized_buckets() -> dict[str, tuple[int, float]]:
+    try:
+        return _read_buckets(MATERIALIZED_BUCKETS_SQL)
+    except sqlite3.OperationalError as e:
+        # Database not migrated to 0003 yet (e.g. CLI before first serve)
+        if "no such table" not in str(e):
+            raise
+        return _read_buckets(SCAN_BUCKETS_SQL)
+
+
+def _buckets_to_counters(buckets: dict[str, tuple[int, float]]) -> dict[str, Any]:
+    status_counts = {status.value: 0 for status in EnrichmentStatus}
+    for bucket, (count, _) in buckets.items():
+        if bucket.startswith("status:"):
+            status_counts[bucket.removeprefix("status:")] = count
+
+    confidence_counts = {
+        name: buckets.get(f"confidence:{name}", (0, 0.0))[0]
+        for name in CONFIDENCE_BUCKETS
+    }
+    confidence_total = sum(confidence_counts.values())
+    confidence_sum = sum(
+        buckets.get(f"confidence:{name}", (0, 0.0))[1] for name in CONFIDENCE_BUCKETS
+    )
+
+    return {
+        "total_items": buckets.get("total", (0, 0.0))[0],
+        "status_counts": status_counts,
+        "high_confidence_count": confidence_counts["high"],
+        "medium_confidence_count": confidence_counts["medium"],
+        "low_confidence_count": confidence_counts["low"],
+        "avg_confidence": (
+            confidence_sum / confidence_total if confidence_total else 0.0
+        ),
+        "items_with_wiki_data": buckets.get("wiki", (0, 0.0))[0],
+    }
+
+
+def get_library_counters_sync() -> dict[str, Any]:
+    """Read the materialized counters from a synchronous context."""
+    return _buckets_to_counters(_read_materialized_buckets())
+
+
+async def get_library_counters() -> dict[str, Any]:
+    """Read the materialized counters (constant time)."""
+    return await run_blocking(get_library_counters_sync)
+
+
+async def scan_library_counters() -> dict[str, Any]:
+    """Compute the same counters with a full table scan."""
+    buckets = await run_blocking(_read_buckets, SCAN_BUCKETS_SQL)
+    return _buckets_to_counters(buckets)
+
+
+def _diff_buckets(
+    materialized: dict[str, tuple[int, float]], scanned: dict[str, tuple[int, float]]
+) -> dict[str, dict[str, Any]]:
+    differences = {}
+    for bucket in sorted(set(materialized) | set(scanned)):
+        stored_count, stored_sum = materialized.get(bucket, (0, 0.0))
+        actual_count, actual_sum = scanned.get(bucket, (0, 0.0))
+        if stored_count != actual_count or abs(stored_sum - actual_sum) > 1e-6:
+            differences[bucket] = {
+                "materialized": {"count": stored_count, "confidence_sum": stored_sum},
+                "scanned": {"count": actual_count, "confidence_sum": actual_sum},
+            }
+    return differences
+
+
+async def check_library_stats() -> dict[str, Any]:
+    """Compare the materialized counters against a full scan."""
+    materialized = await run_blocking(_read_buckets, MATERIALIZED_BUCKETS_SQL)
+    scanned = await run_blocking(_read_buckets, SCAN_BUCKETS_SQL)
+    differences = _diff_buckets(materialized, scanned)
+    return {
+        "consistent": not differences,
+        "differences": differences,
+        "counters": _buckets_to_counters(scanned),
+    }
+
+
+def _rebuild_sync() -> None:
+    with get_sqlite_connection() as conn:
+        conn.execute("DELETE FROM library_stats")
+        conn.execute(
+            "INSERT INTO library_stats (bucket, item_count, confidence_sum) "
+            + SCAN_BUCKETS_SQL
+        )
+        conn.commit()
+
+
+async def rebuild_library_stats() -> dict[str, Any]:
+    """Recompute the materialized counters from a full scan."""
+    await run_blocking(_rebuild_sync)
+    return await get_library_counters()
@@ -0,0 +1,49 @@
+"""Alembic-managed schema upgrades."""
+
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, inspect
+
+from doctor_who_library.shared.config.settings import get_settings
+
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
+# Revision matching the tables that Base.metadata.create_all used to build
+BASELINE_REVISION = "0001"
+
+
+def get_sync_database_url(url: str | None = None) -> str:
+    """Get a synchronous driver URL for the configured database."""
+    url = url or get_settings().database.url
+    return url.replace("+aiosqlite", "").replace("+asyncpg", "")
+
+
+def get_alembic_config(url: str | None = None) -> Config:
+    """Build an Alembic config pointing at the packaged migrations."""
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    config.set_main_option("sqlalchemy.url", get_sync_database_url(url))
+    return config
+
+
+def upgrade_database(url: str | None = None, revision: str = "head") -> None:
+    """Upgrade the database schema to ``revision``.
+
+    Databases created before migrations were introduced have the tables but
+    no ``alembic_version``; they are stamped at the baseline revision first
+    so only the later migrations run against them.
+    """
+    config = get_alembic_config(url)
+
+    engine = create_engine(config.get_main_option("sqlalchemy.url"))
+    try:
+        tables = set(inspect(engine).get_table_names())
+    finally:
+        engine.dispose()
+
+    if "library_items" in tables and "alembic_version" not in tables:
+        command.stamp(config, BASELINE_REVISION)
+
+    command.upgrade(config, revision)
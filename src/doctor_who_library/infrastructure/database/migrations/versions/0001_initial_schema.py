@@ -0,0 +1,91 @@
+"""Initial schema matching the tables previously created by create_all.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0001"
+down_revision: str | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _timestamps() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "library_items",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("display_title", sa.String(), nullable=True),
+        sa.Column("story_title", sa.String(), nullable=True),
+        sa.Column("episode_title", sa.String(), nullable=True),
+        sa.Column("serial_title", sa.String(), nullable=True),
+        sa.Column("content_type", sa.String(), nullable=True),
+        sa.Column("section_name", sa.String(), nullable=True),
+        sa.Column("group_name", sa.String(), nullable=True),
+        sa.Column("doctor", sa.String(), nullable=True),
+        sa.Column("companions", sa.String(), nullable=True),
+        sa.Column("writer", sa.String(), nullable=True),
+        sa.Column("director", sa.String(), nullable=True),
+        sa.Column("producer", sa.String(), nullable=True),
+        sa.Column("story_number", sa.String(), nullable=True),
+        sa.Column("series", sa.String(), nullable=True),
+        sa.Column("format", sa.String(), nullable=True),
+        sa.Column("duration", sa.String(), nullable=True),
+        sa.Column("broadcast_date", sa.DateTime(), nullable=True),
+        sa.Column("release_date", sa.DateTime(), nullable=True),
+        sa.Column("cover_date", sa.DateTime(), nullable=True),
+        sa.Column("enrichment_status", sa.String(), nullable=False),
+        sa.Column("enrichment_confidence", sa.Float(), nullable=True),
+        sa.Column("enrichment_error", sa.Text(), nullable=True),
+        sa.Column("wiki_url", sa.String(), nullable=True),
+        sa.Column("wiki_summary", sa.Text(), nullable=True),
+        sa.Column("wiki_image_url", sa.String(), nullable=True),
+        sa.Column("wiki_search_term", sa.String(), nullable=True),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "library_sections",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("display_name", sa.String(), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("sort_order", sa.Float(), nullable=True),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.create_table(
+        "library_groups",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("display_name", sa.String(), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("section_name", sa.String(), nullable=True),
+        sa.Column("sort_order", sa.Float(), nullable=True),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("library_groups")
+    op.drop_table("library_sections")
+    op.drop_table("library_items")
@@ -0,0 +1,49 @@
+"""Secondary indexes for library_items query patterns.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Status filter + cursor pagination in get_enrichment_display
+    op.create_index(
+        "ix_library_items_status_updated_id",
+        "library_items",
+        ["enrichment_status", "updated_at", "id"],
+    )
+    # Unfiltered display/stream ordering and time-window filters
+    op.create_index(
+        "ix_library_items_updated_id",
+        "library_items",
+        ["updated_at", "id"],
+    )
+    op.create_index("ix_library_items_section_name", "library_items", ["section_name"])
+    op.create_index("ix_library_items_group_name", "library_items", ["group_name"])
+    # Pending work queue; entries share one key so they stay in ROWID order
+    op.create_index(
+        "ix_library_items_pending",
+        "library_items",
+        ["enrichment_status"],
+        sqlite_where=sa.text("enrichment_status = 'pending'"),
+        postgresql_where=sa.text("enrichment_status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_library_items_pending", table_name="library_items")
+    op.drop_index("ix_library_items_group_name", table_name="library_items")
+    op.drop_index("ix_library_items_section_name", table_name="library_items")
+    op.drop_index("ix_library_items_updated_id", table_name="library_items")
+    op.drop_index("ix_library_items_status_updated_id", table_name="library_items")
@@ -0,0 +1,123 @@
+"""Trigger-maintained library statistics.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TRACKED_COLUMNS = (
+    "enrichment_status, enrichment_confidence, wiki_url, wiki_summary, wiki_image_url"
+)
+
+
+def _bucket_upserts(row: str, sign: str) -> str:
+    """SQL adding (sign=+1) or removing (sign=-1) one row's contribution."""
+    upsert = (
+        "ON CONFLICT(bucket) DO UPDATE SET "
+        "item_count = item_count + excluded.item_count, "
+        "confidence_sum = confidence_sum + excluded.confidence_sum;"
+    )
+    return f"""
+        INSERT INTO library_stats (bucket, item_count, confidence_sum)
+        VALUES ('total', {sign}, 0) {upsert}
+        INSERT INTO library_stats (bucket, item_count, confidence_sum)
+        VALUES ('status:' || {row}.enrichment_status, {sign}, 0) {upsert}
+        INSERT INTO library_stats (bucket, item_count, confidence_sum)
+        SELECT 'confidence:' || CASE
+                   WHEN {row}.enrichment_confidence >= 0.8 THEN 'high'
+                   WHEN {row}.enrichment_confidence >= 0.6 THEN 'medium'
+                   ELSE 'low'
+               END,
+               {sign},
+               {sign} * {row}.enrichment_confidence
+        WHERE {row}.enrichment_status = 'enriched'
+          AND {row}.enrichment_confidence IS NOT NULL {upsert}
+        INSERT INTO library_stats (bucket, item_count, confidence_sum)
+        SELECT 'wiki', {sign}, 0
+        WHERE {row}.enrichment_status = 'enriched'
+          AND ({row}.wiki_url IS NOT NULL
+               OR {row}.wiki_summary IS NOT NULL
+               OR {row}.wiki_image_url IS NOT NULL) {upsert}
+    """
+
+
+BACKFILL_SQL = """
+    INSERT INTO library_stats (bucket, item_count, confidence_sum)
+    SELECT 'total', COUNT(*), 0 FROM library_items
+    UNION ALL
+    SELECT 'status:' || enrichment_status, COUNT(*), 0
+    FROM library_items GROUP BY enrichment_status
+    UNION ALL
+    SELECT 'confidence:' || CASE
+               WHEN enrichment_confidence >= 0.8 THEN 'high'
+               WHEN enrichment_confidence >= 0.6 THEN 'medium'
+               ELSE 'low'
+           END AS bucket,
+           COUNT(*),
+           SUM(enrichment_confidence)
+    FROM library_items
+    WHERE enrichment_status = 'enriched' AND enrichment_confidence IS NOT NULL
+    GROUP BY bucket
+    UNION ALL
+    SELECT 'wiki', COUNT(*), 0
+    FROM library_items
+    WHERE enrichment_status = 'enriched'
+      AND (wiki_url IS NOT NULL OR wiki_summary IS NOT NULL OR wiki_image_url IS NOT NULL)
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "library_stats",
+        sa.Column("bucket", sa.String(), nullable=False),
+        sa.Column("item_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("confidence_sum", sa.Float(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("bucket"),
+    )
+    op.execute(BACKFILL_SQL)
+
+    op.execute(
+        f"""
+        CREATE TRIGGER library_stats_after_insert
+        AFTER INSERT ON library_items
+        BEGIN
+            {_bucket_upserts("NEW", "1")}
+        END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER library_stats_after_delete
+        AFTER DELETE ON library_items
+        BEGIN
+            {_bucket_upserts("OLD", "-1")}
+        END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER library_stats_after_update
+        AFTER UPDATE OF {TRACKED_COLUMNS} ON library_items
+        BEGIN
+            {_bucket_upserts("OLD", "-1")}
+            {_bucket_upserts("NEW", "1")}
+        END
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS library_stats_after_update")
+    op.execute("DROP TRIGGER IF EXISTS library_stats_after_delete")
+    op.execute("DROP TRIGGER IF EXISTS library_stats_after_insert")
+    op.drop_table("library_stats")
@@ -0,0 +1,90 @@
+"""FTS5 full-text index over library_items.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0004"
+down_revision: str | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+FTS_COLUMNS = (
+    "title",
+    "story_title",
+    "episode_title",
+    "serial_title",
+    "writer",
+    "companions",
+    "wiki_summary",
+)
+
+
+def _values(row: str) -> str:
+    return ", ".join(f"{row}.{column}" for column in FTS_COLUMNS)
+
+
+def upgrade() -> None:
+    columns = ", ".join(FTS_COLUMNS)
+
+    # External-content table: the index stores only tokens, rows stay in
+    # library_items and are joined back on rowid. That rowid is implicit (the
+    # primary key is a string), so VACUUM may renumber it; vacuum through
+    # library_search.vacuum_database, which rebuilds this index afterwards
+    op.execute(
+        f"""
+        CREATE VIRTUAL TABLE library_items_fts USING fts5(
+            {columns},
+            content='library_items',
+            content_rowid='rowid',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        )
+        """
+    )
+    op.execute("INSERT INTO library_items_fts(library_items_fts) VALUES ('rebuild')")
+
+    op.execute(
+        f"""
+        CREATE TRIGGER library_items_fts_after_insert
+        AFTER INSERT ON library_items
+        BEGIN
+            INSERT INTO library_items_fts (rowid, {columns})
+            VALUES (NEW.rowid, {_values("NEW")});
+        END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER library_items_fts_after_delete
+        AFTER DELETE ON library_items
+        BEGIN
+            INSERT INTO library_items_fts (library_items_fts, rowid, {columns})
+            VALUES ('delete', OLD.rowid, {_values("OLD")});
+        END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER library_items_fts_after_update
+        AFTER UPDATE OF {columns} ON library_items
+        BEGIN
+            INSERT INTO library_items_fts (library_items_fts, rowid, {columns})
+            VALUES ('delete', OLD.rowid, {_values("OLD")});
+            INSERT INTO library_items_fts (rowid, {columns})
+            VALUES (NEW.rowid, {_values("NEW")});
+        END
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS library_items_fts_after_update")
+    op.execute("DROP TRIGGER IF EXISTS library_items_fts_after_delete")
+    op.execute("DROP TRIGGER IF EXISTS library_items_fts_after_insert")
+    op.execute("DROP TABLE IF EXISTS library_items_fts")
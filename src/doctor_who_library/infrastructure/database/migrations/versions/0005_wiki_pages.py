@@ -0,0 +1,41 @@
+"""Parsed wiki page store.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0005"
+down_revision: str | None = "0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "wiki_pages",
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("url", sa.String(), nullable=False),
+        sa.Column("revision_id", sa.Integer(), nullable=True),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column(
+            "fetched_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("title"),
+    )
+    op.create_table(
+        "wiki_page_redirects",
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("target_title", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("title"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("wiki_page_redirects")
+    op.drop_table("wiki_pages")
@@ -4,7 +4,18 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import CHAR, Column, DateTime, Float, String, Text, TypeDecorator
+from sqlalchemy import (
+    CHAR,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    Text,
+    TypeDecorator,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
@@ -122,10 +133,47 @@ class LibraryItemModel(Base):
         server_default=func.now(),
     )
 
+    # Indexes are created by migration 0002; keep the two in sync
+    __table_args__ = (
+        Index(
+            "ix_library_items_status_updated_id",
+            "enrichment_status",
+            "updated_at",
+            "id",
+        ),
+        Index("ix_library_items_updated_id", "updated_at", "id"),
+        Index("ix_library_items_section_name", "section_name"),
+        Index("ix_library_items_group_name", "group_name"),
+        Index(
+            "ix_library_items_pending",
+            "enrichment_status",
+            sqlite_where=text("enrichment_status = 'pending'"),
+            postgresql_where=text("enrichment_status = 'pending'"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<LibraryItemModel(id={self.id}, title='{self.title}')>"
 
 
+class LibraryStatsModel(Base):
+    """Materialized library statistics, one row per counter bucket.
+
+    Maintained by triggers on ``library_items`` (migration 0003). Buckets are
+    ``total``, ``status:<status>``, ``confidence:<high|medium|low>`` and
+    ``wiki``.
+    """
+
+    __tablename__ = "library_stats"
+
+    bucket = Column(String, primary_key=True, nullable=False)
+    item_count = Column(Integer, nullable=False, default=0, server_default="0")
+    confidence_sum = Column(Float, nullable=False, default=0.0, server_default="0")
+
+    def __repr__(self) -> str:
+        return f"<LibraryStatsModel(bucket={self.bucket}, count={self.item_count})>"
+
+
 class LibrarySectionModel(Base):
     """Database model for library sections."""
 
@@ -199,3 +247,40 @@ class LibraryGroupModel(Base):
 
     def __repr__(self) -> str:
         return f"<LibraryGroupModel(id={self.id}, name='{self.name}')>"
+
+
+class WikiPageModel(Base):
+    """Parsed TARDIS Wiki page, one row per canonical page title.
+
+    ``content`` is the JSON-encoded dict extracted from the page (summary,
+    infobox, categories, images), so a page is fetched and parsed once no
+    matter how many library items resolve to it.
+    """
+
+    __tablename__ = "wiki_pages"
+
+    title = Column(String, primary_key=True, nullable=False)
+    url = Column(String, nullable=False)
+    revision_id = Column(Integer, nullable=True)
+    content = Column(Text, nullable=False)
+    fetched_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return f"<WikiPageModel(title='{self.title}', revision_id={self.revision_id})>"
+
+
+class WikiPageRedirectModel(Base):
+    """Requested wiki title that resolves to a different canonical page."""
+
+    __tablename__ = "wiki_page_redirects"
+
+    title = Column(String, primary_key=True, nullable=False)
+    target_title = Column(String, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<WikiPageRedirectModel(title='{self.title}', target='{self.target_title}')>"
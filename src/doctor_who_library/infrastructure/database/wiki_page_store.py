@@ -0,0 +1,138 @@
+"""Store of parsed TARDIS Wiki pages shared across items and runs.
+
+Pages live in ``wiki_pages`` keyed by canonical title (migration 0005), with
+requested titles that resolve elsewhere recorded in ``wiki_page_redirects``.
+Every episode of a multi-part story resolves to the same row, so each page
+is fetched and parsed once.
+"""
+
+import json
+import sqlite3
+import threading
+from typing import Any
+
+from structlog import get_logger
+
+from doctor_who_library.shared.config.settings import WikiSettings
+from doctor_who_library.shared.database.connection import get_sqlite_connection
+from doctor_who_library.shared.database.executor import fetch_one, run_blocking
+
+logger = get_logger()
+
+PAGE_SELECT = """
+    SELECT title, content FROM wiki_pages
+    WHERE title = COALESCE(
+        (SELECT target_title FROM wiki_page_redirects WHERE title = ?), ?
+    )
+"""
+
+
+class WikiPageStore:
+    """Parsed wiki pages, consulted before any network or parse work.
+
+    Pages older than ``max_age_seconds`` are treated as missing and refetched
+    (0 keeps them forever). Before migration 0005 has run, every lookup
+    misses and writes are skipped.
+    """
+
+    def __init__(self, max_age_seconds: int = 0):
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+
+    @classmethod
+    def from_settings(cls, config: WikiSettings) -> "WikiPageStore | None":
+        """Build the store described by ``WIKI_PAGE_STORE_*``, or ``None``."""
+        if not config.page_store_enabled:
+            return None
+        return cls(max_age_seconds=config.page_store_max_age)
+
+    async def get(self, title: str) -> dict[str, Any] | None:
+        """Return the parsed page for ``title`` or a title redirecting to it."""
+        found = await self.lookup(title)
+        return found[1] if found is not None else None
+
+    async def lookup(self, title: str) -> tuple[str, dict[str, Any]] | None:
+        """Like ``get``, but also return the page's canonical title."""
+        query = PAGE_SELECT
+        params: tuple = (title, title)
+        if self.max_age_seconds:
+            query += " AND fetched_at >= datetime('now', ?)"
+            params += (f"-{self.max_age_seconds} seconds",)
+
+        try:
+            row = await fetch_one(query, params)
+        except sqlite3.OperationalError as e:
+            if "no such table" not in str(e):
+                raise
+            row = None
+
+        with self._lock:
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        return row[0], json.loads(row[1])
+
+    async def put(
+        self,
+        title: str,
+        content: dict[str, Any],
+        revision_id: int | None = None,
+        canonical_title: str | None = None,
+    ) -> None:
+        """Store a parsed page under its canonical title."""
+        stored = await run_blocking(
+            self._put_sync, title, content, revision_id, canonical_title or title
+        )
+        if stored:
+            with self._lock:
+                self._stores += 1
+
+    def _put_sync(
+        self,
+        title: str,
+        content: dict[str, Any],
+        revision_id: int | None,
+        canonical_title: str,
+    ) -> bool:
+        try:
+            with get_sqlite_connection() as conn:
+                conn.execute(
+                    "INSERT INTO wiki_pages (title, url, revision_id, content, fetched_at) "
+                    "VALUES (?, ?, ?, ?, datetime('now')) "
+                    "ON CONFLICT(title) DO UPDATE SET url = excluded.url, "
+                    "revision_id = excluded.revision_id, content = excluded.content, "
+                    "fetched_at = excluded.fetched_at",
+                    (
+                        canonical_title,
+                        content.get("url", ""),
+                        revision_id,
+                        json.dumps(content),
+                    ),
+                )
+                if title != canonical_title:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO wiki_page_redirects (title, target_title) "
+                        "VALUES (?, ?)",
+                        (title, canonical_title),
+                    )
+                conn.commit()
+            return True
+        except sqlite3.OperationalError as e:
+            if "no such table" not in str(e):
+                raise
+            logger.debug("wiki_pages table missing, not storing parsed page")
+            return False
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "stores": self._stores,
+            }
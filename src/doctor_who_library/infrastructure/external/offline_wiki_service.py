@@ -0,0 +1,97 @@
+"""Wiki service that enriches from a local TARDIS Wiki dump, offline."""
+
+import asyncio
+from typing import Any
+from urllib.parse import quote, urljoin
+
+from doctor_who_library.infrastructure.external.tardis_wiki_service import (
+    TardisWikiService,
+)
+from doctor_who_library.infrastructure.external.wiki_dump import DumpPage
+from doctor_who_library.infrastructure.external.wiki_dump_store import WikiDumpStore
+from doctor_who_library.shared.config.settings import WikiSettings
+from doctor_who_library.shared.exceptions.infrastructure import ExternalServiceException
+
+
+class OfflineWikiService(TardisWikiService):
+    """TARDIS Wiki service answering from a ``WikiDumpStore``.
+
+    Candidate generation, title resolution, search and scoring work as
+    online; only the lookups are served by the local store, so enrichment
+    makes no network calls at all.
+    """
+
+    def __init__(self, config: WikiSettings, dump_store: WikiDumpStore):
+        super().__init__(config)
+        self.dump_store = dump_store
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        if not self.dump_store.available:
+            raise ExternalServiceException(
+                service_name="TARDIS Wiki",
+                operation="open_dump_store",
+                message=f"No wiki dump store at {self.dump_store.path}; "
+                "run `dw-cli wiki import-dump <file>` first",
+            )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        pass
+
+    async def _send(self, url: str, **kwargs: Any):
+        raise ExternalServiceException(
+            service_name="TARDIS Wiki",
+            operation="request",
+            message=f"Network access is disabled in offline mode: {url}",
+        )
+
+    async def _resolve_titles(self, titles: list[str]) -> dict[str, str]:
+        return await asyncio.to_thread(self.dump_store.resolve_titles, titles)
+
+    async def _search_wiki(self, query: str, limit: int = 5) -> list[dict[str, Any]]:
+        titles = await asyncio.to_thread(self.dump_store.search, query, limit)
+        return [
+            {"title": title, "url": self._page_url(title), "snippet": "", "size": 0}
+            for title in titles
+        ]
+
+    async def _get_pages_content(
+        self, page_titles: list[str]
+    ) -> dict[str, dict[str, Any] | None]:
+        titles = list(dict.fromkeys(page_titles))
+        resolved = await self._resolve_titles(titles)
+        pages = await asyncio.to_thread(
+            self.dump_store.get_pages, list(set(resolved.values()))
+        )
+        contents: dict[str, dict[str, Any] | None] = {}
+        for title in titles:
+            page = pages.get(resolved.get(title, ""))
+            contents[title] = self._to_content(title, page) if page else None
+        return contents
+
+    async def _get_page_content(self, page_title: str) -> dict[str, Any] | None:
+        return (await self._get_pages_content([page_title]))[page_title]
+
+    def _page_url(self, title: str) -> str:
+        return urljoin(str(self.config.base_url), quote(title.replace(" ", "_")))
+
+    def _to_content(self, title: str, page: DumpPage) -> dict[str, Any]:
+        return {
+            "title": title,
+            "url": self._page_url(page.title),
+            "content": "",
+            "infobox": page.infobox,
+            "categories": page.categories,
+            "summary": self._clean_text(page.summary),
+            "images": [
+                urljoin(
+                    str(self.config.base_url),
+                    # "./" keeps "Special:" from reading as a URL scheme
+                    "./Special:FilePath/" + quote(page.image.replace(" ", "_")),
+                )
+            ]
+            if page.image
+            else [],
+        }
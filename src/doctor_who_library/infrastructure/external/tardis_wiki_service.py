@@ -1,12 +1,13 @@
 """Modern TARDIS Wiki service implementation."""
 
 import asyncio
+import json
 import re
+from contextvars import ContextVar
 from typing import Any
 from urllib.parse import quote, urljoin
 
 import httpx
-from bs4 import BeautifulSoup
 from structlog import get_logger
 
 from doctor_who_library.domain.entities.library_item import LibraryItem
@@ -14,89 +15,265 @@ from doctor_who_library.domain.services.wiki_service import (
     WikiSearchResult,
     WikiService,
 )
+from doctor_who_library.infrastructure.database.wiki_page_store import WikiPageStore
+from doctor_who_library.infrastructure.external.wiki_circuit_breaker import (
+    WikiCircuitBreaker,
+)
+from doctor_who_library.infrastructure.external.wiki_html_parser import get_html_parser
+from doctor_who_library.infrastructure.external.wiki_http_cache import (
+    WikiHttpCache,
+    cache_key,
+)
+from doctor_who_library.infrastructure.external.wiki_http_client import WikiHttpClient
+from doctor_who_library.infrastructure.external.wiki_rate_limiter import (
+    THROTTLE_STATUS_CODES,
+    WikiRateLimiter,
+    backoff_delay,
+    parse_retry_after,
+)
 from doctor_who_library.shared.config.settings import WikiSettings
-from doctor_who_library.shared.exceptions.infrastructure import ExternalServiceException
+from doctor_who_library.shared.exceptions.infrastructure import (
+    ExternalServiceException,
+    WikiUnavailableException,
+)
 
 logger = get_logger()
 
+# MediaWiki's page config, embedded in every rendered page
+_PAGE_NAME = re.compile(r'"wgPageName":("(?:[^"\\]|\\.)*")')
+_REVISION_ID = re.compile(r'"wgRevisionId":(\d+)')
+
+# MediaWiki caps ``titles`` at 50 per query for normal clients
+API_TITLES_PER_REQUEST = 50
+
+# Server errors worth retrying; 429/503 are handled as throttling
+TRANSIENT_STATUS_CODES = frozenset({500, 502, 504})
+RETRY_STATUS_CODES = THROTTLE_STATUS_CODES | TRANSIENT_STATUS_CODES
+
+# Per-item cap on in-flight wiki requests, set while an item is searched
+_item_request_slots: ContextVar[asyncio.Semaphore | None] = ContextVar(
+    "_item_request_slots", default=None
+)
+
 
 class TardisWikiService(WikiService):
     """TARDIS Wiki service implementation."""
 
-    def __init__(self, config: WikiSettings):
+    def __init__(
+        self,
+        config: WikiSettings,
+        http_cache: WikiHttpCache | None = None,
+        page_store: WikiPageStore | None = None,
+        rate_limiter: WikiRateLimiter | None = None,
+        circuit_breaker: WikiCircuitBreaker | None = None,
+        http_client: WikiHttpClient | None = None,
+    ):
         self.config = config
-        self._session: httpx.AsyncClient | None = None
+        self.http_client = http_client or WikiHttpClient(config)
+        self.http_cache = http_cache
+        self.page_store = page_store
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.html_parser = get_html_parser(config.html_parser)
+
+    @property
+    def _session(self) -> httpx.AsyncClient:
+        """The shared HTTP client for the running event loop."""
+        return self.http_client.get()
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self._session = httpx.AsyncClient(
-            timeout=httpx.Timeout(self.config.timeout),
-            headers={
-                "User-Agent": self.config.user_agent,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            },
-            limits=httpx.Limits(max_connections=5, max_keepalive_connections=2),
-            follow_redirects=True,  # Follow redirects automatically
-        )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self._session:
-            await self._session.aclose()
+        # The HTTP client is shared and outlives this context
+        pass
 
     async def search_for_item(self, item: LibraryItem) -> WikiSearchResult | None:
         """Search for wiki content for a library item."""
-        if not self._session:
-            async with self:
-                return await self._search_for_item_internal(item)
-
         return await self._search_for_item_internal(item)
 
     async def _search_for_item_internal(
         self, item: LibraryItem
     ) -> WikiSearchResult | None:
         """Internal search implementation."""
+        token = _item_request_slots.set(
+            asyncio.Semaphore(self.config.candidate_concurrency)
+        )
+        try:
+            return await self._search_candidates(item)
+        finally:
+            _item_request_slots.reset(token)
+
+    async def _search_candidates(self, item: LibraryItem) -> WikiSearchResult | None:
+        """Find the best-scoring page among an item's candidates.
+
+        Candidate titles are first checked directly in one request; full-text
+        search only runs when none of them names a page that scores above the
+        confidence threshold.
+        """
         search_queries = self._generate_search_queries(item)
 
+        best_result, best_score = await self._evaluate_direct_titles(
+            item, search_queries
+        )
+        if best_score >= self.config.confidence_threshold:
+            return best_result
+
+        # A sliding window of queries runs concurrently, in priority order and
+        # bounded by the per-item request cap. Once every query ahead of a
+        # high-confidence match has finished, nothing later can win, so
+        # whatever is still running is cancelled
+        queued = list(enumerate(search_queries))
+        running: dict[asyncio.Task, int] = {}
+        results: dict[int, tuple[WikiSearchResult | None, float]] = {}
+        try:
+            while queued or running:
+                while queued and len(running) < self.config.candidate_concurrency:
+                    index, query = queued.pop(0)
+                    task = asyncio.create_task(self._evaluate_search_query(item, query))
+                    running[task] = index
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    results[running.pop(task)] = task.result()
+                index = 0
+                while index in results and results[index][1] <= 0.8:
+                    index += 1
+                if index in results:
+                    break
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
+        # Pick as the sequential loop did: ties go to the earlier query and
+        # nothing after the first high-confidence match counts
+        for index in sorted(results):
+            result, score = results[index]
+            if score > best_score:
+                best_result, best_score = result, score
+            if score > 0.8:
+                break
+
+        return best_result if best_score >= self.config.confidence_threshold else None
+
+    async def _evaluate_search_query(
+        self, item: LibraryItem, query: str
+    ) -> tuple[WikiSearchResult | None, float]:
+        """Search for one query and score its results."""
         best_result = None
         best_score = 0.0
+        try:
+            search_results = await self._search_wiki(query, limit=3)
+            contents = await self._get_pages_content(
+                [result["title"] for result in search_results]
+            )
+        except WikiUnavailableException:
+            raise
+        except Exception as e:
+            logger.warning(f"Search failed for query '{query}': {e}")
+            return None, 0.0
 
-        for query in search_queries:
-            try:
-                search_results = await self._search_wiki(query, limit=3)
+        for result in search_results:
+            page_content = contents.get(result["title"])
+            if not page_content:
+                continue
 
-                for result in search_results:
-                    page_content = await self._get_page_content(result["title"])
+            confidence = self._calculate_confidence_score(item, page_content)
+            if confidence > best_score:
+                best_score = confidence
+                best_result = self._to_search_result(
+                    result["title"], result["url"], page_content, confidence, query
+                )
 
-                    if page_content:
-                        confidence = self._calculate_confidence_score(
-                            item, page_content
-                        )
+            # Early exit for high confidence
+            if confidence > 0.8:
+                break
 
-                        if confidence > best_score:
-                            best_score = confidence
-                            best_result = WikiSearchResult(
-                                title=result["title"],
-                                url=result["url"],
-                                summary=page_content.get("summary", ""),
-                                confidence=confidence,
-                                search_term=query,
-                                image_url=page_content.get("images", [None])[0],
-                            )
-
-                        # Early exit for high confidence
-                        if confidence > 0.8:
-                            break
-
-                if best_score > 0.8:
-                    break
+        return best_result, best_score
+
+    async def _evaluate_direct_titles(
+        self, item: LibraryItem, search_queries: list[str]
+    ) -> tuple[WikiSearchResult | None, float]:
+        """Score the pages that candidate queries name exactly.
+
+        Titles already in the page store (directly or through a recorded
+        redirect) need no network work; only the rest are resolved.
+        """
+        # The quoted "... Doctor Who" query is a search phrase, not a title
+        titles = [query for query in search_queries if not query.startswith('"')]
+        try:
+            resolved: dict[str, str] = {}
+            contents: dict[str, dict[str, Any] | None] = {}
+            if self.page_store is not None:
+                for title in titles:
+                    found = await self.page_store.lookup(title)
+                    if found is not None:
+                        page_title, content = found
+                        resolved[title] = page_title
+                        contents[page_title] = {**content, "title": page_title}
+
+            unresolved = [title for title in titles if title not in resolved]
+            if unresolved:
+                resolved.update(await self._resolve_titles(unresolved))
+            if not resolved:
+                return None, 0.0
+            missing = [title for title in resolved.values() if title not in contents]
+            if missing:
+                contents.update(
+                    await self._get_pages_content(list(dict.fromkeys(missing)))
+                )
+        except WikiUnavailableException:
+            raise
+        except Exception as e:
+            logger.warning(f"Direct title resolution failed for '{item.title}': {e}")
+            return None, 0.0
 
-            except Exception as e:
-                logger.warning(f"Search failed for query '{query}': {e}")
+        best_result = None
+        best_score = 0.0
+        for title in titles:
+            page_title = resolved.get(title)
+            page_content = contents.get(page_title) if page_title else None
+            if not page_content:
                 continue
 
-        return best_result if best_score >= self.config.confidence_threshold else None
+            confidence = self._calculate_confidence_score(item, page_content)
+            if confidence > best_score:
+                best_score = confidence
+                best_result = self._to_search_result(
+                    page_title,
+                    urljoin(
+                        str(self.config.base_url),
+                        quote(page_title.replace(" ", "_")),
+                    ),
+                    page_content,
+                    confidence,
+                    title,
+                )
+            if confidence > 0.8:
+                break
+
+        return best_result, best_score
+
+    @staticmethod
+    def _to_search_result(
+        title: str,
+        url: str,
+        page_content: dict[str, Any],
+        confidence: float,
+        search_term: str,
+    ) -> WikiSearchResult:
+        return WikiSearchResult(
+            title=title,
+            url=url,
+            summary=page_content.get("summary", ""),
+            confidence=confidence,
+            search_term=search_term,
+            image_url=(page_content.get("images") or [None])[0],
+        )
 
     async def enrich_item(self, item: LibraryItem) -> LibraryItem:
         """Enrich a library item with wiki data."""
@@ -124,6 +301,9 @@ class TardisWikiService(WikiService):
                     else None,
                 )
 
+        except WikiUnavailableException:
+            # Leave the item pending until the wiki is back
+            raise
         except Exception as e:
             item.mark_enrichment_failed(
                 error=str(e),
@@ -141,11 +321,9 @@ class TardisWikiService(WikiService):
         )
 
         async def enrich_single_item(item: LibraryItem) -> LibraryItem:
+            # Requests are paced by the shared rate limiter, not per item
             async with semaphore:
-                result = await self.enrich_item(item)
-                # Rate limiting
-                await asyncio.sleep(self.config.request_delay)
-                return result
+                return await self.enrich_item(item)
 
         tasks = [enrich_single_item(item) for item in items if item.can_be_enriched()]
 
@@ -154,9 +332,11 @@ class TardisWikiService(WikiService):
 
         enriched_items = await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Handle exceptions
+        # Handle exceptions; items that hit a wiki outage stay pending
         for i, result in enumerate(enriched_items):
-            if isinstance(result, Exception):
+            if isinstance(result, Exception) and not isinstance(
+                result, WikiUnavailableException
+            ):
                 items[i].mark_enrichment_failed(
                     error=str(result),
                     search_term=items[i].get_search_titles()[0]
@@ -166,6 +346,124 @@ class TardisWikiService(WikiService):
 
         return items
 
+    async def _get(
+        self, url: str, params: dict[str, Any] | None = None, ttl: float = 0
+    ) -> httpx.Response:
+        """GET through the persistent HTTP cache.
+
+        Fresh cached responses are returned without a request; stale ones
+        are revalidated with conditional headers.
+        """
+        if self.http_cache is None:
+            return await self._send(url, params=params)
+
+        key = cache_key(url, params)
+        request = httpx.Request("GET", url, params=params)
+        cached = await asyncio.to_thread(self.http_cache.get, key)
+        if cached is not None and cached.fresh:
+            return httpx.Response(
+                200, headers=cached.headers, content=cached.body, request=request
+            )
+
+        headers = cached.conditional_headers() if cached is not None else None
+        response = await self._send(url, params=params, headers=headers)
+
+        if response.status_code == 304 and cached is not None:
+            await asyncio.to_thread(self.http_cache.renew, key, ttl)
+            return httpx.Response(
+                200, headers=cached.headers, content=cached.body, request=request
+            )
+        if response.status_code == 200:
+            await asyncio.to_thread(
+                self.http_cache.put,
+                key,
+                dict(response.headers),
+                response.content,
+                ttl,
+            )
+        return response
+
+    async def _send(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a GET, holding one of the current item's request slots."""
+        slots = _item_request_slots.get()
+        if slots is None:
+            return await self._send_with_retries(url, **kwargs)
+        async with slots:
+            return await self._send_with_retries(url, **kwargs)
+
+    async def _send_with_retries(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a GET through the circuit breaker and shared rate limiter.
+
+        Throttled responses (429/503) slow the limiter down and pause all
+        wiki traffic; connection errors and other 5xx responses are retried
+        after an exponential backoff with jitter. When ``max_retries`` runs
+        out the breaker records a failure and ``WikiUnavailableException``
+        is raised.
+        """
+        breaker = self.circuit_breaker
+        limiter = self.rate_limiter
+        if breaker is not None:
+            breaker.before_request()
+
+        recorded = False
+        try:
+            for attempt in range(self.config.max_retries + 1):
+                if limiter is not None:
+                    await limiter.acquire()
+
+                try:
+                    response = await self._session.get(url, **kwargs)
+                except httpx.TransportError as e:
+                    error, status_code = e, None
+                    reason = f"{type(e).__name__}: {e}"
+                else:
+                    status_code = response.status_code
+                    if status_code not in RETRY_STATUS_CODES:
+                        if limiter is not None:
+                            limiter.record_success()
+                        if breaker is not None:
+                            breaker.record_success()
+                        recorded = True
+                        return response
+                    error, reason = None, f"HTTP {status_code}"
+
+                throttled = status_code in THROTTLE_STATUS_CODES and limiter is not None
+                if throttled:
+                    # The limiter pauses every request, the retry included
+                    limiter.record_throttled(
+                        parse_retry_after(response.headers.get("retry-after"))
+                    )
+                if attempt == self.config.max_retries:
+                    break
+                logger.info(
+                    f"Retrying wiki request ({attempt + 1}/{self.config.max_retries}) "
+                    f"after {reason}"
+                )
+                if not throttled:
+                    await asyncio.sleep(
+                        backoff_delay(
+                            attempt, self.config.backoff_base, self.config.backoff_max
+                        )
+                    )
+
+            if breaker is not None:
+                breaker.record_failure()
+            recorded = True
+            raise WikiUnavailableException(
+                operation="request",
+                message=f"{reason} after {self.config.max_retries + 1} attempts",
+                status_code=status_code,
+                cause=error,
+            )
+        finally:
+            if breaker is not None and not recorded:
+                breaker.release_probe()
+
+    async def wait_until_available(self) -> None:
+        """Wait until the circuit breaker lets wiki requests through."""
+        if self.circuit_breaker is not None:
+            await self.circuit_breaker.wait_until_available()
+
     async def _search_wiki(self, query: str, limit: int = 5) -> list[dict[str, Any]]:
         """Search the TARDIS Wiki for pages matching the query."""
         try:
@@ -178,9 +476,11 @@ class TardisWikiService(WikiService):
                 "srprop": "title|snippet|size",
             }
 
-            if self._session is None:
-                raise ExternalServiceException("Session not initialized")
-            response = await self._session.get(str(self.config.api_url), params=params)
+            response = await self._get(
+                str(self.config.api_url),
+                params=params,
+                ttl=self.config.http_cache_search_ttl,
+            )
             response.raise_for_status()
 
             data = response.json()
@@ -212,64 +512,260 @@ class TardisWikiService(WikiService):
                 cause=e,
             ) from e
 
+    async def _resolve_titles(self, titles: list[str]) -> dict[str, str]:
+        """Map each title naming an existing page to its canonical title.
+
+        One ``action=query&titles=...&redirects`` request per 50 titles;
+        titles without a page are left out.
+        """
+        resolved: dict[str, str] = {}
+        for start in range(0, len(titles), API_TITLES_PER_REQUEST):
+            chunk = titles[start : start + API_TITLES_PER_REQUEST]
+            params = {
+                "action": "query",
+                "format": "json",
+                "formatversion": 2,
+                "titles": "|".join(chunk),
+                "redirects": 1,
+            }
+            try:
+                response = await self._get(
+                    str(self.config.api_url),
+                    params=params,
+                    ttl=self.config.http_cache_search_ttl,
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                raise ExternalServiceException(
+                    service_name="TARDIS Wiki",
+                    operation="resolve_titles",
+                    message=f"Title resolution failed: {', '.join(chunk)}",
+                    status_code=getattr(e, "response", None)
+                    and getattr(e.response, "status_code", None),
+                    cause=e,
+                ) from e
+
+            query = response.json().get("query", {})
+            aliases = self._title_aliases(query)
+            existing = {
+                page["title"]
+                for page in query.get("pages", [])
+                if not page.get("missing") and not page.get("invalid")
+            }
+            for title in chunk:
+                canonical_title = self._canonical_title(title, aliases)
+                if canonical_title in existing:
+                    resolved[title] = canonical_title
+
+        return resolved
+
+    @staticmethod
+    def _title_aliases(query: dict[str, Any]) -> dict[str, str]:
+        return {
+            mapping["from"]: mapping["to"]
+            for mapping in query.get("normalized", []) + query.get("redirects", [])
+        }
+
+    @staticmethod
+    def _canonical_title(title: str, aliases: dict[str, str]) -> str:
+        # Normalization, then up to one redirect
+        for _ in range(2):
+            title = aliases.get(title, title)
+        return title
+
+    async def _get_stored_page(self, page_title: str) -> dict[str, Any] | None:
+        if self.page_store is None:
+            return None
+        stored = await self.page_store.get(page_title)
+        if stored is None:
+            return None
+        # Score against the title that was asked for, as a fetch would
+        return {**stored, "title": page_title}
+
+    async def _get_pages_content(
+        self, page_titles: list[str]
+    ) -> dict[str, dict[str, Any] | None]:
+        """Get the content of several wiki pages.
+
+        Stored pages are reused; the rest come from batched API queries in
+        ``api`` mode, falling back to the rendered page for any page the API
+        returns no extract for.
+        """
+        contents: dict[str, dict[str, Any] | None] = {}
+        pending = []
+        for title in dict.fromkeys(page_titles):
+            stored = await self._get_stored_page(title)
+            if stored is not None:
+                contents[title] = stored
+            else:
+                pending.append(title)
+
+        if pending and self.config.content_fetch_mode == "api":
+            for start in range(0, len(pending), API_TITLES_PER_REQUEST):
+                chunk = pending[start : start + API_TITLES_PER_REQUEST]
+                contents.update(await self._fetch_pages_api(chunk))
+            pending = [title for title in pending if title not in contents]
+
+        fetched = await asyncio.gather(
+            *(self._fetch_page_html(title) for title in pending),
+            return_exceptions=True,
+        )
+        for title, content in zip(pending, fetched, strict=True):
+            if isinstance(content, BaseException):
+                raise content
+            contents[title] = content
+
+        return contents
+
+    async def _fetch_pages_api(
+        self, page_titles: list[str]
+    ) -> dict[str, dict[str, Any] | None]:
+        """Fetch up to 50 pages in one API query, following continuations.
+
+        Returns content for pages with an extract and ``None`` for missing
+        pages; titles left out need the rendered page instead.
+        """
+        params: dict[str, Any] = {
+            "action": "query",
+            "format": "json",
+            "formatversion": 2,
+            "prop": "extracts|pageimages|categories|info",
+            "titles": "|".join(page_titles),
+            "redirects": 1,
+            "exintro": 1,
+            "explaintext": 1,
+            "exlimit": "max",
+            "piprop": "thumbnail",
+            "pithumbsize": 500,
+            "pilimit": "max",
+            "cllimit": "max",
+            "clshow": "!hidden",
+            "inprop": "url",
+        }
+
+        pages: dict[str, dict[str, Any]] = {}
+        aliases: dict[str, str] = {}
+        continuation: dict[str, Any] = {}
+        try:
+            while True:
+                response = await self._get(
+                    str(self.config.api_url),
+                    params={**params, **continuation},
+                    ttl=self.config.http_cache_page_ttl,
+                )
+                response.raise_for_status()
+                data = response.json()
+                query = data.get("query", {})
+
+                aliases.update(self._title_aliases(query))
+                for page in query.get("pages", []):
+                    merged = pages.setdefault(page["title"], {"categories": []})
+                    merged["categories"].extend(page.pop("categories", []))
+                    merged.update(page)
+
+                continuation = data.get("continue")
+                if not continuation:
+                    break
+        except httpx.HTTPError as e:
+            raise ExternalServiceException(
+                service_name="TARDIS Wiki",
+                operation="get_pages_content",
+                message=f"Failed to get page content: {', '.join(page_titles)}",
+                status_code=getattr(e, "response", None)
+                and getattr(e.response, "status_code", None),
+                cause=e,
+            ) from e
+
+        contents: dict[str, dict[str, Any] | None] = {}
+        for title in page_titles:
+            canonical_title = self._canonical_title(title, aliases)
+            page = pages.get(canonical_title)
+            if page is None or page.get("missing") or page.get("invalid"):
+                contents[title] = None
+                continue
+
+            summary = self._extract_summary(page.get("extract", ""))
+            if not summary:
+                continue
+
+            content = {
+                "title": title,
+                "url": page.get("fullurl")
+                or urljoin(
+                    str(self.config.base_url), quote(canonical_title.replace(" ", "_"))
+                ),
+                "content": "",
+                "infobox": {},
+                "categories": [
+                    category["title"].split(":", 1)[-1]
+                    for category in page["categories"]
+                ],
+                "summary": summary,
+                "images": [page["thumbnail"]["source"]]
+                if page.get("thumbnail", {}).get("source")
+                else [],
+            }
+            if self.page_store is not None:
+                await self.page_store.put(
+                    title,
+                    content,
+                    revision_id=page.get("lastrevid"),
+                    canonical_title=canonical_title,
+                )
+            contents[title] = content
+
+        return contents
+
+    def _extract_summary(self, extract: str) -> str:
+        """First substantial paragraph of a plain-text extract."""
+        for paragraph in extract.split("\n"):
+            text = paragraph.strip()
+            if text and len(text) > 50:
+                return self._clean_text(text)
+        return ""
+
     async def _get_page_content(self, page_title: str) -> dict[str, Any] | None:
-        """Get the content of a wiki page."""
+        """Get the content of a wiki page, from the page store when possible."""
+        stored = await self._get_stored_page(page_title)
+        if stored is not None:
+            return stored
+        return await self._fetch_page_html(page_title)
+
+    async def _fetch_page_html(self, page_title: str) -> dict[str, Any] | None:
+        """Fetch and scrape the rendered page."""
         try:
             url = urljoin(
                 str(self.config.base_url), quote(page_title.replace(" ", "_"))
             )
-            if self._session is None:
-                raise ExternalServiceException("Session not initialized")
-            response = await self._session.get(url)
+            response = await self._get(url, ttl=self.config.http_cache_page_ttl)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            # Parsing is CPU-bound; keep it off the event loop
+            scraped = await asyncio.to_thread(self.html_parser.parse, response.text)
 
             content = {
                 "title": page_title,
                 "url": url,
                 "content": "",
                 "infobox": {},
-                "categories": [],
-                "summary": "",
-                "images": [],
+                "categories": scraped.categories,
+                "summary": self._clean_text(scraped.summary),
+                "images": scraped.images,
             }
-
-            # Extract summary - try multiple selectors
-            content_div = soup.find("div", {"class": "mw-parser-output"}) or soup.find(
-                "div", {"id": "mw-content-text"}
-            )
-            if content_div and hasattr(content_div, "find_all"):
-                paragraphs = content_div.find_all("p")
-                for p in paragraphs:
-                    text = p.get_text().strip()
-                    if (
-                        text
-                        and len(text) > 50
-                        and not text.startswith("{{")
-                        and not text.startswith("Fast Times")
-                    ):
-                        content["summary"] = self._clean_text(text)
-                        break
-
-            # Extract infobox
-            infobox = soup.find("table", {"class": "infobox"})
-            if infobox:
-                content["infobox"] = self._extract_infobox_data(soup)
-
-            # Extract categories
-            categories = soup.find_all("a", href=re.compile(r"/wiki/Category:"))
-            content["categories"] = [
-                cat.get_text() for cat in categories if hasattr(cat, "get_text")
-            ]
-
-            # Extract images
-            images = soup.find_all("img", src=re.compile(r"\.jpg|\.png|\.gif", re.I))
-            content["images"] = [
-                img.get("src")
-                for img in images[:3]
-                if hasattr(img, "get") and img.get("src")
-            ]
+            for header, cell in scraped.infobox:
+                key = self._clean_text(header)
+                value = self._clean_text(cell)
+                if key and value:
+                    content["infobox"][key] = value
+
+            if self.page_store is not None:
+                canonical_title, revision_id = self._page_identity(response.text)
+                await self.page_store.put(
+                    page_title,
+                    content,
+                    revision_id=revision_id,
+                    canonical_title=canonical_title,
+                )
 
             return content
 
@@ -283,6 +779,25 @@ class TardisWikiService(WikiService):
                 cause=e,
             ) from e
 
+    @staticmethod
+    def _page_identity(html: str) -> tuple[str | None, int | None]:
+        """Canonical title and revision ID from a rendered page's config."""
+        canonical_title = None
+        revision_id = None
+
+        match = _PAGE_NAME.search(html)
+        if match:
+            try:
+                canonical_title = json.loads(match.group(1)).replace("_", " ")
+            except ValueError:
+                pass
+
+        match = _REVISION_ID.search(html)
+        if match:
+            revision_id = int(match.group(1))
+
+        return canonical_title, revision_id
+
     def _generate_search_queries(self, item: LibraryItem) -> list[str]:
         """Generate search queries for a library item."""
         queries = []
@@ -320,34 +835,6 @@ class TardisWikiService(WikiService):
 
         return queries[:12]  # Increased limit to handle more disambiguation terms
 
-    def _extract_infobox_data(self, infobox_soup: BeautifulSoup) -> dict[str, str]:
-        """Extract structured data from infobox."""
-        data = {}
-
-        try:
-            infobox = infobox_soup.find("table", {"class": "infobox"})
-            if infobox:
-                rows = infobox.find_all("tr")
-                for row in rows:
-                    header = row.find("th")
-                    data_cell = row.find("td")
-
-                    if (
-                        header
-                        and data_cell
-                        and hasattr(header, "get_text")
-                        and hasattr(data_cell, "get_text")
-                    ):
-                        key = self._clean_text(header.get_text())
-                        value = self._clean_text(data_cell.get_text())
-
-                        if key and value:
-                            data[key] = value
-        except Exception as e:
-            logger.warning(f"Failed to extract infobox data: {e}")
-
-        return data
-
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text."""
         if not text:
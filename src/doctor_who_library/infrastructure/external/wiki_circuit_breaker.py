@@ -0,0 +1,132 @@
+"""Circuit breaker guarding TARDIS Wiki traffic during outages."""
+
+import asyncio
+import threading
+import time
+
+from structlog import get_logger
+
+from doctor_who_library.shared.config.settings import WikiSettings
+from doctor_who_library.shared.exceptions.infrastructure import WikiUnavailableException
+
+logger = get_logger()
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class WikiCircuitBreaker:
+    """Stops wiki requests after repeated failures, then probes for recovery.
+
+    After ``failure_threshold`` consecutive requests fail (once their retries
+    are exhausted) the circuit opens and every request is rejected with
+    ``WikiUnavailableException`` without touching the network. Once
+    ``reset_timeout`` seconds have passed, a single probe request is let
+    through: success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._trips = 0
+        self._rejected = 0
+
+    @classmethod
+    def from_settings(cls, config: WikiSettings) -> "WikiCircuitBreaker":
+        return cls(
+            failure_threshold=config.circuit_failure_threshold,
+            reset_timeout=config.circuit_reset_timeout,
+        )
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def _retry_in(self, now: float) -> float:
+        return max(0.0, self._opened_at + self.reset_timeout - now)
+
+    def before_request(self) -> None:
+        """Raise ``WikiUnavailableException`` unless a request may be sent."""
+        with self._lock:
+            if self._state == CLOSED:
+                return
+            now = time.monotonic()
+            if self._state == OPEN and self._retry_in(now) == 0:
+                self._state = HALF_OPEN
+            if self._state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                logger.info("Probing TARDIS Wiki after outage")
+                return
+            self._rejected += 1
+            retry_in = self._retry_in(now)
+
+        raise WikiUnavailableException(
+            operation="request",
+            message=f"circuit open, retrying in {retry_in:.0f}s",
+        )
+
+    def record_success(self) -> None:
+        with self._lock:
+            recovered = self._state != CLOSED
+            self._state = CLOSED
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+        if recovered:
+            logger.info("TARDIS Wiki recovered, circuit closed")
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            self._probe_in_flight = False
+            if self._state == CLOSED and (
+                self._consecutive_failures < self.failure_threshold
+            ):
+                return
+            self._state = OPEN
+            self._opened_at = time.monotonic()
+            self._trips += 1
+            failures = self._consecutive_failures
+
+        logger.warning(
+            f"TARDIS Wiki unavailable after {failures} failed requests, "
+            f"pausing wiki traffic for {self.reset_timeout:.0f}s"
+        )
+
+    def release_probe(self) -> None:
+        """Let another probe through after one ended without an outcome."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    async def wait_until_available(self) -> None:
+        """Sleep until the circuit lets a request through again."""
+        while True:
+            with self._lock:
+                if self._state == CLOSED:
+                    return
+                if self._state == OPEN:
+                    delay = self._retry_in(time.monotonic())
+                elif not self._probe_in_flight:
+                    return
+                else:
+                    # Another caller's probe decides the state
+                    delay = 1.0
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    def stats(self) -> dict[str, str | int | float]:
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "retry_in": round(self._retry_in(time.monotonic()), 3)
+                if self._state == OPEN
+                else 0.0,
+                "trips": self._trips,
+                "rejected": self._rejected,
+            }
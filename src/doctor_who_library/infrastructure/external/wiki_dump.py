@@ -0,0 +1,252 @@
+"""Streaming reader for MediaWiki XML dumps and a wikitext field extractor.
+
+Only what enrichment reads is extracted from each article's wikitext: the
+lead paragraph as plain text, the fields of the first ``{{Infobox ...}}``
+template, the infobox image and the explicit ``[[Category:...]]`` links.
+Categories added by templates are not expanded, since that would need the
+template pages rendered.
+"""
+
+import bz2
+import gzip
+import html
+import re
+import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import IO
+
+from doctor_who_library.infrastructure.external.wiki_html_parser import (
+    is_summary_paragraph,
+)
+
+# Namespaces whose links are not prose
+_HIDDEN_LINK_NAMESPACES = frozenset({"file", "image", "media", "category"})
+
+_TEMPLATE_TOKEN = re.compile(r"\{\{|\}\}")
+_TABLE_TOKEN = re.compile(r"^[ \t]*\{\||^[ \t]*\|\}", re.M)
+_LINK_TOKEN = re.compile(r"\[\[|\]\]")
+_PARAM_TOKEN = re.compile(r"\{\{|\}\}|\[\[|\]\]|\|")
+_INFOBOX_START = re.compile(r"\{\{\s*infobox\b", re.I)
+_CATEGORY_LINK = re.compile(r"\[\[\s*category\s*:\s*([^\]|]+)", re.I)
+_REDIRECT = re.compile(r"^\s*#redirect\s*:?\s*\[\[([^\]|#]+)", re.I)
+_HEADING = re.compile(r"^=+[^=\n].*?=+\s*$", re.M)
+_COMMENT = re.compile(r"<!--.*?-->", re.S)
+_REF = re.compile(r"<ref\b[^>]*/>|<ref\b[^>]*>.*?</ref\s*>", re.I | re.S)
+_TAG = re.compile(r"</?[a-z][^>]*>", re.I)
+_EXTERNAL_LINK = re.compile(r"\[(?:https?:)?//[^\s\]]+\s*([^\]]*)\]")
+_EMPHASIS = re.compile(r"'{2,}")
+_MAGIC_WORD = re.compile(r"__[A-Z]+__")
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_IMAGE_FILE = re.compile(r"\.(?:jpe?g|png|gif|webp|svg)$", re.I)
+
+
+@dataclass
+class DumpPage:
+    """The fields of one article that enrichment reads."""
+
+    title: str
+    summary: str = ""
+    infobox: dict[str, str] = field(default_factory=dict)
+    categories: list[str] = field(default_factory=list)
+    image: str | None = None
+
+
+def normalize_page_title(title: str) -> str:
+    """MediaWiki's canonical form: spaces for underscores, first letter upper."""
+    title = " ".join(title.replace("_", " ").split())
+    return title[:1].upper() + title[1:]
+
+
+def open_dump(path: str) -> IO[bytes]:
+    """Open an ``.xml`` dump, decompressing ``.gz`` and ``.bz2`` on the fly."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.endswith(".bz2"):
+        return bz2.open(path, "rb")
+    if path.endswith(".7z"):
+        raise ValueError("7z dumps must be extracted first (e.g. `7z x dump.xml.7z`)")
+    return open(path, "rb")
+
+
+def iter_dump_pages(stream: IO[bytes]) -> Iterator[tuple[str, str | None, str]]:
+    """Yield ``(title, redirect target, wikitext)`` for each main-namespace page.
+
+    Elements are discarded as soon as they are read, so memory stays flat
+    however large the dump is.
+    """
+    context = ET.iterparse(stream, events=("start", "end"))
+    _, root = next(context)
+    for event, element in context:
+        if event != "end" or _local_name(element.tag) != "page":
+            continue
+
+        title = namespace = redirect = None
+        text = ""
+        for child in element.iter():
+            name = _local_name(child.tag)
+            if name == "title":
+                title = child.text
+            elif name == "ns":
+                namespace = child.text
+            elif name == "redirect":
+                redirect = child.get("title")
+            elif name == "text":
+                text = child.text or ""
+        root.clear()
+
+        if not title or namespace not in (None, "0"):
+            continue
+        if redirect is None:
+            match = _REDIRECT.match(text)
+            if match:
+                redirect = match.group(1)
+        yield title, redirect, text
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def parse_wikitext(title: str, text: str) -> DumpPage:
+    """Extract the lead paragraph, infobox, image and categories."""
+    page = DumpPage(title=title)
+    text = _COMMENT.sub("", text)
+
+    page.categories = list(
+        dict.fromkeys(
+            " ".join(match.group(1).replace("_", " ").split())
+            for match in _CATEGORY_LINK.finditer(text)
+        )
+    )
+
+    heading = _HEADING.search(text)
+    lead = text[: heading.start()] if heading else text
+
+    infobox = _first_infobox(lead)
+    if infobox is not None:
+        for key, value in infobox:
+            if key.lower() == "image" and page.image is None:
+                page.image = _image_file(value)
+            cleaned = wikitext_to_text(value)
+            if key and cleaned:
+                page.infobox[key] = cleaned
+
+    for paragraph in _PARAGRAPH_BREAK.split(wikitext_to_text(lead)):
+        paragraph = " ".join(paragraph.split())
+        if paragraph[:1] in ("*", "#", ":", ";", "|", "!"):
+            continue
+        if is_summary_paragraph(paragraph):
+            page.summary = paragraph
+            break
+
+    return page
+
+
+def wikitext_to_text(text: str) -> str:
+    """Plain text of a wikitext fragment, templates and tables dropped."""
+    text = _REF.sub("", _COMMENT.sub("", text))
+    text = _remove_balanced(text, _TEMPLATE_TOKEN, "{{")
+    text = _remove_balanced(text, _TABLE_TOKEN, None)
+    text = _replace_links(text)
+    text = _EXTERNAL_LINK.sub(r"\1", text)
+    text = _TAG.sub("", text)
+    text = _EMPHASIS.sub("", _MAGIC_WORD.sub("", text))
+    return html.unescape(text).strip()
+
+
+def _remove_balanced(text: str, token: re.Pattern, opener: str | None) -> str:
+    """Drop nested spans delimited by ``token`` matches.
+
+    ``opener`` is the text of an opening token; ``None`` treats a match
+    starting with ``{`` (after whitespace) as opening, for tables.
+    """
+    parts = []
+    depth = 0
+    start = 0
+    for match in token.finditer(text):
+        matched = match.group()
+        opening = matched == opener if opener else matched.lstrip().startswith("{")
+        if opening:
+            if depth == 0:
+                parts.append(text[start : match.start()])
+            depth += 1
+        elif depth:
+            depth -= 1
+            if depth == 0:
+                start = match.end()
+    if depth == 0:
+        parts.append(text[start:])
+    return "".join(parts)
+
+
+def _replace_links(text: str) -> str:
+    """Replace ``[[target|label]]`` with its label, dropping file and
+    category links."""
+    parts = []
+    depth = 0
+    start = 0
+    inner_start = 0
+    for match in _LINK_TOKEN.finditer(text):
+        if match.group() == "[[":
+            if depth == 0:
+                parts.append(text[start : match.start()])
+                inner_start = match.end()
+            depth += 1
+        elif depth:
+            depth -= 1
+            if depth == 0:
+                parts.append(_link_label(text[inner_start : match.start()]))
+                start = match.end()
+    parts.append(text[start:] if depth == 0 else text[start : inner_start - 2])
+    return "".join(parts)
+
+
+def _link_label(inner: str) -> str:
+    target, _, label = inner.partition("|")
+    namespace, colon, _ = target.partition(":")
+    if colon and namespace.strip().lower() in _HIDDEN_LINK_NAMESPACES:
+        return ""
+    if label:
+        return _replace_links(label)
+    return target.lstrip(":").strip()
+
+
+def _first_infobox(text: str) -> list[tuple[str, str]] | None:
+    """Named parameters of the first ``{{Infobox ...}}`` template."""
+    match = _INFOBOX_START.search(text)
+    if match is None:
+        return None
+
+    params: list[str] = []
+    depth = 0
+    start = match.start() + 2
+    for token in _PARAM_TOKEN.finditer(text, match.start()):
+        value = token.group()
+        if value in ("{{", "[["):
+            depth += 1
+        elif value in ("}}", "]]"):
+            depth -= 1
+            if depth == 0:
+                params.append(text[start : token.start()])
+                break
+        elif depth == 1:
+            params.append(text[start : token.start()])
+            start = token.end()
+
+    named = []
+    for param in params[1:]:
+        key, equals, value = param.partition("=")
+        if equals:
+            named.append((key.strip(), value.strip()))
+    return named
+
+
+def _image_file(value: str) -> str | None:
+    """File name from an infobox image value (bare name or ``[[File:...]]``)."""
+    value = value.strip().strip("[]")
+    namespace, colon, rest = value.partition(":")
+    if colon and namespace.strip().lower() in ("file", "image"):
+        value = rest
+    value = value.split("|", 1)[0].strip()
+    return value.replace("_", " ") if _IMAGE_FILE.search(value) else None
@@ -0,0 +1,293 @@
+"""Local, indexed store of a TARDIS Wiki XML dump for offline enrichment."""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+
+from structlog import get_logger
+
+from doctor_who_library.infrastructure.external.wiki_dump import (
+    DumpPage,
+    iter_dump_pages,
+    normalize_page_title,
+    open_dump,
+    parse_wikitext,
+)
+from doctor_who_library.shared.config.settings import WikiSettings
+
+logger = get_logger()
+
+# Pages written per transaction while importing
+IMPORT_BATCH_SIZE = 1000
+
+# Redirect chains longer than this are left unresolved, as by the API
+MAX_REDIRECT_HOPS = 2
+
+# SQLite's default limit on host parameters is 999
+_LOOKUP_CHUNK = 500
+
+_SEARCH_TOKEN = re.compile(r"\w+")
+
+_SCHEMA = """
+CREATE TABLE pages (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL UNIQUE,
+    summary TEXT NOT NULL,
+    infobox TEXT NOT NULL,
+    categories TEXT NOT NULL,
+    image TEXT
+);
+CREATE TABLE redirects (
+    title TEXT PRIMARY KEY,
+    target TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE pages_fts USING fts5(
+    title, summary, content='pages', content_rowid='id'
+);
+"""
+
+
+class WikiDumpStore:
+    """SQLite file of the articles, redirects and fields in a wiki dump.
+
+    ``import_dump`` builds a fresh file next to the current one and swaps it
+    in when done, so lookups keep working during a re-import. Title lookups
+    follow redirects; ``search`` ranks pages by full-text match on title
+    (weighted) and lead paragraph.
+
+    Methods block on disk I/O; call them from a worker thread.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    @classmethod
+    def from_settings(cls, config: WikiSettings) -> "WikiDumpStore":
+        return cls(config.dump_path)
+
+    @property
+    def available(self) -> bool:
+        return os.path.exists(self.path)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            if not self.available:
+                raise FileNotFoundError(
+                    f"No wiki dump store at {self.path}; "
+                    "run `dw-cli wiki import-dump <file>` first"
+                )
+            self._connection = sqlite3.connect(
+                f"file:{self.path}?mode=ro", uri=True, check_same_thread=False
+            )
+        return self._connection
+
+    def import_dump(
+        self,
+        dump_path: str,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> dict[str, int | float]:
+        """Stream-parse a MediaWiki XML dump into a new store file.
+
+        ``on_progress`` is called with the number of pages read after every
+        batch.
+        """
+        started = time.perf_counter()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        building = f"{self.path}.importing"
+        if os.path.exists(building):
+            os.remove(building)
+
+        counts = {"pages": 0, "redirects": 0, "with_summary": 0, "with_infobox": 0}
+        connection = sqlite3.connect(building, isolation_level=None)
+        try:
+            connection.execute("PRAGMA journal_mode=OFF")
+            connection.execute("PRAGMA synchronous=OFF")
+            connection.executescript(_SCHEMA)
+
+            pages: list[tuple] = []
+            redirects: list[tuple[str, str]] = []
+            with open_dump(dump_path) as stream:
+                for title, redirect, text in iter_dump_pages(stream):
+                    if redirect:
+                        redirects.append(
+                            (
+                                normalize_page_title(title),
+                                normalize_page_title(redirect),
+                            )
+                        )
+                    else:
+                        page = parse_wikitext(normalize_page_title(title), text)
+                        pages.append(
+                            (
+                                page.title,
+                                page.summary,
+                                json.dumps(page.infobox),
+                                json.dumps(page.categories),
+                                page.image,
+                            )
+                        )
+                        counts["with_summary"] += bool(page.summary)
+                        counts["with_infobox"] += bool(page.infobox)
+
+                    if len(pages) + len(redirects) >= IMPORT_BATCH_SIZE:
+                        self._write_batch(connection, pages, redirects, counts)
+                        if on_progress is not None:
+                            on_progress(counts["pages"] + counts["redirects"])
+            self._write_batch(connection, pages, redirects, counts)
+
+            connection.execute("INSERT INTO pages_fts(pages_fts) VALUES ('rebuild')")
+            connection.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [
+                    ("source", os.path.abspath(dump_path)),
+                    ("imported_at", time.strftime("%Y-%m-%dT%H:%M:%S")),
+                    *((key, str(value)) for key, value in counts.items()),
+                ],
+            )
+            connection.execute("VACUUM")
+        except BaseException:
+            connection.close()
+            os.remove(building)
+            raise
+        connection.close()
+
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            os.replace(building, self.path)
+
+        counts["seconds"] = round(time.perf_counter() - started, 1)
+        logger.info(f"Imported wiki dump into {self.path}: {counts}")
+        return counts
+
+    @staticmethod
+    def _write_batch(
+        connection: sqlite3.Connection,
+        pages: list[tuple],
+        redirects: list[tuple[str, str]],
+        counts: dict[str, int],
+    ) -> None:
+        connection.execute("BEGIN")
+        connection.executemany(
+            "INSERT OR REPLACE INTO pages (title, summary, infobox, categories, image) "
+            "VALUES (?, ?, ?, ?, ?)",
+            pages,
+        )
+        connection.executemany(
+            "INSERT OR REPLACE INTO redirects (title, target) VALUES (?, ?)", redirects
+        )
+        connection.execute("COMMIT")
+        counts["pages"] += len(pages)
+        counts["redirects"] += len(redirects)
+        pages.clear()
+        redirects.clear()
+
+    def resolve_titles(self, titles: list[str]) -> dict[str, str]:
+        """Map each title naming a stored page, directly or through redirects,
+        to the page's title; titles without a page are left out."""
+        wanted = {title: normalize_page_title(title) for title in titles}
+        with self._lock:
+            connection = self._connect()
+            aliases: dict[str, str] = {}
+            pending = set(wanted.values())
+            for _ in range(MAX_REDIRECT_HOPS):
+                found = self._lookup(
+                    connection, "SELECT title, target FROM redirects", pending
+                )
+                aliases.update(found)
+                pending = set(found.values())
+
+            canonical = {}
+            for title, normalized in wanted.items():
+                for _ in range(MAX_REDIRECT_HOPS):
+                    normalized = aliases.get(normalized, normalized)
+                canonical[title] = normalized
+            existing = self._lookup(
+                connection, "SELECT title, title FROM pages", set(canonical.values())
+            )
+        return {
+            title: target for title, target in canonical.items() if target in existing
+        }
+
+    def get_pages(self, titles: list[str]) -> dict[str, DumpPage]:
+        """Stored pages by exact title; missing titles are left out."""
+        with self._lock:
+            rows = self._lookup(
+                self._connect(),
+                "SELECT title, summary, infobox, categories, image FROM pages",
+                set(titles),
+                whole_row=True,
+            )
+        return {
+            title: DumpPage(
+                title=title,
+                summary=summary,
+                infobox=json.loads(infobox),
+                categories=json.loads(categories),
+                image=image,
+            )
+            for title, (summary, infobox, categories, image) in rows.items()
+        }
+
+    @staticmethod
+    def _lookup(
+        connection: sqlite3.Connection,
+        select: str,
+        titles: set[str],
+        whole_row: bool = False,
+    ) -> dict:
+        found = {}
+        titles_list = list(titles)
+        for start in range(0, len(titles_list), _LOOKUP_CHUNK):
+            chunk = titles_list[start : start + _LOOKUP_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            for row in connection.execute(
+                f"{select} WHERE title IN ({placeholders})", chunk
+            ):
+                found[row[0]] = row[1:] if whole_row else row[1]
+        return found
+
+    def search(self, query: str, limit: int = 5) -> list[str]:
+        """Titles of the pages matching every word of ``query``, best first."""
+        tokens = [f'"{token}"' for token in _SEARCH_TOKEN.findall(query)]
+        if not tokens:
+            return []
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT pages.title FROM pages_fts "
+                    "JOIN pages ON pages.id = pages_fts.rowid "
+                    "WHERE pages_fts MATCH ? "
+                    "ORDER BY bm25(pages_fts, 10.0, 1.0) LIMIT ?",
+                    (" ".join(tokens), limit),
+                )
+                .fetchall()
+            )
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def stats(self) -> dict[str, str] | None:
+        """Import metadata, or ``None`` when no dump has been imported."""
+        if not self.available:
+            return None
+        with self._lock:
+            return dict(self._connect().execute("SELECT key, value FROM meta"))
@@ -0,0 +1,237 @@
+"""Scrapers for rendered TARDIS Wiki pages, over interchangeable HTML parsers.
+
+Only a few regions of a page are read: the first long paragraph of the
+article body, the infobox, category links and the first images. Every
+backend extracts exactly those, and all of them parse the page with its
+``<script>``, ``<style>`` and ``<svg>`` blocks cut out first, since nothing
+read lives there and they are a large share of a fandom page.
+
+``lxml`` and ``selectolax`` are optional; ``html.parser`` (BeautifulSoup)
+always works and is the reference the others match.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+from structlog import get_logger
+
+logger = get_logger()
+
+PARSER_BACKENDS = ("auto", "selectolax", "lxml", "html.parser")
+
+# Fastest first, as picked by "auto"
+_AUTO_ORDER = ("selectolax", "lxml", "html.parser")
+
+MAX_IMAGES = 3
+
+_CATEGORY_HREF = re.compile(r"/wiki/Category:")
+_IMAGE_SRC = re.compile(r"\.jpg|\.png|\.gif", re.I)
+_UNREAD_MARKUP = re.compile(r"<(script|style|svg)\b[^>]*>.*?</\1\s*>", re.I | re.S)
+_CONTENT_DIV_XPATH = (
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' mw-parser-output ')]"
+)
+_INFOBOX_XPATH = (
+    "//table[contains(concat(' ', normalize-space(@class), ' '), ' infobox ')]"
+)
+
+
+def is_summary_paragraph(text: str) -> bool:
+    """Whether a stripped paragraph is long enough to summarize the page."""
+    return (
+        len(text) > 50
+        and not text.startswith("{{")
+        and not text.startswith("Fast Times")
+    )
+
+
+def strip_unread_markup(html: str) -> str:
+    """Drop the blocks no scraped region lives in."""
+    return _UNREAD_MARKUP.sub("", html)
+
+
+@dataclass
+class ScrapedPage:
+    """Raw text of the regions read from a page, before cleaning."""
+
+    summary: str = ""
+    infobox: list[tuple[str, str]] = field(default_factory=list)
+    categories: list[str] = field(default_factory=list)
+    images: list[str] = field(default_factory=list)
+
+
+class WikiHtmlParser(ABC):
+    """Extracts the scraped regions from a rendered page."""
+
+    name: str
+
+    def parse(self, html: str) -> ScrapedPage:
+        html = strip_unread_markup(html)
+        if not html.strip():
+            return ScrapedPage()
+        return self._parse(html)
+
+    @abstractmethod
+    def _parse(self, html: str) -> ScrapedPage:
+        pass
+
+
+class SoupHtmlParser(WikiHtmlParser):
+    """BeautifulSoup with the standard library parser."""
+
+    name = "html.parser"
+
+    def _parse(self, html: str) -> ScrapedPage:
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html, "html.parser")
+        page = ScrapedPage()
+
+        content_div = soup.find("div", {"class": "mw-parser-output"}) or soup.find(
+            "div", {"id": "mw-content-text"}
+        )
+        if content_div:
+            for paragraph in content_div.find_all("p"):
+                text = paragraph.get_text().strip()
+                if is_summary_paragraph(text):
+                    page.summary = text
+                    break
+
+        infobox = soup.find("table", {"class": "infobox"})
+        if infobox:
+            for row in infobox.find_all("tr"):
+                header = row.find("th")
+                cell = row.find("td")
+                if header and cell:
+                    page.infobox.append((header.get_text(), cell.get_text()))
+
+        page.categories = [
+            link.get_text() for link in soup.find_all("a", href=_CATEGORY_HREF)
+        ]
+        page.images = [
+            img["src"] for img in soup.find_all("img", src=_IMAGE_SRC)[:MAX_IMAGES]
+        ]
+        return page
+
+
+class LxmlHtmlParser(WikiHtmlParser):
+    """libxml2's HTML parser through lxml."""
+
+    name = "lxml"
+
+    def __init__(self):
+        import lxml.html
+
+        self._fromstring = lxml.html.document_fromstring
+
+    def _parse(self, html: str) -> ScrapedPage:
+        root = self._fromstring(html)
+        page = ScrapedPage()
+
+        content_div = next(iter(root.xpath(_CONTENT_DIV_XPATH)), None)
+        if content_div is None:
+            content_div = next(iter(root.xpath("//div[@id='mw-content-text']")), None)
+        if content_div is not None:
+            for paragraph in content_div.iter("p"):
+                text = paragraph.text_content().strip()
+                if is_summary_paragraph(text):
+                    page.summary = text
+                    break
+
+        infobox = next(iter(root.xpath(_INFOBOX_XPATH)), None)
+        if infobox is not None:
+            for row in infobox.iter("tr"):
+                header = row.find(".//th")
+                cell = row.find(".//td")
+                if header is not None and cell is not None:
+                    page.infobox.append((header.text_content(), cell.text_content()))
+
+        for element in root.iter("a", "img"):
+            if element.tag == "a":
+                href = element.get("href")
+                if href and _CATEGORY_HREF.search(href):
+                    page.categories.append(element.text_content())
+            elif len(page.images) < MAX_IMAGES:
+                src = element.get("src")
+                if src and _IMAGE_SRC.search(src):
+                    page.images.append(src)
+        return page
+
+
+class SelectolaxHtmlParser(WikiHtmlParser):
+    """The lexbor HTML5 parser through selectolax."""
+
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+
+        self._parser = LexborHTMLParser
+
+    def _parse(self, html: str) -> ScrapedPage:
+        tree = self._parser(html)
+        page = ScrapedPage()
+
+        content_div = tree.css_first("div.mw-parser-output") or tree.css_first(
+            "div#mw-content-text"
+        )
+        if content_div is not None:
+            for paragraph in content_div.css("p"):
+                text = paragraph.text(deep=True).strip()
+                if is_summary_paragraph(text):
+                    page.summary = text
+                    break
+
+        infobox = tree.css_first("table.infobox")
+        if infobox is not None:
+            for row in infobox.css("tr"):
+                header = row.css_first("th")
+                cell = row.css_first("td")
+                if header is not None and cell is not None:
+                    page.infobox.append((header.text(deep=True), cell.text(deep=True)))
+
+        page.categories = [
+            link.text(deep=True) for link in tree.css('a[href*="/wiki/Category:"]')
+        ]
+        for img in tree.css("img[src]"):
+            src = img.attributes.get("src")
+            if src and _IMAGE_SRC.search(src):
+                page.images.append(src)
+                if len(page.images) == MAX_IMAGES:
+                    break
+        return page
+
+
+_BACKENDS: dict[str, type[WikiHtmlParser]] = {
+    parser.name: parser
+    for parser in (SoupHtmlParser, LxmlHtmlParser, SelectolaxHtmlParser)
+}
+
+
+def get_html_parser(backend: str = "auto") -> WikiHtmlParser:
+    """Build the named backend, or the fastest installed one for ``"auto"``.
+
+    A requested backend that is not installed falls back to ``html.parser``.
+    """
+    for name in _AUTO_ORDER if backend == "auto" else (backend, "html.parser"):
+        try:
+            return _BACKENDS[name]()
+        except ImportError:
+            if backend != "auto":
+                logger.warning(
+                    f"HTML parser backend {backend!r} is not installed, "
+                    "falling back to html.parser"
+                )
+    return SoupHtmlParser()
+
+
+def available_backends() -> list[str]:
+    """Names of the backends that can be built here, fastest first."""
+    available = []
+    for name in _AUTO_ORDER:
+        try:
+            _BACKENDS[name]()
+        except ImportError:
+            continue
+        available.append(name)
+    return available
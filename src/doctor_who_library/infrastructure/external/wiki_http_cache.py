@@ -0,0 +1,231 @@
+"""Persistent on-disk cache for TARDIS Wiki HTTP responses."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from urllib.parse import urlencode
+
+from structlog import get_logger
+
+from doctor_who_library.shared.config.settings import WikiSettings
+
+logger = get_logger()
+
+# Response headers replayed on cache hits
+STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+# Evict down to this share of the size limit, so eviction is not per-store
+_EVICT_TARGET = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_responses_accessed_at ON responses (accessed_at);
+"""
+
+
+def cache_key(url: str, params: dict | None = None) -> str:
+    """Key a GET request by URL and sorted query parameters."""
+    if not params:
+        return url
+    query = urlencode(sorted((str(k), str(v)) for k, v in params.items()))
+    return f"{url}?{query}"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A stored 200 response."""
+
+    headers: dict[str, str]
+    body: bytes
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Validators for revalidating this response."""
+        headers = {}
+        if "etag" in self.headers:
+            headers["If-None-Match"] = self.headers["etag"]
+        if "last-modified" in self.headers:
+            headers["If-Modified-Since"] = self.headers["last-modified"]
+        return headers
+
+
+class WikiHttpCache:
+    """SQLite-backed response cache with compressed bodies and LRU eviction.
+
+    Fresh entries are served without a request. Stale ones are revalidated
+    with ``If-None-Match`` / ``If-Modified-Since``, and a 304 renews them.
+    The configured TTLs override the wiki's own ``Cache-Control`` (fandom
+    pages are ``max-age=0``); only ``no-store`` responses are skipped. When
+    the stored size exceeds ``max_bytes`` the least recently used entries
+    are dropped.
+
+    Methods block on disk I/O; call them from a worker thread.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+        self._revalidated = 0
+        self._stores = 0
+        self._evictions = 0
+
+    @classmethod
+    def from_settings(cls, config: WikiSettings) -> "WikiHttpCache | None":
+        """Build the cache described by ``WIKI_HTTP_CACHE_*``, or ``None``."""
+        if not config.http_cache_enabled:
+            return None
+        return cls(config.http_cache_path, config.http_cache_max_mb * 1024 * 1024)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._size = connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+            self._connection = connection
+        return self._connection
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the stored response for ``key``, fresh or stale."""
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT headers, body, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+            headers, body, expires_at = row
+            response = CachedResponse(
+                headers=json.loads(headers),
+                body=zlib.decompress(body),
+                expires_at=expires_at,
+            )
+            if response.fresh:
+                self._hits += 1
+            else:
+                self._stale += 1
+            return response
+
+    def put(self, key: str, headers: dict[str, str], body: bytes, ttl: float) -> None:
+        """Store a 200 response for ``ttl`` seconds."""
+        if "no-store" in headers.get("cache-control", "").lower():
+            return
+        stored = {name: headers[name] for name in STORED_HEADERS if name in headers}
+        compressed = zlib.compress(body, 6)
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            previous = connection.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, headers, body, size, fetched_at, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    json.dumps(stored),
+                    compressed,
+                    len(compressed),
+                    now,
+                    now + ttl,
+                    now,
+                ),
+            )
+            self._size += len(compressed) - (previous[0] if previous else 0)
+            self._stores += 1
+            if self._size > self.max_bytes:
+                self._evict(connection)
+
+    def renew(self, key: str, ttl: float) -> None:
+        """Extend a stale entry after a 304 Not Modified."""
+        now = time.time()
+        with self._lock:
+            self._connect().execute(
+                "UPDATE responses SET expires_at = ?, accessed_at = ? WHERE key = ?",
+                (now + ttl, now, key),
+            )
+            self._revalidated += 1
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        target = self.max_bytes * _EVICT_TARGET
+        evicted = 0
+        connection.execute("BEGIN")
+        for key, size in connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall():
+            if self._size <= target:
+                break
+            connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._size -= size
+            evicted += 1
+        connection.execute("COMMIT")
+        self._evictions += evicted
+        logger.info(f"Evicted {evicted} wiki responses from the HTTP cache")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM responses")
+            self._size = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            entries = (
+                self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+                if self._connection is not None
+                else None
+            )
+            lookups = self._hits + self._stale + self._misses
+            served = self._hits + self._revalidated
+            return {
+                "entries": entries,
+                "size_bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "stale": self._stale,
+                "revalidated": self._revalidated,
+                "misses": self._misses,
+                "hit_rate": served / lookups if lookups else 0.0,
+                "stores": self._stores,
+                "evictions": self._evictions,
+            }
@@ -0,0 +1,122 @@
+"""Application-wide HTTP client for the TARDIS Wiki."""
+
+import asyncio
+from typing import Any
+
+import httpx
+from structlog import get_logger
+
+from doctor_who_library.shared.config.settings import WikiSettings
+
+logger = get_logger()
+
+
+class WikiHttpClient:
+    """One pooled ``httpx.AsyncClient`` shared by every wiki service.
+
+    Connections (and their TLS sessions) stay open between batches and are
+    reused by all enrichment paths, multiplexed over HTTP/2 when the ``h2``
+    package is installed. The API creates the client at startup and closes
+    it at shutdown.
+
+    Pooled connections belong to the event loop that opened them, so a
+    client is built lazily for the running loop and replaced when a new
+    loop asks for one, as happens once per CLI command.
+    """
+
+    def __init__(self, config: WikiSettings):
+        self.config = config
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stats = {
+            "clients_created": 0,
+            "requests": 0,
+            "connections_opened": 0,
+            "tls_handshakes": 0,
+        }
+        self._http_versions: dict[str, int] = {}
+
+    @classmethod
+    def from_settings(cls, config: WikiSettings) -> "WikiHttpClient":
+        return cls(config)
+
+    def get(self) -> httpx.AsyncClient:
+        """The client for the running event loop, built on first use."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            # A client from a finished loop cannot be closed from this one;
+            # its sockets went with that loop
+            self._client = self._build()
+            self._loop = loop
+            self._stats["clients_created"] += 1
+        return self._client
+
+    async def start(self) -> None:
+        """Build the client ahead of the first request."""
+        self.get()
+
+    async def aclose(self) -> None:
+        """Close the pooled connections of the running loop's client."""
+        client, self._client, self._loop = self._client, None, None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+    def _build(self) -> httpx.AsyncClient:
+        http2 = self.config.http2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning(
+                    "HTTP/2 needs the h2 package (pip install 'httpx[http2]'), "
+                    "falling back to HTTP/1.1"
+                )
+                http2 = False
+
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(self.config.timeout),
+            headers={
+                "User-Agent": self.config.user_agent,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            },
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                keepalive_expiry=self.config.keepalive_expiry,
+            ),
+            http2=http2,
+            follow_redirects=True,  # Follow redirects automatically
+            event_hooks={
+                "request": [self._on_request],
+                "response": [self._on_response],
+            },
+        )
+
+    async def _on_request(self, request: httpx.Request) -> None:
+        request.extensions["trace"] = self._trace
+
+    async def _on_response(self, response: httpx.Response) -> None:
+        # Requests that failed before a response are not counted
+        self._stats["requests"] += 1
+        version = response.http_version
+        self._http_versions[version] = self._http_versions.get(version, 0) + 1
+
+    async def _trace(self, event: str, info: dict[str, Any]) -> None:
+        # Only new connections connect and handshake; reused ones skip both
+        if event == "connection.connect_tcp.complete":
+            self._stats["connections_opened"] += 1
+        elif event == "connection.start_tls.complete":
+            self._stats["tls_handshakes"] += 1
+
+    def stats(self) -> dict[str, Any]:
+        requests = self._stats["requests"]
+        reused = max(requests - self._stats["connections_opened"], 0)
+        return {
+            **self._stats,
+            "requests_on_reused_connections": reused,
+            "reuse_ratio": round(reused / requests, 3) if requests else 0.0,
+            "http_versions": dict(self._http_versions),
+            "http2": self.config.http2,
+            "max_connections": self.config.max_connections,
+            "max_keepalive_connections": self.config.max_keepalive_connections,
+        }
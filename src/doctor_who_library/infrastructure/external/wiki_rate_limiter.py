@@ -0,0 +1,188 @@
+"""Process-wide adaptive rate limiter for TARDIS Wiki traffic."""
+
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from structlog import get_logger
+
+from doctor_who_library.shared.config.settings import WikiSettings
+
+logger = get_logger()
+
+# Responses that mean "slow down"
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+# Additive increase per successful request, as a share of the maximum rate
+_RECOVERY_STEP = 0.02
+
+
+def backoff_delay(attempt: int, base: float, maximum: float) -> float:
+    """Exponential backoff with jitter for the given zero-based attempt."""
+    return min(maximum, base * 2**attempt) * random.uniform(0.5, 1.5)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class WikiRateLimiter:
+    """Token bucket shared by every wiki request in the process.
+
+    Requests reserve a slot on a virtual schedule (GCRA): up to ``burst``
+    back-to-back, then one per ``1 / rate`` seconds, served in reservation
+    order. The rate adapts AIMD-style: a throttled response (429/503) halves
+    it and pauses all traffic for ``Retry-After`` or an exponential backoff
+    with jitter; every success nudges it back towards ``max_rate``.
+
+    State is guarded by a thread lock and waits are plain sleeps, so one
+    instance works across event loops (CLI runs) and threads.
+    """
+
+    def __init__(
+        self,
+        max_rate: float,
+        min_rate: float,
+        burst: int = 1,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+    ):
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.burst = max(1, burst)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._lock = threading.Lock()
+        self._rate = max_rate
+        # Theoretical arrival time of the next request
+        self._next_at = 0.0
+        self._blocked_until = 0.0
+        self._consecutive_throttles = 0
+        self._waiting = 0
+        self._requests = 0
+        self._throttled = 0
+        self._waited_seconds = 0.0
+        self._recent: list[float] = []
+
+    @classmethod
+    def from_settings(cls, config: WikiSettings) -> "WikiRateLimiter":
+        return cls(
+            max_rate=config.max_requests_per_second,
+            min_rate=1.0 / config.request_delay if config.request_delay > 0 else 0.1,
+            burst=config.rate_burst,
+            backoff_base=config.backoff_base,
+            backoff_max=config.backoff_max,
+        )
+
+    def _reserve(self, requeue: bool = False) -> float:
+        """Claim the next slot and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            interval = 1.0 / self._rate
+            start = max(
+                now, self._next_at - (self.burst - 1) * interval, self._blocked_until
+            )
+            self._next_at = max(self._next_at, start) + interval
+            if not requeue:
+                self._requests += 1
+            wait = start - now
+            if wait > 0:
+                self._waiting += 1
+                self._waited_seconds += wait
+            return wait
+
+    async def acquire(self) -> None:
+        """Wait for this request's slot.
+
+        A throttle while waiting invalidates the slot, so the request claims
+        a new one behind the pause instead of going out on the old schedule.
+        """
+        throttled = self._throttled
+        wait = self._reserve()
+        while wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+            with self._lock:
+                if self._throttled == throttled:
+                    break
+                throttled = self._throttled
+            wait = self._reserve(requeue=True)
+        self._record_sent()
+
+    def _record_sent(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._recent.append(now)
+            # Keep one minute of send times for the observed rate
+            if self._recent[0] < now - 60:
+                cutoff = next(
+                    (i for i, sent in enumerate(self._recent) if sent >= now - 60),
+                    len(self._recent),
+                )
+                del self._recent[:cutoff]
+
+    def record_success(self) -> None:
+        """Additive increase after a request that was not throttled."""
+        with self._lock:
+            self._consecutive_throttles = 0
+            self._rate = min(self.max_rate, self._rate + self.max_rate * _RECOVERY_STEP)
+
+    def record_throttled(self, retry_after: float | None = None) -> float:
+        """Multiplicative decrease and a global pause after a 429/503.
+
+        Returns the pause applied, in seconds.
+        """
+        with self._lock:
+            self._throttled += 1
+            self._consecutive_throttles += 1
+            self._rate = max(self.min_rate, self._rate / 2)
+
+            if retry_after is None:
+                retry_after = backoff_delay(
+                    self._consecutive_throttles - 1,
+                    self.backoff_base,
+                    self.backoff_max,
+                )
+
+            now = time.monotonic()
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+            # Waiting requests re-queue behind the pause, releasing their slots
+            self._next_at = self._blocked_until
+            rate = self._rate
+
+        logger.warning(
+            f"TARDIS Wiki throttled us, pausing {retry_after:.1f}s "
+            f"and slowing to {rate:.2f} req/s"
+        )
+        return retry_after
+
+    def stats(self) -> dict[str, float | int]:
+        with self._lock:
+            now = time.monotonic()
+            recent = [sent for sent in self._recent if sent >= now - 60]
+            return {
+                "rate_limit": round(self._rate, 3),
+                "max_rate": self.max_rate,
+                "min_rate": self.min_rate,
+                "observed_rate": round(len(recent) / 60, 3),
+                "queue_depth": self._waiting,
+                "paused_for": round(max(0.0, self._blocked_until - now), 3),
+                "requests": self._requests,
+                "throttled": self._throttled,
+                "waited_seconds": round(self._waited_seconds, 3),
+            }
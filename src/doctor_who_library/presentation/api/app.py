@@ -8,10 +8,9 @@ from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from sqlalchemy.ext.asyncio import create_async_engine
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from doctor_who_library.infrastructure.database.models import Base
+from doctor_who_library.infrastructure.database.migrate import upgrade_database
 from doctor_who_library.presentation.api.routes.dev import router as dev_router
 from doctor_who_library.presentation.api.routes.enrichment import (
     router as enrichment_router,
@@ -22,6 +21,8 @@ from doctor_who_library.presentation.api.routes.enrichment_display import (
 from doctor_who_library.presentation.api.routes.library import router as library_router
 from doctor_who_library.shared.config.container import get_container, wire_container
 from doctor_who_library.shared.config.settings import get_settings
+from doctor_who_library.shared.database.connection import close_connection_pool
+from doctor_who_library.shared.database.executor import shutdown_database_executor
 from doctor_who_library.shared.exceptions.base import DoctorWhoLibraryException
 
 logger = structlog.get_logger()
@@ -73,14 +74,21 @@ async def lifespan(app: FastAPI):
     # Wire dependency injection
     wire_container()
 
-    # Create database tables
-    settings = get_settings()
-    engine = create_async_engine(settings.database.url)
+    # Bring the database schema up to date
+    await asyncio.to_thread(upgrade_database)
+
+    logger.info("Database migrations applied")
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Warm the in-memory catalog and suggestion index so the first page
+    # request and keystroke are served from RAM
+    catalog = get_container().library_catalog()
+    if catalog.enabled:
+        await catalog.ensure_loaded()
+    await get_container().library_suggest_index().ensure_loaded()
 
-    logger.info("Database tables created")
+    # One wiki HTTP client for the app's lifetime, so connections and TLS
+    # sessions are reused across enrichment batches
+    await get_container().wiki_http_client().start()
 
     # Start background enrichment task
     enrichment_task = asyncio.create_task(background_enrichment_task())
@@ -95,7 +103,19 @@ async def lifespan(app: FastAPI):
         await enrichment_task
     except asyncio.CancelledError:
         logger.info("Background enrichment task cancelled")
-    await engine.dispose()
+
+    # Persist enrichment results still sitting in the write-behind buffer
+    flushed = await get_container().enrichment_write_buffer().close()
+    logger.info("Flushed pending enrichment writes", count=flushed)
+
+    await get_container().wiki_http_client().aclose()
+
+    http_cache = get_container().wiki_http_cache()
+    if http_cache is not None:
+        http_cache.close()
+
+    shutdown_database_executor()
+    close_connection_pool()
 
 
 def create_app() -> FastAPI:
@@ -240,8 +260,13 @@ def create_app() -> FastAPI:
     # Add health check endpoint
     @app.get("/health")
     async def health_check():
-        """Health check endpoint."""
-        return {"status": "healthy", "service": "Doctor Who Library API"}
+        """Health check endpoint, including the TARDIS Wiki circuit breaker."""
+        wiki = get_container().wiki_circuit_breaker().stats()
+        return {
+            "status": "healthy" if wiki["state"] == "closed" else "degraded",
+            "service": "Doctor Who Library API",
+            "wiki": wiki,
+        }
 
     # Include routers
     app.include_router(library_router)
@@ -23,7 +23,12 @@ from pydantic import BaseModel
 
 from doctor_who_library.application.services.enrichment_service import EnrichmentService
 from doctor_who_library.domain.value_objects.enrichment_status import EnrichmentStatus
-from doctor_who_library.shared.config.container import Container
+from doctor_who_library.infrastructure.database.library_stats import (
+    check_library_stats,
+    get_library_counters,
+    rebuild_library_stats,
+)
+from doctor_who_library.shared.config.container import Container, get_container
 
 logger = structlog.get_logger()
 
@@ -88,7 +93,7 @@ async def get_recent_enrichments(
     try:
         from uuid import UUID
 
-        from doctor_who_library.shared.database.connection import execute_query
+        from doctor_who_library.shared.database.executor import fetch_all
 
         # Build query to get recent enrichments
         query = """
@@ -130,7 +135,7 @@ async def get_recent_enrichments(
         query += " ORDER BY updated_at DESC LIMIT ?"
         query_params.append(str(limit))
 
-        rows = execute_query(query, tuple(query_params))
+        rows = await fetch_all(query, tuple(query_params))
 
         # Convert rows to response objects
         recent_items = []
@@ -219,7 +224,7 @@ async def get_enrichment_summary(
 ) -> dict[str, Any]:
     """Get enrichment activity summary for development monitoring."""
     try:
-        from doctor_who_library.shared.database.connection import execute_query
+        from doctor_who_library.shared.database.executor import fetch_all
 
         # Get counts by status for recent period
         query = f"""
@@ -230,7 +235,7 @@ async def get_enrichment_summary(
             GROUP BY enrichment_status
         """
 
-        rows = execute_query(query)
+        rows = await fetch_all(query)
 
         # Build summary
         summary = {
@@ -246,30 +251,14 @@ async def get_enrichment_summary(
             if isinstance(summary["total_recent"], int):
                 summary["total_recent"] += count
 
-        # Get overall stats using direct database query
-        overall_query = """
-            SELECT enrichment_status, COUNT(*) as count
-            FROM library_items
-            GROUP BY enrichment_status
-        """
-        overall_rows = execute_query(overall_query)
-
-        overall_stats = {}
-        for row in overall_rows:
-            status, count = row
-            overall_stats[status] = count
-
-        # Calculate average confidence for enriched items
-        avg_query = """
-            SELECT AVG(enrichment_confidence)
-            FROM library_items
-            WHERE enrichment_status = 'enriched'
-            AND enrichment_confidence IS NOT NULL
-        """
-        avg_rows = execute_query(avg_query)
-        overall_stats["avg_confidence"] = (
-            avg_rows[0][0] if avg_rows and avg_rows[0][0] else 0.0
-        )
+        # Get overall stats from the materialized counters
+        counters = await get_library_counters()
+        overall_stats = {
+            status: count
+            for status, count in counters["status_counts"].items()
+            if count
+        }
+        overall_stats["avg_confidence"] = counters["avg_confidence"]
 
         summary["overall_stats"] = overall_stats
 
@@ -299,3 +288,74 @@ async def get_enrichment_summary(
         raise HTTPException(
             status_code=500, detail="Failed to retrieve enrichment summary"
         ) from e
+
+
+@router.get("/stats-consistency", response_model=dict[str, Any])
+async def get_stats_consistency(
+    repair: bool = Query(
+        False, description="Rebuild the materialized stats if they have drifted"
+    ),
+) -> dict[str, Any]:
+    """Compare materialized library stats against a full table scan."""
+    try:
+        result = await check_library_stats()
+
+        if repair and not result["consistent"]:
+            logger.warning(
+                f"Materialized stats drifted in {len(result['differences'])} buckets, rebuilding"
+            )
+            await rebuild_library_stats()
+            result["repaired"] = True
+
+        return result
+
+    except Exception as e:
+        logger.error(f"Failed to check stats consistency: {e}")
+        raise HTTPException(
+            status_code=500, detail="Failed to check stats consistency"
+        ) from e
+
+
+@router.get("/cache-stats", response_model=dict[str, Any])
+async def get_cache_stats() -> dict[str, Any]:
+    """Report counters for the in-process caches and catalog snapshot."""
+    container = get_container()
+    http_cache = container.wiki_http_cache()
+    page_store = container.wiki_page_store()
+    return {
+        "library_items": container.library_item_cache().stats(),
+        "catalog": container.library_catalog().stats(),
+        "facets": container.facet_cache().stats(),
+        "suggest": container.library_suggest_index().stats(),
+        "wiki_http": http_cache.stats() if http_cache is not None else None,
+        "wiki_pages": page_store.stats() if page_store is not None else None,
+    }
+
+
+@router.get("/wiki-stats", response_model=dict[str, Any])
+async def get_wiki_stats() -> dict[str, Any]:
+    """Report the shared wiki HTTP client, rate limiter, circuit breaker and
+    dump store."""
+    container = get_container()
+    return {
+        "source": container.config().wiki.source,
+        "http_client": container.wiki_http_client().stats(),
+        "rate_limiter": container.wiki_rate_limiter().stats(),
+        "circuit_breaker": container.wiki_circuit_breaker().stats(),
+        "dump_store": container.wiki_dump_store().stats(),
+    }
+
+
+@router.post("/catalog/reload", response_model=dict[str, Any])
+async def reload_catalog() -> dict[str, Any]:
+    """Reload the in-memory catalog and suggestion index after writes made
+    outside the API."""
+    container = get_container()
+    catalog = container.library_catalog()
+    suggest_index = container.library_suggest_index()
+    catalog.invalidate()
+    suggest_index.invalidate()
+    container.facet_cache().invalidate()
+    await catalog.ensure_loaded()
+    await suggest_index.ensure_loaded()
+    return catalog.stats()
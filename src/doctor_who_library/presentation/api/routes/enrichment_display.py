@@ -29,8 +29,11 @@ from doctor_who_library.domain.models.enrichment_display import (
     EnrichmentDisplayResponse,
     EnrichmentStats,
 )
+from doctor_who_library.infrastructure.database.library_stats import (
+    get_library_counters,
+)
 from doctor_who_library.shared.config.container import Container
-from doctor_who_library.shared.database.connection import execute_query
+from doctor_who_library.shared.database.executor import fetch_all
 
 logger = structlog.get_logger()
 
@@ -142,7 +145,7 @@ async def get_enrichment_display(
 
         # Execute query
         full_query = base_query + " " + " ".join(query_parts)
-        rows = execute_query(full_query, tuple(query_params))
+        rows = await fetch_all(full_query, tuple(query_params))
 
         # Process results
         items = []
@@ -285,65 +288,25 @@ async def get_enrichment_stats(recent_hours: int = 24) -> dict[str, Any]:
     """Get comprehensive enrichment statistics."""
 
     try:
-        # Overall counts
-        overall_query = """
-            SELECT enrichment_status, COUNT(*) as count
-            FROM library_items
-            GROUP BY enrichment_status
-        """
-        overall_rows = execute_query(overall_query)
+        # Overall counts and quality metrics from the materialized counters
+        counters = await get_library_counters()
+        status_counts = counters["status_counts"]
 
         counts = {
-            "total_items": 0,
-            "pending_count": 0,
-            "enriched_count": 0,
-            "failed_count": 0,
-            "skipped_count": 0,
+            "total_items": counters["total_items"],
+            "pending_count": status_counts.get("pending", 0),
+            "enriched_count": status_counts.get("enriched", 0),
+            "failed_count": status_counts.get("failed", 0),
+            "skipped_count": status_counts.get("skipped", 0),
         }
 
-        for row in overall_rows:
-            status, count = row
-            counts["total_items"] += count
-            if status == "pending":
-                counts["pending_count"] = count
-            elif status == "enriched":
-                counts["enriched_count"] = count
-            elif status == "failed":
-                counts["failed_count"] = count
-            elif status == "skipped":
-                counts["skipped_count"] = count
-
-        # Quality metrics
-        quality_query = """
-            SELECT
-                AVG(enrichment_confidence) as avg_confidence,
-                COUNT(CASE WHEN enrichment_confidence >= 0.8 THEN 1 END) as high_confidence,
-                COUNT(CASE WHEN enrichment_confidence >= 0.6 AND enrichment_confidence < 0.8 THEN 1 END) as medium_confidence,
-                COUNT(CASE WHEN enrichment_confidence < 0.6 THEN 1 END) as low_confidence
-            FROM library_items
-            WHERE enrichment_status = 'enriched'
-            AND enrichment_confidence IS NOT NULL
-        """
-        quality_rows = execute_query(quality_query)
-
         quality_stats = {
-            "avg_confidence": 0.0,
-            "high_confidence_count": 0,
-            "medium_confidence_count": 0,
-            "low_confidence_count": 0,
+            "avg_confidence": counters["avg_confidence"],
+            "high_confidence_count": counters["high_confidence_count"],
+            "medium_confidence_count": counters["medium_confidence_count"],
+            "low_confidence_count": counters["low_confidence_count"],
         }
 
-        if quality_rows and quality_rows[0][0] is not None:
-            avg_conf, high_conf, med_conf, low_conf = quality_rows[0]
-            quality_stats.update(
-                {
-                    "avg_confidence": float(avg_conf or 0.0),
-                    "high_confidence_count": int(high_conf or 0),
-                    "medium_confidence_count": int(med_conf or 0),
-                    "low_confidence_count": int(low_conf or 0),
-                }
-            )
-
         # Recent activity
         recent_query = f"""
             SELECT enrichment_status, COUNT(*) as count
@@ -352,7 +315,7 @@ async def get_enrichment_stats(recent_hours: int = 24) -> dict[str, Any]:
             AND updated_at >= datetime('now', '-{recent_hours} hours')
             GROUP BY enrichment_status
         """
-        recent_rows = execute_query(recent_query)
+        recent_rows = await fetch_all(recent_query)
 
         recent_stats = {
             "recent_activity_hours": recent_hours,
@@ -371,14 +334,7 @@ async def get_enrichment_stats(recent_hours: int = 24) -> dict[str, Any]:
                 recent_stats["recent_skipped"] = count
 
         # Wiki coverage
-        wiki_query = """
-            SELECT COUNT(*) as count
-            FROM library_items
-            WHERE enrichment_status = 'enriched'
-            AND (wiki_url IS NOT NULL OR wiki_summary IS NOT NULL OR wiki_image_url IS NOT NULL)
-        """
-        wiki_rows = execute_query(wiki_query)
-        wiki_coverage = int(wiki_rows[0][0] or 0) if wiki_rows else 0
+        wiki_coverage = counters["items_with_wiki_data"]
 
         # Progress calculations
         processed_count = (
@@ -1,5 +1,8 @@
 """Modern API routes for library operations."""
 
+import base64
+import binascii
+import json
 from datetime import datetime
 from typing import Any
 from uuid import UUID
@@ -7,9 +10,15 @@ from uuid import UUID
 import structlog
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
 
 from doctor_who_library.application.services.library_service import LibraryService
+from doctor_who_library.domain.entities.library_item import LibraryItem
+from doctor_who_library.infrastructure.database.library_item_mapper import (
+    columns_for_fields,
+)
 from doctor_who_library.shared.config.container import Container
 from doctor_who_library.shared.exceptions.application import ServiceException
 from doctor_who_library.shared.exceptions.domain import EntityNotFoundException
@@ -70,15 +79,128 @@ class PaginatedLibraryResponse(BaseModel):
 
     items: list[LibraryItemResponse]
     total: int
-    page: int
+    page: int | None
     size: int
     pages: int
+    next_cursor: str | None = None
+
+
+class LibraryFacetsResponse(BaseModel):
+    """Response model for faceted counts."""
+
+    total: int
+    facets: dict[str, dict[str, int]]
+
+
+class LibrarySuggestionResponse(BaseModel):
+    """Response model for a single autocomplete suggestion."""
+
+    id: UUID
+    title: str | None = None
+    story_title: str | None = None
+    episode_title: str | None = None
+    serial_title: str | None = None
+    content_type: str | None = None
+    section_name: str | None = None
+    doctor: str | None = None
+    matched_field: str
+    matched: str | None = None
+
+
+MAX_BATCH_IDS = 500
+
+
+class LibraryItemBatchRequest(BaseModel):
+    """Request model for batch item lookup."""
+
+    ids: list[UUID] = Field(..., max_length=MAX_BATCH_IDS)
+
+
+class LibraryItemBatchResponse(BaseModel):
+    """Response model for batch item lookup."""
+
+    items: list[LibraryItemResponse]
+    missing: list[UUID]
 
 
 # Create router
 router = APIRouter(prefix="/api/library", tags=["library"])
 
 
+def encode_items_cursor(rowid: int, item_id: UUID) -> str:
+    """Encode the position after an item as an opaque cursor."""
+    payload = json.dumps({"rowid": rowid, "id": item_id.hex}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_items_cursor(cursor: str) -> tuple[int, UUID]:
+    """Decode a cursor from ``encode_items_cursor`` into its rowid and item ID."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        rowid = data["rowid"]
+        item_id = UUID(hex=data["id"])
+    except (binascii.Error, ValueError, KeyError, TypeError, AttributeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor format") from None
+    if not isinstance(rowid, int):
+        raise HTTPException(status_code=400, detail="Invalid cursor format")
+    return rowid, item_id
+
+
+# Named projections accepted by the ``fields`` parameter
+FIELD_PROJECTIONS: dict[str, tuple[str, ...]] = {
+    "card": (
+        "id",
+        "title",
+        "display_title",
+        "story_title",
+        "content_type",
+        "section_name",
+        "group_name",
+        "doctor",
+        "enrichment_status",
+        "wiki_image_url",
+    ),
+    "detail": tuple(LibraryItemResponse.model_fields),
+}
+
+
+def parse_fields(fields: str | None) -> tuple[str, ...] | None:
+    """Resolve a ``fields`` parameter to response field names.
+
+    Accepts field names and projection names, comma-separated. Returns
+    ``None`` when every field is wanted.
+    """
+    if not fields:
+        return None
+
+    selected = {"id"}
+    for name in (part.strip() for part in fields.split(",")):
+        if not name:
+            continue
+        if name in FIELD_PROJECTIONS:
+            selected.update(FIELD_PROJECTIONS[name])
+        elif name in LibraryItemResponse.model_fields:
+            selected.add(name)
+        else:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown field '{name}'. Valid projections: {list(FIELD_PROJECTIONS)}; "
+                f"valid fields: {list(LibraryItemResponse.model_fields)}",
+            )
+
+    if len(selected) == len(LibraryItemResponse.model_fields):
+        return None
+    return tuple(
+        field for field in LibraryItemResponse.model_fields if field in selected
+    )
+
+
+def project_item(item: LibraryItem, fields: tuple[str, ...]) -> dict[str, Any]:
+    """Serialize only the selected fields of an item."""
+    return jsonable_encoder({field: getattr(item, field) for field in fields})
+
+
 @router.get("/sections/validate/{section_name}", response_model=dict[str, Any])
 @inject
 async def validate_section_name(
@@ -106,14 +228,46 @@ async def get_library_items(
         50, ge=1, description="Number of items to return (no upper limit)"
     ),
     offset: int = Query(0, ge=0, description="Number of items to skip"),
+    cursor: str
+    | None = Query(
+        None,
+        description="Opaque cursor from next_cursor; takes precedence over offset",
+    ),
     section: str | None = Query(None, description="Filter by section"),
     group: str | None = Query(None, description="Filter by group"),
     enrichment_status: str
     | None = Query(None, description="Filter by enrichment status"),
+    fields: str
+    | None = Query(
+        None,
+        description="Comma-separated fields and/or projections (card, detail)",
+    ),
     service: LibraryService = Depends(Provide[Container.library_service]),
 ) -> PaginatedLibraryResponse:
-    """Get paginated library items with optional filtering."""
+    """Get paginated library items with optional filtering.
+
+    Filters can be combined and are applied by the in-memory catalog or in
+    SQL, never by loading every match. Items come in chronology order.
+    Passing ``next_cursor`` back as ``cursor`` pages by key, so deep pages
+    cost the same as the first and rows updated mid-scroll are neither
+    repeated nor skipped. A cursor whose item was deleted or renumbered is
+    rejected. ``page`` and ``pages`` describe offset paging; ``page`` is
+    null in cursor mode. ``fields`` trims each item to the given fields or
+    projections.
+    """
     try:
+        selected_fields = parse_fields(fields)
+        after_rowid = None
+        if cursor:
+            after_rowid, cursor_item_id = decode_items_cursor(cursor)
+            if await service.get_item_rowid(cursor_item_id) != after_rowid:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Cursor no longer points at an item; restart paging",
+                )
+            offset = 0
+
+        status_enum = None
         if enrichment_status:
             # Validate and convert string to enum
             from doctor_who_library.domain.value_objects.enrichment_status import (
@@ -129,29 +283,47 @@ async def get_library_items(
                     detail=f"Invalid enrichment_status '{enrichment_status}'. Valid values: {valid_statuses}",
                 ) from None
 
-            items = await service.get_items_by_status(status_enum)
-            total = len(items)
-            items = items[offset : offset + limit]
-        elif section:
+        if section:
             try:
-                items = await service.get_items_by_section(section)
-                total = len(items)
-                items = items[offset : offset + limit]
-            except ValueError as e:
+                section = await service.validate_section_name(section)
+            except ServiceException as e:
                 raise HTTPException(status_code=400, detail=str(e)) from e
-        elif group:
-            items = await service.get_items_by_group(group)
-            total = len(items)
-            items = items[offset : offset + limit]
-        else:
-            # For unfiltered results, get total count efficiently
-            total = await service.get_total_count()
-            items = await service.get_all_items(limit=limit, offset=offset)
+
+        filters = {
+            "section_name": section or None,
+            "group_name": group or None,
+            "status": status_enum,
+        }
+        total = await service.count_items(**filters)
+        items, next_rowid = await service.find_items(
+            **filters,
+            limit=limit,
+            offset=offset,
+            after_rowid=after_rowid,
+            columns=columns_for_fields(selected_fields) if selected_fields else None,
+        )
+        next_cursor = (
+            encode_items_cursor(next_rowid, items[-1].id)
+            if next_rowid is not None
+            else None
+        )
 
         # Calculate pagination info
-        page = (offset // limit) + 1 if limit > 0 else 1
+        page = None if after_rowid is not None else (offset // limit) + 1
         pages = (total + limit - 1) // limit if limit > 0 else 1
 
+        if selected_fields:
+            return JSONResponse(
+                {
+                    "items": [project_item(item, selected_fields) for item in items],
+                    "total": total,
+                    "page": page,
+                    "size": limit,
+                    "pages": pages,
+                    "next_cursor": next_cursor,
+                }
+            )
+
         # Convert items to response format with proper error handling
         response_items = []
         for item in items:
@@ -173,6 +345,51 @@ async def get_library_items(
             page=page,
             size=limit,
             pages=pages,
+            next_cursor=next_cursor,
+        )
+    except HTTPException:
+        raise
+    except ServiceException as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error") from e
+
+
+@router.post("/items:batch", response_model=LibraryItemBatchResponse)
+@inject
+async def get_library_items_batch(
+    request: LibraryItemBatchRequest,
+    fields: str
+    | None = Query(
+        None,
+        description="Comma-separated fields and/or projections (card, detail)",
+    ),
+    service: LibraryService = Depends(Provide[Container.library_service]),
+) -> LibraryItemBatchResponse:
+    """Get many library items by ID in one request.
+
+    Items come back in request order (duplicates collapsed); IDs that do not
+    exist are listed in ``missing``.
+    """
+    selected_fields = parse_fields(fields)
+    try:
+        found = await service.get_items_by_ids(request.ids)
+
+        ordered_ids = list(dict.fromkeys(request.ids))
+        items = [found[item_id] for item_id in ordered_ids if item_id in found]
+        missing = [item_id for item_id in ordered_ids if item_id not in found]
+
+        if selected_fields:
+            return JSONResponse(
+                {
+                    "items": [project_item(item, selected_fields) for item in items],
+                    "missing": jsonable_encoder(missing),
+                }
+            )
+
+        return LibraryItemBatchResponse(
+            items=[LibraryItemResponse.model_validate(item) for item in items],
+            missing=missing,
         )
     except ServiceException as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -184,11 +401,19 @@ async def get_library_items(
 @inject
 async def get_library_item(
     item_id: UUID,
+    fields: str
+    | None = Query(
+        None,
+        description="Comma-separated fields and/or projections (card, detail)",
+    ),
     service: LibraryService = Depends(Provide[Container.library_service]),
 ) -> LibraryItemResponse:
     """Get a specific library item by ID."""
+    selected_fields = parse_fields(fields)
     try:
         item = await service.get_item_by_id(item_id)
+        if selected_fields:
+            return JSONResponse(project_item(item, selected_fields))
         return LibraryItemResponse.model_validate(item)
     except EntityNotFoundException as e:
         raise HTTPException(status_code=404, detail="Library item not found") from e
@@ -203,10 +428,22 @@ async def get_library_item(
 async def search_library_items(
     q: str = Query(..., min_length=1, description="Search query"),
     limit: int = Query(50, ge=1, description="Maximum results (no upper limit)"),
+    fields: str
+    | None = Query(
+        None,
+        description="Comma-separated fields and/or projections (card, detail)",
+    ),
     service: LibraryService = Depends(Provide[Container.library_service]),
 ) -> list[LibraryItemResponse]:
     """Search library items by query."""
+    selected_fields = parse_fields(fields)
     try:
+        if selected_fields:
+            items = await service.search_items(
+                q, limit=limit, columns=columns_for_fields(selected_fields)
+            )
+            return JSONResponse([project_item(item, selected_fields) for item in items])
+
         items = await service.search_items(q, limit=limit)
         return [LibraryItemResponse.model_validate(item) for item in items]
     except ServiceException as e:
@@ -215,6 +452,24 @@ async def search_library_items(
         raise HTTPException(status_code=500, detail="Internal server error") from e
 
 
+@router.get("/suggest", response_model=list[LibrarySuggestionResponse])
+@inject
+async def suggest_library_items(
+    q: str = Query(..., min_length=1, description="Partially typed title"),
+    limit: int = Query(8, ge=1, le=50, description="Maximum suggestions"),
+    service: LibraryService = Depends(Provide[Container.library_service]),
+) -> list[LibrarySuggestionResponse]:
+    """Suggest items whose title, story or serial title has a word starting
+    with the query, for search-as-you-type."""
+    try:
+        suggestions = await service.suggest(q, limit=limit)
+        return [LibrarySuggestionResponse(**suggestion) for suggestion in suggestions]
+    except ServiceException as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error") from e
+
+
 @router.get("/stats", response_model=LibraryStatsResponse)
 @inject
 async def get_library_stats(
@@ -230,6 +485,59 @@ async def get_library_stats(
         raise HTTPException(status_code=500, detail="Internal server error") from e
 
 
+@router.get("/facets", response_model=LibraryFacetsResponse)
+@inject
+async def get_library_facets(
+    section: str | None = Query(None, description="Filter by section"),
+    group: str | None = Query(None, description="Filter by group"),
+    content_type: str | None = Query(None, description="Filter by content type"),
+    doctor: str | None = Query(None, description="Filter by doctor"),
+    enrichment_status: str
+    | None = Query(None, description="Filter by enrichment status"),
+    service: LibraryService = Depends(Provide[Container.library_service]),
+) -> LibraryFacetsResponse:
+    """Get item counts per section, group, content type, doctor and status.
+
+    Each facet is conditioned on every other selected filter, so picking a
+    section narrows the group and doctor counts while still listing the
+    other sections.
+    """
+    status_enum = None
+    if enrichment_status:
+        from doctor_who_library.domain.value_objects.enrichment_status import (
+            EnrichmentStatus,
+        )
+
+        try:
+            status_enum = EnrichmentStatus(enrichment_status)
+        except ValueError:
+            valid_statuses = [status.value for status in EnrichmentStatus]
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid enrichment_status '{enrichment_status}'. Valid values: {valid_statuses}",
+            ) from None
+
+    if section:
+        try:
+            section = await service.validate_section_name(section)
+        except ServiceException as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+
+    try:
+        result = await service.get_facets(
+            section_name=section or None,
+            group_name=group or None,
+            status=status_enum,
+            content_type=content_type or None,
+            doctor=doctor or None,
+        )
+        return LibraryFacetsResponse(**result)
+    except ServiceException as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error") from e
+
+
 @router.get("/sections", response_model=list[str])
 @inject
 async def get_library_sections(
@@ -254,9 +562,9 @@ async def get_library_groups(
     """Get all unique library groups."""
     try:
         # Use a direct database query to get distinct groups efficiently
-        from doctor_who_library.shared.database.connection import execute_query
+        from doctor_who_library.shared.database.executor import fetch_all
 
-        rows = execute_query(
+        rows = await fetch_all(
             "SELECT DISTINCT group_name FROM library_items WHERE group_name IS NOT NULL ORDER BY group_name"
         )
 
@@ -19,7 +19,11 @@ from rich.table import Table
 from doctor_who_library.application.services.enrichment_service import EnrichmentService
 from doctor_who_library.application.services.library_service import LibraryService
 from doctor_who_library.domain.value_objects.enrichment_status import EnrichmentStatus
-from doctor_who_library.shared.config.container import Container, wire_container
+from doctor_who_library.shared.config.container import (
+    Container,
+    get_container,
+    wire_container,
+)
 from doctor_who_library.shared.exceptions.base import DoctorWhoLibraryException
 
 console = Console()
@@ -313,6 +317,99 @@ async def reset_enrichment(
         raise click.ClickException(str(e)) from e
 
 
+@cli.command()
+@click.option(
+    "--revision",
+    default="head",
+    help="Target migration revision",
+)
+def migrate(revision: str):
+    """Apply database migrations."""
+    try:
+        from doctor_who_library.infrastructure.database.migrate import upgrade_database
+
+        console.print(f"🗄️ Upgrading database to revision [bold]{revision}[/bold]...")
+        upgrade_database(revision=revision)
+        console.print("✅ [green]Database is up to date[/green]")
+
+    except Exception as e:
+        console.print(f"❌ [red]Migration failed: {e}[/red]")
+        raise click.ClickException(str(e)) from e
+
+
+@cli.command()
+def vacuum():
+    """Compact the database and rebuild the full-text search index."""
+    try:
+        from doctor_who_library.infrastructure.database.library_search import (
+            vacuum_database,
+        )
+
+        console.print("🧹 Vacuuming database...")
+        vacuum_database()
+        console.print("✅ [green]Database compacted, search index rebuilt[/green]")
+
+    except Exception as e:
+        console.print(f"❌ [red]Vacuum failed: {e}[/red]")
+        raise click.ClickException(str(e)) from e
+
+
+@cli.group()
+def wiki():
+    """TARDIS Wiki data commands."""
+
+
+@wiki.command("import-dump")
+@click.argument("dump_file", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--output",
+    default=None,
+    help="Store file to build (defaults to WIKI_DUMP_PATH)",
+)
+def import_dump(dump_file: str, output: str | None):
+    """Import a MediaWiki XML dump (.xml, .xml.gz, .xml.bz2) for offline
+    enrichment with WIKI_SOURCE=offline."""
+    try:
+        from doctor_who_library.infrastructure.external.wiki_dump_store import (
+            WikiDumpStore,
+        )
+        from doctor_who_library.shared.config.settings import get_settings
+
+        store = WikiDumpStore(output or get_settings().wiki.dump_path)
+        console.print(f"📥 Importing [bold]{dump_file}[/bold] into {store.path}...")
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            TimeElapsedColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Reading pages", total=None)
+            counts = store.import_dump(
+                dump_file,
+                on_progress=lambda read: progress.update(
+                    task, description=f"Read {read:,} pages"
+                ),
+            )
+
+        table = Table(title="Wiki Dump Import")
+        table.add_column("Metric", style="cyan")
+        table.add_column("Count", style="magenta")
+        table.add_row("Articles", f"{counts['pages']:,}")
+        table.add_row("Redirects", f"{counts['redirects']:,}")
+        table.add_row("With lead paragraph", f"{counts['with_summary']:,}")
+        table.add_row("With infobox", f"{counts['with_infobox']:,}")
+        table.add_row("Seconds", str(counts["seconds"]))
+        console.print(table)
+        console.print(
+            "✅ [green]Set WIKI_SOURCE=offline to enrich from this dump[/green]"
+        )
+
+    except Exception as e:
+        console.print(f"❌ [red]Import failed: {e}[/red]")
+        raise click.ClickException(str(e)) from e
+
+
 @cli.command()
 def serve():
     """Start the API server."""
@@ -505,8 +602,15 @@ def main():
 
     # Convert async commands to sync
     def make_sync(async_func):
+        async def run(*args, **kwargs):
+            try:
+                return await async_func(*args, **kwargs)
+            finally:
+                # Close the shared wiki connections on the loop that opened them
+                await get_container().wiki_http_client().aclose()
+
         def wrapper(*args, **kwargs):
-            return asyncio.run(async_func(*args, **kwargs))
+            return asyncio.run(run(*args, **kwargs))
 
         return wrapper
 
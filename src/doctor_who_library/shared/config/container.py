@@ -5,10 +5,28 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from doctor_who_library.application.services.enrichment_service import EnrichmentService
+from doctor_who_library.application.services.enrichment_write_buffer import (
+    EnrichmentWriteBuffer,
+)
+from doctor_who_library.application.services.library_catalog import LibraryCatalog
+from doctor_who_library.application.services.library_facets import FacetCache
+from doctor_who_library.application.services.library_item_cache import LibraryItemCache
 from doctor_who_library.application.services.library_service import LibraryService
+from doctor_who_library.application.services.library_suggest import LibrarySuggestIndex
+from doctor_who_library.infrastructure.database.wiki_page_store import WikiPageStore
+from doctor_who_library.infrastructure.external.offline_wiki_service import (
+    OfflineWikiService,
+)
 from doctor_who_library.infrastructure.external.tardis_wiki_service import (
     TardisWikiService,
 )
+from doctor_who_library.infrastructure.external.wiki_circuit_breaker import (
+    WikiCircuitBreaker,
+)
+from doctor_who_library.infrastructure.external.wiki_dump_store import WikiDumpStore
+from doctor_who_library.infrastructure.external.wiki_http_cache import WikiHttpCache
+from doctor_who_library.infrastructure.external.wiki_http_client import WikiHttpClient
+from doctor_who_library.infrastructure.external.wiki_rate_limiter import WikiRateLimiter
 from doctor_who_library.shared.config.settings import get_settings
 
 
@@ -33,20 +51,105 @@ class Container(containers.DeclarativeContainer):
     )
 
     # External Services
-    wiki_service = providers.Factory(
-        TardisWikiService,
+    wiki_http_client = providers.Singleton(
+        WikiHttpClient.from_settings,
+        config=config.provided.wiki,
+    )
+
+    wiki_http_cache = providers.Singleton(
+        WikiHttpCache.from_settings,
+        config=config.provided.wiki,
+    )
+
+    wiki_page_store = providers.Singleton(
+        WikiPageStore.from_settings,
+        config=config.provided.wiki,
+    )
+
+    wiki_rate_limiter = providers.Singleton(
+        WikiRateLimiter.from_settings,
+        config=config.provided.wiki,
+    )
+
+    wiki_circuit_breaker = providers.Singleton(
+        WikiCircuitBreaker.from_settings,
         config=config.provided.wiki,
     )
 
+    wiki_dump_store = providers.Singleton(
+        WikiDumpStore.from_settings,
+        config=config.provided.wiki,
+    )
+
+    # WIKI_SOURCE picks HTTP or the imported dump
+    wiki_service = providers.Selector(
+        config.provided.wiki.source,
+        online=providers.Factory(
+            TardisWikiService,
+            config=config.provided.wiki,
+            http_cache=wiki_http_cache,
+            page_store=wiki_page_store,
+            rate_limiter=wiki_rate_limiter,
+            circuit_breaker=wiki_circuit_breaker,
+            http_client=wiki_http_client,
+        ),
+        offline=providers.Factory(
+            OfflineWikiService,
+            config=config.provided.wiki,
+            dump_store=wiki_dump_store,
+        ),
+    )
+
+    # Caches
+    library_item_cache = providers.Singleton(
+        LibraryItemCache,
+        max_size=config.provided.cache.item_cache_size,
+        ttl_seconds=config.provided.cache.item_cache_ttl,
+    )
+
+    library_catalog = providers.Singleton(
+        LibraryCatalog,
+        enabled=config.provided.cache.catalog_enabled,
+    )
+
+    facet_cache = providers.Singleton(
+        FacetCache,
+        max_entries=config.provided.cache.facet_cache_size,
+    )
+
+    library_suggest_index = providers.Singleton(LibrarySuggestIndex)
+
     # Application Services
     library_service = providers.Factory(
         LibraryService,
+        item_cache=library_item_cache,
+        catalog=library_catalog,
+        facet_cache=facet_cache,
+        suggest_index=library_suggest_index,
+    )
+
+    enrichment_write_buffer = providers.Singleton(
+        EnrichmentWriteBuffer,
+        flush_size=config.provided.enrichment.write_batch_size,
+        flush_interval_ms=config.provided.enrichment.write_flush_interval_ms,
+        # Read models refresh before the item cache is invalidated, so a
+        # concurrent read cannot re-cache a row from before the flush
+        flush_listeners=providers.List(
+            library_catalog.provided.refresh_items,
+            library_suggest_index.provided.refresh_items,
+            facet_cache.provided.invalidate,
+            library_item_cache.provided.invalidate_many,
+        ),
     )
 
     enrichment_service = providers.Factory(
         EnrichmentService,
         wiki_service=wiki_service,
         config=config.provided.enrichment,
+        write_buffer=enrichment_write_buffer,
+        item_cache=library_item_cache,
+        catalog=library_catalog,
+        facet_cache=facet_cache,
     )
 
 
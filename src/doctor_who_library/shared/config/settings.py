@@ -26,6 +26,26 @@ class DatabaseSettings(BaseSettings):
         default=10,
         description="Maximum overflow connections",
     )
+    pool_timeout: float = Field(
+        default=30.0,
+        description="Seconds to wait for a free pooled connection",
+    )
+    busy_timeout_ms: int = Field(
+        default=5000,
+        description="SQLite busy_timeout applied to each connection in milliseconds",
+    )
+    cache_size_kib: int = Field(
+        default=16384,
+        description="SQLite page cache size per connection in KiB",
+    )
+    mmap_size: int = Field(
+        default=256 * 1024 * 1024,  # 256MB
+        description="SQLite memory-mapped I/O size per connection in bytes",
+    )
+    wal_mode: bool = Field(
+        default=True,
+        description="Use write-ahead logging for concurrent readers and writers",
+    )
 
     model_config = {"env_prefix": "DATABASE_"}
 
@@ -51,16 +71,111 @@ class WikiSettings(BaseSettings):
     )
     request_delay: float = Field(
         default=1.0,
-        description="Delay between requests in seconds",
+        gt=0,
+        description="Slowest request spacing in seconds the rate limiter backs off to",
+    )
+    max_requests_per_second: float = Field(
+        default=4.0,
+        gt=0,
+        description="Request rate the shared wiki rate limiter runs at while unthrottled",
+    )
+    rate_burst: int = Field(
+        default=4,
+        ge=1,
+        description="Requests allowed back-to-back before the rate limit applies",
+    )
+    backoff_base: float = Field(
+        default=1.0,
+        description="First pause in seconds after a throttled response without Retry-After",
+    )
+    backoff_max: float = Field(
+        default=60.0,
+        description="Longest pause in seconds between throttled retries",
+    )
+    max_connections: int = Field(
+        default=10,
+        ge=1,
+        description="Connections the shared wiki HTTP client may open at once",
+    )
+    max_keepalive_connections: int = Field(
+        default=5,
+        ge=0,
+        description="Idle wiki connections kept open for reuse",
+    )
+    keepalive_expiry: float = Field(
+        default=30.0,
+        description="Seconds an idle wiki connection is kept open",
+    )
+    http2: bool = Field(
+        default=True,
+        description="Use HTTP/2 for wiki requests (needs the h2 package)",
     )
     max_retries: int = Field(
         default=3,
         description="Maximum number of retries for failed requests",
     )
+    circuit_failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        description="Consecutive failed wiki requests that open the circuit breaker",
+    )
+    circuit_reset_timeout: float = Field(
+        default=60.0,
+        description="Seconds the circuit stays open before probing the wiki again",
+    )
     confidence_threshold: float = Field(
         default=0.7,
         description="Minimum confidence threshold for enrichment",
     )
+    http_cache_enabled: bool = Field(
+        default=True,
+        description="Cache wiki responses on disk across runs",
+    )
+    http_cache_path: str = Field(
+        default="data/cache/wiki_http_cache.db",
+        description="SQLite file holding cached wiki responses",
+    )
+    http_cache_max_mb: int = Field(
+        default=512,
+        description="Compressed size at which least recently used responses are evicted",
+    )
+    http_cache_page_ttl: int = Field(
+        default=7 * 24 * 3600,
+        description="Seconds a cached wiki page is served before revalidating",
+    )
+    http_cache_search_ttl: int = Field(
+        default=24 * 3600,
+        description="Seconds a cached search result is served before revalidating",
+    )
+    candidate_concurrency: int = Field(
+        default=3,
+        ge=1,
+        description="Maximum in-flight wiki requests while evaluating one item's candidates",
+    )
+    content_fetch_mode: str = Field(
+        default="api",
+        description='Page content source: "api" (batched MediaWiki query) or "html" (rendered page)',
+    )
+    html_parser: str = Field(
+        default="auto",
+        description='HTML parser for scraped pages: "auto", "selectolax", "lxml" or "html.parser"',
+    )
+    source: str = Field(
+        default="online",
+        description='Where enrichment reads the wiki: "online" (HTTP) or "offline" (imported dump)',
+    )
+    dump_path: str = Field(
+        default="data/wiki/tardis_wiki_dump.db",
+        description="Store built by `dw-cli wiki import-dump` for offline enrichment",
+    )
+    page_store_enabled: bool = Field(
+        default=True,
+        description="Reuse parsed wiki pages stored in the wiki_pages table",
+    )
+    page_store_max_age: int = Field(
+        default=30 * 24 * 3600,
+        description="Seconds before a stored parsed page is refetched (0 = never)",
+    )
 
     @field_validator("confidence_threshold")
     def validate_confidence_threshold(cls, v):
@@ -68,6 +183,26 @@ class WikiSettings(BaseSettings):
             raise ValueError("Confidence threshold must be between 0.0 and 1.0")
         return v
 
+    @field_validator("html_parser")
+    def validate_html_parser(cls, v):
+        if v not in ("auto", "selectolax", "lxml", "html.parser"):
+            raise ValueError(
+                'HTML parser must be "auto", "selectolax", "lxml" or "html.parser"'
+            )
+        return v
+
+    @field_validator("source")
+    def validate_source(cls, v):
+        if v not in ("online", "offline"):
+            raise ValueError('Wiki source must be "online" or "offline"')
+        return v
+
+    @field_validator("content_fetch_mode")
+    def validate_content_fetch_mode(cls, v):
+        if v not in ("api", "html"):
+            raise ValueError('Content fetch mode must be "api" or "html"')
+        return v
+
     model_config = {"env_prefix": "WIKI_"}
 
 
@@ -159,10 +294,41 @@ class EnrichmentSettings(BaseSettings):
         default=60.0,
         description="Delay before retrying failed enrichments in seconds",
     )
+    write_batch_size: int = Field(
+        default=50,
+        description="Number of enrichment results buffered before a batched write",
+    )
+    write_flush_interval_ms: int = Field(
+        default=500,
+        description="Maximum time an enrichment result waits in the write buffer",
+    )
 
     model_config = {"env_prefix": "ENRICHMENT_"}
 
 
+class CacheSettings(BaseSettings):
+    """In-process cache configuration settings."""
+
+    item_cache_size: int = Field(
+        default=1024,
+        description="Maximum number of library items kept in the item cache (0 disables it)",
+    )
+    item_cache_ttl: float = Field(
+        default=300.0,
+        description="Seconds a cached library item stays valid",
+    )
+    facet_cache_size: int = Field(
+        default=256,
+        description="Maximum number of cached facet results (0 disables caching)",
+    )
+    catalog_enabled: bool = Field(
+        default=True,
+        description="Serve library list, filter and count reads from an in-memory snapshot",
+    )
+
+    model_config = {"env_prefix": "CACHE_"}
+
+
 class Settings(BaseSettings):
     """Main application settings."""
 
@@ -178,6 +344,7 @@ class Settings(BaseSettings):
     api: APISettings = Field(default_factory=APISettings)
     logging: LoggingSettings = Field(default_factory=LoggingSettings)
     enrichment: EnrichmentSettings = Field(default_factory=EnrichmentSettings)
+    cache: CacheSettings = Field(default_factory=CacheSettings)
 
     # Application info
     app_name: str = Field(
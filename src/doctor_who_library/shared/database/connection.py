@@ -1,40 +1,212 @@
 """Database connection utilities for direct SQLite access."""
 
+import queue
 import sqlite3
+import threading
 from collections.abc import Generator
 from contextlib import contextmanager
 
-from doctor_who_library.shared.config.settings import get_settings
+from doctor_who_library.shared.config.settings import DatabaseSettings, get_settings
+from doctor_who_library.shared.exceptions.infrastructure import DatabaseException
 
 
-@contextmanager
-def get_sqlite_connection() -> Generator[sqlite3.Connection, None, None]:
-    """Get a SQLite database connection with proper cleanup."""
-    settings = get_settings()
-    # Extract just the filename from the database URL
-    db_path = settings.database.url.split("///")[-1]
+def get_database_path(settings: DatabaseSettings | None = None) -> str:
+    """Extract the SQLite file path from the configured database URL."""
+    settings = settings or get_settings().database
+    return settings.url.split("///")[-1]
+
+
+class SQLiteConnectionPool:
+    """Thread-safe pool of persistent SQLite connections.
+
+    Connections are opened lazily, configured once with the performance
+    pragmas from ``DatabaseSettings`` and then handed back to the pool
+    instead of being closed. Up to ``pool_size`` idle connections are kept
+    open; ``max_overflow`` extra connections may be opened under load and
+    are closed as soon as they are released.
+    """
 
-    conn = sqlite3.connect(db_path)
-    try:
+    def __init__(self, db_path: str, settings: DatabaseSettings):
+        self.db_path = db_path
+        self.settings = settings
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._opened = 0
+        self._closed = False
+
+    @property
+    def max_connections(self) -> int:
+        return self.settings.pool_size + self.settings.max_overflow
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection and apply per-connection pragmas."""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.settings.busy_timeout_ms / 1000,
+            check_same_thread=False,
+        )
         conn.row_factory = sqlite3.Row  # Enable column access by name
+        conn.execute(f"PRAGMA busy_timeout = {int(self.settings.busy_timeout_ms)}")
+        if self.settings.wal_mode:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+        # Negative cache_size is in KiB rather than pages
+        conn.execute(f"PRAGMA cache_size = -{int(self.settings.cache_size_kib)}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.settings.mmap_size)}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """Take an idle connection, opening a new one if the pool allows it."""
+        if self._closed:
+            raise DatabaseException(
+                message="Connection pool has been closed", operation="acquire"
+            )
+
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_open = self._opened < self.max_connections
+            if can_open:
+                self._opened += 1
+
+        if can_open:
+            try:
+                return self._connect()
+            except Exception:
+                with self._lock:
+                    self._opened -= 1
+                raise
+
+        try:
+            return self._idle.get(timeout=self.settings.pool_timeout)
+        except queue.Empty as e:
+            raise DatabaseException(
+                message=(
+                    f"Timed out after {self.settings.pool_timeout}s waiting for "
+                    f"a database connection ({self.max_connections} in use)"
+                ),
+                operation="acquire",
+                cause=e,
+            ) from e
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool, closing it if it is surplus."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            self._discard(conn)
+            return
+
+        if self._closed or self._idle.qsize() >= self.settings.pool_size:
+            self._discard(conn)
+            return
+
+        self._idle.put(conn)
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            self._opened -= 1
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    @contextmanager
+    def connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """Borrow a connection for the duration of the ``with`` block."""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Close every idle connection and refuse further checkouts."""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+    def status(self) -> dict[str, int]:
+        """Report pool occupancy."""
+        idle = self._idle.qsize()
+        return {
+            "pool_size": self.settings.pool_size,
+            "max_overflow": self.settings.max_overflow,
+            "opened": self._opened,
+            "idle": idle,
+            "in_use": self._opened - idle,
+        }
+
+
+_pool: SQLiteConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_connection_pool() -> SQLiteConnectionPool:
+    """Get the process-wide connection pool for the configured database."""
+    global _pool
+
+    settings = get_settings().database
+    db_path = get_database_path(settings)
+
+    pool = _pool
+    if pool is not None and pool.db_path == db_path and not pool._closed:
+        return pool
+
+    with _pool_lock:
+        if _pool is None or _pool.db_path != db_path or _pool._closed:
+            if _pool is not None:
+                _pool.close()
+            _pool = SQLiteConnectionPool(db_path, settings)
+        return _pool
+
+
+def close_connection_pool() -> None:
+    """Close the process-wide connection pool, if one was opened."""
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+@contextmanager
+def get_sqlite_connection() -> Generator[sqlite3.Connection, None, None]:
+    """Get a pooled SQLite database connection."""
+    with get_connection_pool().connection() as conn:
         yield conn
-    finally:
-        conn.close()
 
 
 def execute_query(query: str, params: tuple = ()) -> list:
     """Execute a SELECT query and return results."""
     with get_sqlite_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(query, params)
+        cursor = conn.execute(query, params)
         return cursor.fetchall()
 
 
 def execute_update(query: str, params: tuple = ()) -> int:
     """Execute an UPDATE/INSERT/DELETE query and return affected rows."""
     with get_sqlite_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(query, params)
+        cursor = conn.execute(query, params)
+        affected_rows = cursor.rowcount
+        conn.commit()
+        return affected_rows
+
+
+def execute_many(query: str, seq_of_params: list[tuple]) -> int:
+    """Execute a statement for each parameter tuple in a single transaction."""
+    with get_sqlite_connection() as conn:
+        cursor = conn.executemany(query, seq_of_params)
         affected_rows = cursor.rowcount
         conn.commit()
         return affected_rows
@@ -0,0 +1,84 @@
+"""Non-blocking database access for async call sites.
+
+SQLite calls are blocking, so running them directly inside ``async def``
+handlers stalls the event loop for every query. These helpers run the
+pooled synchronous helpers from ``connection`` on a bounded thread pool
+sized to the connection pool, so concurrent requests no longer serialize
+behind each other or behind the background enrichment task.
+"""
+
+import asyncio
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from doctor_who_library.shared.config.settings import get_settings
+from doctor_who_library.shared.database.connection import execute_many as _execute_many
+from doctor_who_library.shared.database.connection import (
+    execute_query as _execute_query,
+)
+from doctor_who_library.shared.database.connection import (
+    execute_update as _execute_update,
+)
+from doctor_who_library.shared.database.connection import get_sqlite_connection
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _fetch_one(query: str, params: tuple = ()) -> Any | None:
+    """Execute a SELECT query and return only the first row."""
+    with get_sqlite_connection() as conn:
+        return conn.execute(query, params).fetchone()
+
+
+def get_database_executor() -> ThreadPoolExecutor:
+    """Get the shared thread pool used for database work."""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                database = get_settings().database
+                _executor = ThreadPoolExecutor(
+                    max_workers=database.pool_size + database.max_overflow,
+                    thread_name_prefix="sqlite",
+                )
+    return _executor
+
+
+def shutdown_database_executor() -> None:
+    """Wait for in-flight queries and stop the database thread pool."""
+    global _executor
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
+
+async def run_blocking(func: Any, *args: Any) -> Any:
+    """Run a blocking database callable on the shared thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_database_executor(), func, *args)
+
+
+async def fetch_all(query: str, params: tuple = ()) -> list:
+    """Execute a SELECT query off the event loop and return all rows."""
+    return await run_blocking(_execute_query, query, params)
+
+
+async def fetch_one(query: str, params: tuple = ()) -> Any | None:
+    """Execute a SELECT query off the event loop and return the first row."""
+    return await run_blocking(_fetch_one, query, params)
+
+
+async def execute(query: str, params: tuple = ()) -> int:
+    """Execute an UPDATE/INSERT/DELETE off the event loop; return affected rows."""
+    return await run_blocking(_execute_update, query, params)
+
+
+async def execute_many(query: str, seq_of_params: Iterable[tuple]) -> int:
+    """Execute a statement for every parameter tuple in one transaction."""
+    return await run_blocking(_execute_many, query, list(seq_of_params))
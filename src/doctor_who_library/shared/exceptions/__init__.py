@@ -7,6 +7,7 @@ from .infrastructure import (
     DatabaseException,
     ExternalServiceException,
     InfrastructureException,
+    WikiUnavailableException,
 )
 
 __all__ = [
@@ -17,6 +18,7 @@ __all__ = [
     "InfrastructureException",
     "DatabaseException",
     "ExternalServiceException",
+    "WikiUnavailableException",
     "ApplicationException",
     "ServiceException",
 ]
@@ -54,3 +54,25 @@ class ExternalServiceException(InfrastructureException):
             },
             cause=cause,
         )
+
+
+class WikiUnavailableException(ExternalServiceException):
+    """Exception raised while the TARDIS Wiki is unreachable or unhealthy.
+
+    Items hitting it should be retried later, not marked failed.
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        message: str,
+        status_code: int | None = None,
+        cause: Exception | None = None,
+    ):
+        super().__init__(
+            service_name="TARDIS Wiki",
+            operation=operation,
+            message=message,
+            status_code=status_code,
+            cause=cause,
+        )
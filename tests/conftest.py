@@ -0,0 +1,121 @@
+"""Shared fixtures: a migrated throwaway database, the container and an API client."""
+
+import uuid
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from doctor_who_library.infrastructure.database.migrate import upgrade_database
+from doctor_who_library.infrastructure.external.tardis_wiki_service import (
+    TardisWikiService,
+)
+from doctor_who_library.infrastructure.external.wiki_http_client import WikiHttpClient
+from doctor_who_library.presentation.api.app import create_app
+from doctor_who_library.shared.config.container import get_container, wire_container
+from doctor_who_library.shared.config.settings import WikiSettings, get_settings
+from doctor_who_library.shared.database.connection import (
+    close_connection_pool,
+    execute_many,
+)
+from doctor_who_library.shared.database.executor import shutdown_database_executor
+
+ITEM_DEFAULTS: dict[str, Any] = {
+    "title": "",
+    "section_name": None,
+    "group_name": None,
+    "content_type": None,
+    "doctor": None,
+    "story_title": None,
+    "episode_title": None,
+    "serial_title": None,
+    "enrichment_status": "pending",
+    "enrichment_confidence": 0.0,
+    "wiki_url": None,
+    "wiki_summary": None,
+}
+
+
+def _reset_state() -> None:
+    close_connection_pool()
+    shutdown_database_executor()
+    get_settings.cache_clear()
+    get_container().reset_singletons()
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch) -> Iterator[str]:
+    """Point the application at a new SQLite file migrated to head."""
+    path = tmp_path / "library.db"
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{path}")
+    monkeypatch.setenv("WIKI_HTTP_CACHE_ENABLED", "false")
+    _reset_state()
+    upgrade_database()
+    yield str(path)
+    _reset_state()
+
+
+@pytest.fixture
+def add_items(database) -> Callable[..., list[str]]:
+    """Insert library items (dicts of column overrides); returns hex IDs."""
+
+    def add(*items: dict[str, Any]) -> list[str]:
+        rows = []
+        for item in items:
+            values = {**ITEM_DEFAULTS, **item}
+            values.setdefault("id", uuid.uuid4().hex)
+            rows.append(values)
+        columns = list(rows[0])
+        execute_many(
+            f"INSERT INTO library_items ({', '.join(columns)}, created_at, "
+            f"updated_at) VALUES ({', '.join('?' * len(columns))}, "
+            "datetime('now'), datetime('now'))",
+            [tuple(row[column] for column in columns) for row in rows],
+        )
+        return [row["id"] for row in rows]
+
+    return add
+
+
+@pytest.fixture
+def client(database) -> TestClient:
+    """An API client for the app; the lifespan (and its background work) is not run."""
+    wire_container()
+    return TestClient(create_app())
+
+
+class MockWikiHttpClient(WikiHttpClient):
+    """A wiki HTTP client answering every request with ``handler``."""
+
+    def __init__(self, config: WikiSettings, handler: Callable):
+        super().__init__(config)
+        self.handler = handler
+
+    def _build(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            transport=httpx.MockTransport(self.handler),
+            follow_redirects=True,
+            event_hooks={"response": [self._on_response]},
+        )
+
+
+def _make_wiki_service(
+    handler: Callable[[httpx.Request], httpx.Response], **components: Any
+) -> TardisWikiService:
+    config = components.pop("config", None) or WikiSettings(
+        backoff_base=0.001, backoff_max=0.001
+    )
+    return TardisWikiService(
+        config, http_client=MockWikiHttpClient(config, handler), **components
+    )
+
+
+@pytest.fixture
+def wiki_service() -> Callable[..., TardisWikiService]:
+    """Build wiki services on a mocked transport: ``(handler, **components)``.
+
+    Retries back off for a millisecond at most, so tests never sleep long.
+    """
+    return _make_wiki_service
@@ -0,0 +1,78 @@
+"""Tests for the pooled SQLite connections."""
+
+import pytest
+
+from doctor_who_library.shared.config.settings import DatabaseSettings
+from doctor_who_library.shared.database.connection import SQLiteConnectionPool
+from doctor_who_library.shared.exceptions.infrastructure import DatabaseException
+
+
+@pytest.fixture
+def pool(tmp_path):
+    settings = DatabaseSettings(
+        pool_size=1, max_overflow=1, pool_timeout=0.05, busy_timeout_ms=1234
+    )
+    pool = SQLiteConnectionPool(str(tmp_path / "pool.db"), settings)
+    yield pool
+    pool.close()
+
+
+def test_released_connections_are_reused(pool):
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+
+    assert second is first
+    assert pool.status()["opened"] == 1
+
+
+def test_pragmas_are_applied_once_per_connection(pool):
+    with pool.connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+
+def test_overflow_connections_close_on_release(pool):
+    first = pool.acquire()
+    overflow = pool.acquire()
+    assert pool.status()["in_use"] == 2
+
+    pool.release(first)
+    pool.release(overflow)
+
+    assert pool.status() == {
+        "pool_size": 1,
+        "max_overflow": 1,
+        "opened": 1,
+        "idle": 1,
+        "in_use": 0,
+    }
+
+
+def test_acquire_times_out_when_exhausted(pool):
+    held = [pool.acquire(), pool.acquire()]
+
+    with pytest.raises(DatabaseException, match="Timed out"):
+        pool.acquire()
+
+    for conn in held:
+        pool.release(conn)
+
+
+def test_uncommitted_work_is_rolled_back_on_release(pool):
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE t (x)")
+        conn.commit()
+        conn.execute("INSERT INTO t VALUES (1)")
+
+    with pool.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+def test_closed_pool_refuses_checkouts(pool):
+    pool.close()
+
+    with pytest.raises(DatabaseException, match="closed"):
+        pool.acquire()
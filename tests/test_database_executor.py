@@ -0,0 +1,61 @@
+"""Tests for running SQLite work off the event loop."""
+
+import asyncio
+import threading
+import time
+
+from doctor_who_library.shared.config.settings import get_settings
+from doctor_who_library.shared.database.executor import (
+    execute,
+    execute_many,
+    fetch_all,
+    fetch_one,
+    get_database_executor,
+    run_blocking,
+    shutdown_database_executor,
+)
+
+
+def test_queries_round_trip_through_the_executor(database):
+    async def scenario():
+        await execute("CREATE TABLE t (x INTEGER)")
+        inserted = await execute_many("INSERT INTO t VALUES (?)", [(1,), (2,), (3,)])
+        rows = await fetch_all("SELECT x FROM t ORDER BY x")
+        first = await fetch_one("SELECT x FROM t WHERE x > ?", (1,))
+        missing = await fetch_one("SELECT x FROM t WHERE x > 10")
+        return inserted, [row[0] for row in rows], first[0], missing
+
+    assert asyncio.run(scenario()) == (3, [1, 2, 3], 2, None)
+
+
+def test_blocking_work_runs_on_database_threads(database):
+    thread_name = asyncio.run(run_blocking(lambda: threading.current_thread().name))
+
+    assert thread_name.startswith("sqlite")
+
+
+def test_event_loop_keeps_running_during_blocking_work(database):
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await run_blocking(time.sleep, 0.2)
+        task.cancel()
+        return ticks
+
+    assert asyncio.run(scenario()) >= 5
+
+
+def test_executor_is_sized_to_the_connection_pool(database, monkeypatch):
+    monkeypatch.setenv("DATABASE_POOL_SIZE", "2")
+    monkeypatch.setenv("DATABASE_MAX_OVERFLOW", "3")
+    get_settings.cache_clear()
+    shutdown_database_executor()
+
+    assert get_database_executor()._max_workers == 5
@@ -0,0 +1,140 @@
+"""Tests for the write-behind buffer of enrichment results."""
+
+import asyncio
+from unittest import mock
+from uuid import UUID
+
+import pytest
+
+from doctor_who_library.application.services import enrichment_write_buffer
+from doctor_who_library.application.services.enrichment_write_buffer import (
+    EnrichmentWriteBuffer,
+)
+from doctor_who_library.domain.entities.library_item import LibraryItem
+from doctor_who_library.domain.value_objects.enrichment_status import EnrichmentStatus
+from doctor_who_library.shared.database.connection import execute_query
+from doctor_who_library.shared.exceptions.application import ServiceException
+
+
+def enriched(hex_id: str, confidence: float = 0.9) -> LibraryItem:
+    return LibraryItem(
+        id=UUID(hex=hex_id),
+        enrichment_status=EnrichmentStatus.ENRICHED,
+        enrichment_confidence=confidence,
+        wiki_url=f"https://wiki/{hex_id}",
+    )
+
+
+def stored(hex_id: str) -> tuple:
+    return tuple(
+        execute_query(
+            "SELECT enrichment_status, enrichment_confidence FROM library_items "
+            "WHERE id = ?",
+            (hex_id,),
+        )[0]
+    )
+
+
+def test_flushes_when_batch_is_full(add_items):
+    ids = add_items({}, {}, {})
+    listener = mock.Mock()
+    buffer = EnrichmentWriteBuffer(
+        flush_size=2, flush_interval_ms=60_000, flush_listeners=[listener]
+    )
+
+    async def scenario():
+        await buffer.add(enriched(ids[0]))
+        assert buffer.pending_count == 1
+        await buffer.add(enriched(ids[1]))
+        assert buffer.pending_count == 0
+        await buffer.close()
+
+    asyncio.run(scenario())
+
+    assert stored(ids[0]) == ("enriched", 0.9)
+    assert stored(ids[2]) == ("pending", 0.0)
+    listener.assert_called_once_with([ids[0], ids[1]])
+
+
+def test_flushes_after_the_interval(add_items):
+    (hex_id,) = add_items({})
+    buffer = EnrichmentWriteBuffer(flush_size=100, flush_interval_ms=20)
+
+    async def scenario():
+        await buffer.add(enriched(hex_id))
+        await asyncio.sleep(0.2)
+        return buffer.stats()
+
+    assert asyncio.run(scenario()) == {"pending": 0, "flushed_items": 1, "flushes": 1}
+    assert stored(hex_id) == ("enriched", 0.9)
+
+
+def test_later_result_for_an_item_replaces_the_pending_one(add_items):
+    (hex_id,) = add_items({})
+    buffer = EnrichmentWriteBuffer(flush_size=100, flush_interval_ms=60_000)
+
+    async def scenario():
+        await buffer.add(enriched(hex_id, confidence=0.5))
+        await buffer.add(enriched(hex_id, confidence=0.8))
+        assert buffer.pending_count == 1
+        return await buffer.flush()
+
+    assert asyncio.run(scenario()) == 1
+    assert stored(hex_id) == ("enriched", 0.8)
+
+
+def test_close_cancels_the_timer_and_flushes(add_items):
+    (hex_id,) = add_items({})
+    buffer = EnrichmentWriteBuffer(flush_size=100, flush_interval_ms=60_000)
+
+    async def scenario():
+        await buffer.add(enriched(hex_id))
+        timer = buffer._timer
+        await buffer.close()
+        await asyncio.sleep(0)
+        return timer
+
+    timer = asyncio.run(scenario())
+
+    assert timer.cancelled()
+    assert stored(hex_id) == ("enriched", 0.9)
+
+
+def test_failed_flush_keeps_results_for_the_next_one(add_items):
+    (hex_id,) = add_items({})
+    listener = mock.Mock()
+    buffer = EnrichmentWriteBuffer(
+        flush_size=100, flush_interval_ms=60_000, flush_listeners=[listener]
+    )
+
+    async def scenario():
+        await buffer.add(enriched(hex_id))
+        with mock.patch.object(
+            enrichment_write_buffer, "execute_many", side_effect=RuntimeError("locked")
+        ):
+            with pytest.raises(ServiceException):
+                await buffer.flush()
+        assert buffer.pending_count == 1
+        listener.assert_not_called()
+        return await buffer.flush()
+
+    assert asyncio.run(scenario()) == 1
+    listener.assert_called_once_with([hex_id])
+
+
+def test_failing_listener_does_not_stop_the_others(add_items):
+    (hex_id,) = add_items({})
+    failing = mock.Mock(side_effect=RuntimeError("boom"))
+    listener = mock.Mock()
+    buffer = EnrichmentWriteBuffer(
+        flush_size=100, flush_interval_ms=60_000, flush_listeners=[failing, listener]
+    )
+
+    async def scenario():
+        await buffer.add(enriched(hex_id))
+        return await buffer.flush()
+
+    assert asyncio.run(scenario()) == 1
+    listener.assert_called_once_with([hex_id])
+    assert buffer.stats() == {"pending": 0, "flushed_items": 1, "flushes": 1}
+    assert stored(hex_id) == ("enriched", 0.9)
@@ -0,0 +1,92 @@
+"""Tests for the in-memory library catalog and its write listeners."""
+
+import asyncio
+from unittest import mock
+from uuid import UUID
+
+from doctor_who_library.application.services import library_catalog
+from doctor_who_library.application.services.library_catalog import LibraryCatalog
+from doctor_who_library.domain.entities.library_item import LibraryItem
+from doctor_who_library.domain.value_objects.enrichment_status import EnrichmentStatus
+from doctor_who_library.shared.config.container import get_container
+from doctor_who_library.shared.database.connection import execute_query, execute_update
+
+
+def test_filters_and_counts_match_the_table(add_items):
+    ids = add_items(
+        {"section_name": "Doctor Who", "enrichment_status": "enriched"},
+        {"section_name": "Doctor Who"},
+        {"section_name": "Torchwood", "enrichment_status": "enriched"},
+    )
+    catalog = LibraryCatalog()
+    catalog.load_sync()
+
+    items, next_rowid = catalog.find(status=EnrichmentStatus.ENRICHED, limit=1)
+
+    assert [item.id.hex for item in items] == [ids[0]]
+    assert next_rowid is not None
+    assert catalog.count(section_name="Doctor Who") == 2
+    assert catalog.status_counts()["enriched"] == 2
+
+
+def test_refresh_patches_updated_rows(add_items):
+    (hex_id,) = add_items({"group_name": "Series 1"})
+    catalog = LibraryCatalog()
+    catalog.load_sync()
+
+    execute_update(
+        "UPDATE library_items SET group_name = 'Series 2', "
+        "enrichment_status = 'enriched' WHERE id = ?",
+        (hex_id,),
+    )
+    catalog.refresh_items([hex_id])
+
+    assert catalog.loaded
+    assert catalog.count(group_name="Series 1") == 0
+    assert catalog.count(group_name="Series 2") == 1
+    assert catalog.get_item(hex_id).enrichment_status == EnrichmentStatus.ENRICHED
+
+
+def test_refresh_during_a_load_leaves_the_snapshot_stale(add_items):
+    (hex_id,) = add_items({})
+    catalog = LibraryCatalog()
+
+    def read_then_write(sql, params=()):
+        rows = execute_query(sql, params)
+        # A flush commits and notifies while the snapshot rows are in flight
+        catalog.refresh_items([hex_id])
+        return rows
+
+    with mock.patch.object(library_catalog, "execute_query", read_then_write):
+        catalog.load_sync()
+
+    assert not catalog.loaded
+    catalog.load_sync()
+    assert catalog.loaded
+
+
+def test_flush_refreshes_read_models_before_invalidating_the_cache(add_items):
+    (hex_id,) = add_items({})
+    container = get_container()
+    service = container.library_service()
+    buffer = container.enrichment_write_buffer()
+    asyncio.run(service.get_item_by_id(UUID(hex=hex_id)))
+
+    assert buffer.flush_listeners[0] == service.catalog.refresh_items
+    assert buffer.flush_listeners[-1] == service.item_cache.invalidate_many
+
+    async def scenario():
+        await buffer.add(
+            LibraryItem(
+                id=UUID(hex=hex_id),
+                enrichment_status=EnrichmentStatus.ENRICHED,
+                enrichment_confidence=0.9,
+            )
+        )
+        await buffer.flush()
+        return await service.get_item_by_id(UUID(hex=hex_id))
+
+    item = asyncio.run(scenario())
+
+    assert item.enrichment_status == EnrichmentStatus.ENRICHED
+    assert service.catalog.get_item(hex_id).enrichment_confidence == 0.9
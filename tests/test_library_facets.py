@@ -0,0 +1,106 @@
+"""Tests for faceted counts and library statistics."""
+
+import asyncio
+
+import pytest
+
+from doctor_who_library.application.services.library_catalog import LibraryCatalog
+from doctor_who_library.application.services.library_facets import (
+    FacetCache,
+    count_facets,
+)
+from doctor_who_library.application.services.library_service import LibraryService
+from doctor_who_library.domain.value_objects.enrichment_status import EnrichmentStatus
+
+ROWS = [
+    # section, group, content_type, doctor, status, count
+    ("1st Doctor", "Season 1", "tv", "First", "enriched", 3),
+    ("1st Doctor", "Season 2", "tv", "First", "pending", 2),
+    ("2nd Doctor", "Season 4", "audio", "Second", "enriched", 4),
+    ("2nd Doctor", None, "tv", "Second", "failed", 1),
+]
+
+
+def test_each_facet_ignores_only_its_own_filter():
+    result = count_facets(ROWS, {"section": "1st Doctor", "content_type": "tv"})
+
+    assert result["total"] == 5
+    assert result["facets"]["section"] == {"1st Doctor": 5, "2nd Doctor": 1}
+    assert result["facets"]["content_type"] == {"tv": 5}
+    assert result["facets"]["group"] == {"Season 1": 3, "Season 2": 2}
+    assert result["facets"]["enrichment_status"] == {"enriched": 3, "pending": 2}
+
+
+def test_values_rank_by_count_then_name_and_skip_nulls():
+    result = count_facets(ROWS, {})
+
+    assert result["total"] == 10
+    assert list(result["facets"]["doctor"].items()) == [("First", 5), ("Second", 5)]
+    assert list(result["facets"]["group"]) == ["Season 4", "Season 1", "Season 2"]
+
+
+def test_stale_results_are_not_cached():
+    cache = FacetCache()
+    generation = cache.generation
+    cache.invalidate()
+
+    cache.put(("key",), {"total": 1}, generation)
+
+    assert cache.get(("key",)) is None
+    assert cache.stats()["rejected_puts"] == 1
+
+
+@pytest.fixture
+def library(add_items):
+    add_items(
+        *(
+            {
+                "section_name": section,
+                "group_name": group or "",
+                "content_type": content_type,
+                "doctor": doctor,
+                "enrichment_status": status,
+            }
+            for section, group, content_type, doctor, status, count in ROWS
+            for _ in range(count)
+        )
+    )
+
+
+@pytest.mark.parametrize("catalog", [True, False], ids=["catalog", "sql"])
+def test_service_facets_and_stats_agree_with_the_rows(library, catalog):
+    service = LibraryService(
+        catalog=LibraryCatalog() if catalog else None, facet_cache=FacetCache()
+    )
+
+    facets = asyncio.run(
+        service.get_facets(section_name="2nd Doctor", status=EnrichmentStatus.ENRICHED)
+    )
+    stats = asyncio.run(service.get_library_stats())
+
+    assert facets["total"] == 4
+    assert facets["facets"]["enrichment_status"] == {"enriched": 4, "failed": 1}
+    assert facets["facets"]["section"] == {"2nd Doctor": 4, "1st Doctor": 3}
+    assert stats["total_items"] == 10
+    assert stats["total_sections"] == 2
+    assert stats["total_groups"] == 3
+    assert stats["enrichment_stats"]["enriched"] == 7
+
+
+def test_repeated_facet_queries_hit_the_cache_until_a_write(library):
+    service = LibraryService(facet_cache=FacetCache())
+
+    first = asyncio.run(service.get_facets(doctor="First"))
+    assert asyncio.run(service.get_facets(doctor="First")) is first
+
+    service.facet_cache.invalidate(["any"])
+    assert asyncio.run(service.get_facets(doctor="First")) is not first
+    assert service.facet_cache.stats()["hits"] == 1
+
+
+def test_facets_endpoint_rejects_unknown_sections(client, library):
+    assert client.get("/api/library/facets").json()["total"] == 10
+
+    response = client.get("/api/library/facets", params={"section": "Nope"})
+
+    assert response.status_code == 400
@@ -0,0 +1,60 @@
+"""Tests for the in-process cache of library items."""
+
+import asyncio
+from unittest import mock
+from uuid import UUID
+
+from doctor_who_library.application.services.library_item_cache import LibraryItemCache
+from doctor_who_library.domain.entities.library_item import LibraryItem
+from doctor_who_library.shared.config.container import get_container
+
+
+def item(n: int) -> LibraryItem:
+    return LibraryItem(id=UUID(int=n), title=f"Story {n}")
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LibraryItemCache(max_size=2)
+    cache.put("a", item(1))
+    cache.put("b", item(2))
+    cache.get("a")
+    cache.put("c", item(3))
+
+    assert cache.get("b") is None
+    assert cache.get("a").title == "Story 1"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_after_the_ttl():
+    cache = LibraryItemCache(ttl_seconds=10)
+    with mock.patch("time.monotonic", return_value=100.0):
+        cache.put("a", item(1))
+    with mock.patch("time.monotonic", return_value=109.0):
+        assert cache.get("a") is not None
+    with mock.patch("time.monotonic", return_value=110.0):
+        assert cache.get("a") is None
+
+
+def test_put_read_before_an_invalidation_is_rejected():
+    cache = LibraryItemCache()
+    generation = cache.generation
+    cache.invalidate_many(["a"])
+
+    cache.put("a", item(1), generation)
+
+    assert cache.get("a") is None
+    assert cache.stats()["rejected_puts"] == 1
+
+    cache.put("a", item(1), cache.generation)
+    assert cache.get("a") is not None
+
+
+def test_service_reads_through_the_cache(add_items):
+    (hex_id,) = add_items({"title": "The Aztecs"})
+    service = get_container().library_service()
+
+    first = asyncio.run(service.get_item_by_id(UUID(hex=hex_id)))
+    second = asyncio.run(service.get_item_by_id(UUID(hex=hex_id)))
+
+    assert second is first
+    assert service.item_cache.stats()["hits"] == 1
@@ -0,0 +1,77 @@
+"""Tests for mapping library_items rows to entities."""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from doctor_who_library.domain.value_objects.content_type import ContentType
+from doctor_who_library.domain.value_objects.enrichment_status import EnrichmentStatus
+from doctor_who_library.infrastructure.database.library_item_mapper import (
+    LIBRARY_ITEM_COLUMNS,
+    compile_row_mapper,
+    row_to_library_item,
+)
+
+
+def make_row(**values) -> tuple:
+    return tuple(values.get(column) for column in LIBRARY_ITEM_COLUMNS)
+
+
+def test_full_rows_convert_ids_enums_and_timestamps():
+    item_id = uuid4()
+    item = row_to_library_item(
+        make_row(
+            id=item_id.hex,
+            title="Rose",
+            content_type="BBC Television",
+            broadcast_date="2005-03-26",
+            release_date="2005-05-16T00:00:00Z",
+            enrichment_status="enriched",
+            enrichment_confidence=0.9,
+            created_at="2024-01-02 03:04:05",
+            updated_at="2024-01-02T03:04:05.123456",
+        )
+    )
+
+    assert item.id == item_id
+    assert item.title == item.display_title == "Rose"
+    assert item.content_type is ContentType.BBC_TELEVISION
+    assert item.broadcast_date == datetime(2005, 3, 26)
+    assert item.release_date == datetime(2005, 5, 16, tzinfo=timezone.utc)
+    assert item.enrichment_status is EnrichmentStatus.ENRICHED
+    assert item.enrichment_confidence == 0.9
+    assert item.created_at == datetime(2024, 1, 2, 3, 4, 5)
+    assert item.updated_at == datetime(2024, 1, 2, 3, 4, 5, 123456)
+
+
+def test_null_and_unknown_columns_fall_back_to_defaults():
+    item_id = uuid4()
+    before = datetime.utcnow() - timedelta(seconds=1)
+
+    item = row_to_library_item(
+        make_row(id=item_id.hex, content_type="Betamax", cover_date="sometime")
+    )
+
+    assert item.id == item_id
+    assert item.title == item.display_title == "Unknown Title"
+    assert item.content_type is None
+    assert item.broadcast_date is None
+    assert item.cover_date is None
+    assert item.enrichment_status is EnrichmentStatus.PENDING
+    assert item.enrichment_confidence == 0.0
+    assert item.created_at >= before
+    assert item.updated_at >= before
+
+
+def test_partial_mappers_convert_the_same_way():
+    item_id = uuid4()
+    columns = ("id", "title", "content_type", "updated_at")
+    row = (item_id.hex, "Rose", "TV", "2024-01-02 03:04:05")
+
+    item = compile_row_mapper(columns)(row)
+
+    assert item.id == item_id
+    assert item.display_title == "Rose"
+    assert item.content_type is ContentType.TV
+    assert item.updated_at == datetime(2024, 1, 2, 3, 4, 5)
+    assert compile_row_mapper(columns)(row[:2] + (None, None)).content_type is None
+    assert compile_row_mapper(LIBRARY_ITEM_COLUMNS) is row_to_library_item
@@ -0,0 +1,279 @@
+"""Tests for listing library items through the API."""
+
+from uuid import UUID
+
+import pytest
+
+from doctor_who_library.infrastructure.database.library_item_mapper import (
+    columns_for_fields,
+)
+from doctor_who_library.presentation.api.routes.library import (
+    FIELD_PROJECTIONS,
+    MAX_BATCH_IDS,
+    decode_items_cursor,
+    encode_items_cursor,
+    parse_fields,
+)
+from doctor_who_library.shared.config.container import get_container
+from doctor_who_library.shared.config.settings import get_settings
+from doctor_who_library.shared.database.connection import execute_update
+
+
+@pytest.fixture(params=[True, False], ids=["catalog", "sql"])
+def client(request, client, monkeypatch):
+    """The API client, served from the in-memory catalog or from SQL."""
+    monkeypatch.setenv("CACHE_CATALOG_ENABLED", str(request.param).lower())
+    get_settings.cache_clear()
+    get_container().reset_singletons()
+    return client
+
+
+def pages(client, **params) -> list[dict]:
+    """Follow next_cursor from the first page to the last."""
+    responses = []
+    cursor = None
+    while True:
+        query = {**params, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/library/items", params=query)
+        assert response.status_code == 200
+        responses.append(response.json())
+        cursor = responses[-1]["next_cursor"]
+        if cursor is None:
+            return responses
+
+
+def item_ids(responses: list[dict]) -> list[str]:
+    return [UUID(item["id"]).hex for page in responses for item in page["items"]]
+
+
+def test_cursor_round_trips_its_position():
+    item_id = UUID(int=7)
+
+    assert decode_items_cursor(encode_items_cursor(42, item_id)) == (42, item_id)
+
+
+def test_cursor_pages_cover_every_item_once(client, add_items):
+    ids = add_items(*({"title": f"Story {n}"} for n in range(5)))
+
+    responses = pages(client, limit=2)
+
+    assert [len(page["items"]) for page in responses] == [2, 2, 1]
+    assert item_ids(responses) == ids
+    assert {page["total"] for page in responses} == {5}
+    assert [page["page"] for page in responses] == [1, None, None]
+
+
+def test_cursor_pages_honour_filters(client, add_items):
+    ids = add_items(
+        *({"enrichment_status": "enriched" if n % 2 else "pending"} for n in range(6))
+    )
+
+    responses = pages(client, limit=2, enrichment_status="enriched")
+
+    assert item_ids(responses) == ids[1::2]
+
+
+def test_updates_between_pages_neither_repeat_nor_skip_items(client, add_items):
+    ids = add_items(*({"title": f"Story {n}"} for n in range(4)))
+    first = client.get("/api/library/items", params={"limit": 2}).json()
+
+    execute_update(
+        "UPDATE library_items SET enrichment_status = 'enriched', "
+        "updated_at = datetime('now', '+1 hour') WHERE id = ?",
+        (ids[0],),
+    )
+    get_container().reset_singletons()
+    rest = pages(client, limit=2, cursor=first["next_cursor"])
+
+    assert item_ids([first, *rest]) == ids
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["not-a-cursor", encode_items_cursor(1, UUID(int=1))[:-4], "eyJyb3dpZCI6ICIxIn0"],
+)
+def test_invalid_cursor_is_rejected(client, database, cursor):
+    response = client.get("/api/library/items", params={"cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["error"]["message"] == "Invalid cursor format"
+
+
+def test_cursor_for_a_deleted_or_renumbered_item_is_rejected(client, add_items):
+    ids = add_items(*({"title": f"Story {n}"} for n in range(4)))
+    cursor = client.get("/api/library/items", params={"limit": 2}).json()["next_cursor"]
+
+    execute_update(
+        "UPDATE library_items SET rowid = rowid + 100 WHERE id = ?", (ids[1],)
+    )
+    get_container().library_catalog().invalidate()
+    renumbered = client.get("/api/library/items", params={"cursor": cursor})
+
+    execute_update("DELETE FROM library_items WHERE id = ?", (ids[1],))
+    get_container().library_catalog().invalidate()
+    deleted = client.get("/api/library/items", params={"cursor": cursor})
+
+    assert renumbered.status_code == deleted.status_code == 400
+
+
+def test_section_group_and_status_filters_combine(client, add_items):
+    ids = add_items(
+        {"section_name": "10th Doctor", "group_name": "Series 2"},
+        {
+            "section_name": "10th Doctor",
+            "group_name": "Series 2",
+            "enrichment_status": "enriched",
+        },
+        {
+            "section_name": "10th Doctor",
+            "group_name": "Series 3",
+            "enrichment_status": "enriched",
+        },
+        {
+            "section_name": "11th Doctor",
+            "group_name": "Series 2",
+            "enrichment_status": "enriched",
+        },
+    )
+
+    page = client.get(
+        "/api/library/items",
+        params={
+            "section": "10th Doctor",
+            "group": "Series 2",
+            "enrichment_status": "enriched",
+        },
+    ).json()
+
+    assert item_ids([page]) == [ids[1]]
+    assert page["total"] == 1
+
+
+def test_group_filter_lists_and_counts_its_items(client, add_items):
+    ids = add_items(
+        {"group_name": "Series 2"},
+        {"group_name": "Series 3"},
+        {"group_name": "Series 2"},
+    )
+
+    page = client.get("/api/library/items", params={"group": "Series 2"}).json()
+
+    assert item_ids([page]) == [ids[0], ids[2]]
+    assert page["total"] == 2
+
+
+def test_unfiltered_and_status_totals_count_every_match(client, add_items):
+    add_items(
+        {"enrichment_status": "enriched"}, {}, {"enrichment_status": "enriched"}, {}
+    )
+
+    def total(**params) -> int:
+        return client.get("/api/library/items", params=params).json()["total"]
+
+    assert total() == 4
+    assert total(enrichment_status="enriched") == 2
+    assert total(enrichment_status="failed") == 0
+
+
+@pytest.mark.parametrize(
+    "params", [{"section": "42nd Doctor"}, {"enrichment_status": "sleeping"}]
+)
+def test_unknown_section_or_status_is_rejected(client, database, params):
+    response = client.get("/api/library/items", params=params)
+
+    assert response.status_code == 400
+
+
+def test_fields_trim_listed_items(client, add_items):
+    add_items({"title": "The Sensorites", "writer": "Peter R. Newman"})
+
+    response = client.get("/api/library/items", params={"fields": "title"})
+
+    (item,) = response.json()["items"]
+    assert set(item) == {"id", "title"}
+    assert item["title"] == "The Sensorites"
+
+
+def test_projections_combine_with_fields(client, add_items):
+    (hex_id,) = add_items({"title": "The Reign of Terror", "writer": "Dennis Spooner"})
+
+    response = client.get(
+        f"/api/library/items/{UUID(hex=hex_id)}", params={"fields": "card,writer"}
+    )
+
+    assert set(response.json()) == {*FIELD_PROJECTIONS["card"], "writer"}
+    assert response.json()["writer"] == "Dennis Spooner"
+
+
+def test_detail_projection_returns_the_full_item(client, add_items):
+    add_items({"title": "Planet of Giants"})
+
+    full = client.get("/api/library/items").json()["items"]
+    detail = client.get("/api/library/items", params={"fields": "detail"}).json()
+
+    assert detail["items"] == full
+
+
+def test_unknown_field_is_rejected(client, database):
+    response = client.get("/api/library/items", params={"fields": "title,secret"})
+
+    assert response.status_code == 400
+    assert "Unknown field 'secret'" in response.json()["error"]["message"]
+
+
+def test_selected_fields_narrow_the_selected_columns():
+    fields = parse_fields("display_title, doctor")
+
+    assert fields == ("id", "display_title", "doctor")
+    assert columns_for_fields(fields) == ("id", "title", "doctor")
+    assert parse_fields("detail") is None
+
+
+def test_batch_returns_items_in_request_order_with_missing_ids(client, add_items):
+    ids = [UUID(hex=hex_id) for hex_id in add_items({}, {}, {})]
+    unknown = UUID(int=1)
+
+    response = client.post(
+        "/api/library/items:batch",
+        json={"ids": [str(ids[2]), str(unknown), str(ids[0]), str(ids[2])]},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body["items"]] == [str(ids[2]), str(ids[0])]
+    assert body["missing"] == [str(unknown)]
+
+
+def test_batch_accepts_fields(client, add_items):
+    (hex_id,) = add_items({"title": "The Chase"})
+
+    response = client.post(
+        "/api/library/items:batch",
+        params={"fields": "title"},
+        json={"ids": [str(UUID(hex=hex_id))]},
+    )
+
+    assert response.json() == {
+        "items": [{"id": str(UUID(hex=hex_id)), "title": "The Chase"}],
+        "missing": [],
+    }
+
+
+def test_batch_accepts_the_maximum_number_of_ids(client, add_items):
+    ids = add_items(*({} for _ in range(MAX_BATCH_IDS)))
+
+    response = client.post(
+        "/api/library/items:batch",
+        params={"fields": "id"},
+        json={"ids": [str(UUID(hex=hex_id)) for hex_id in ids]},
+    )
+
+    assert len(response.json()["items"]) == MAX_BATCH_IDS
+
+
+def test_batch_rejects_too_many_ids(client, database):
+    ids = [str(UUID(int=n)) for n in range(MAX_BATCH_IDS + 1)]
+
+    response = client.post("/api/library/items:batch", json={"ids": ids})
+
+    assert response.status_code == 422
@@ -0,0 +1,77 @@
+"""Tests for full-text search over library items."""
+
+import asyncio
+
+from doctor_who_library.application.services.library_service import LibraryService
+from doctor_who_library.infrastructure.database.library_search import (
+    build_match_expression,
+    vacuum_database,
+)
+from doctor_who_library.shared.database.connection import execute_update
+
+
+def search(query: str, **kwargs) -> list[str]:
+    items = asyncio.run(LibraryService().search_items(query, **kwargs))
+    return [item.title for item in items]
+
+
+def test_match_expression_quotes_words_and_prefixes_the_last():
+    assert build_match_expression("genesis of the dal") == (
+        '"genesis" "of" "the" "dal"*'
+    )
+    assert build_match_expression('dalek" OR NEAR(') == '"dalek" "OR" "NEAR"*'
+    assert build_match_expression("  -- ") is None
+
+
+def test_title_matches_rank_above_other_fields(add_items):
+    add_items(
+        {"title": "The Space Museum", "wiki_summary": "The Daleks pursue the TARDIS"},
+        {"title": "The Daleks", "writer": "Terry Nation"},
+        {"title": "Planet of Giants"},
+    )
+
+    assert search("daleks") == ["The Daleks", "The Space Museum"]
+
+
+def test_last_word_matches_as_a_prefix(add_items):
+    add_items({"title": "Genesis of the Daleks"}, {"title": "Day of the Doctor"})
+
+    assert search("genesis of the dal") == ["Genesis of the Daleks"]
+    assert len(search("of the d", limit=1)) == 1
+    assert search("") == []
+
+
+def test_index_follows_updates_and_deletes(add_items):
+    (hex_id,) = add_items({"title": "The Keys of Marinus"})
+
+    execute_update(
+        "UPDATE library_items SET title = 'The Web Planet' WHERE id = ?", (hex_id,)
+    )
+    assert search("marinus") == []
+    assert search("web planet") == ["The Web Planet"]
+
+    execute_update("DELETE FROM library_items WHERE id = ?", (hex_id,))
+    assert search("web planet") == []
+
+
+def test_columns_narrow_the_selected_fields(add_items):
+    add_items({"title": "The Romans", "writer": "Dennis Spooner"})
+
+    (item,) = asyncio.run(
+        LibraryService().search_items("romans", columns=("id", "title"))
+    )
+
+    assert item.title == "The Romans"
+    assert item.writer is None
+
+
+def test_vacuum_rebuilds_the_index_over_renumbered_rows(add_items):
+    add_items({"title": "The Aztecs"}, {"title": "The Sensorites"})
+    # Renumber rowids behind the index's back, as VACUUM is allowed to
+    execute_update("UPDATE library_items SET rowid = rowid + 100")
+    assert search("aztecs") == []
+
+    vacuum_database()
+
+    assert search("aztecs") == ["The Aztecs"]
+    assert search("sensorites") == ["The Sensorites"]
@@ -0,0 +1,67 @@
+"""Tests for the trigger-maintained library statistics."""
+
+import asyncio
+
+import pytest
+
+from doctor_who_library.infrastructure.database.library_stats import (
+    check_library_stats,
+    get_library_counters,
+    rebuild_library_stats,
+    scan_library_counters,
+)
+from doctor_who_library.shared.database.connection import execute_update
+
+
+def enriched(confidence: float, **columns) -> dict:
+    return {
+        "enrichment_status": "enriched",
+        "enrichment_confidence": confidence,
+        **columns,
+    }
+
+
+def test_counters_follow_inserts_updates_and_deletes(add_items):
+    ids = add_items(
+        {},
+        {"enrichment_status": "failed"},
+        enriched(0.9, wiki_url="https://wiki/a"),
+        enriched(0.7),
+        enriched(0.2),
+    )
+    execute_update(
+        "UPDATE library_items SET enrichment_status = 'enriched', "
+        "enrichment_confidence = 0.85, wiki_summary = 'x' WHERE id = ?",
+        (ids[0],),
+    )
+    execute_update("DELETE FROM library_items WHERE id = ?", (ids[3],))
+
+    counters = asyncio.run(get_library_counters())
+
+    assert counters["total_items"] == 4
+    assert counters["status_counts"]["enriched"] == 3
+    assert counters["status_counts"]["failed"] == 1
+    assert counters["status_counts"]["pending"] == 0
+    assert counters["high_confidence_count"] == 2
+    assert counters["medium_confidence_count"] == 0
+    assert counters["low_confidence_count"] == 1
+    assert counters["avg_confidence"] == pytest.approx((0.9 + 0.85 + 0.2) / 3)
+    assert counters["items_with_wiki_data"] == 2
+    assert counters == asyncio.run(scan_library_counters())
+
+
+def test_check_reports_drift_and_rebuild_repairs_it(add_items):
+    add_items(enriched(0.9), {})
+    assert asyncio.run(check_library_stats())["consistent"]
+
+    execute_update(
+        "UPDATE library_stats SET item_count = item_count + 5 WHERE bucket = 'total'"
+    )
+    report = asyncio.run(check_library_stats())
+    assert not report["consistent"]
+    assert report["differences"]["total"]["materialized"]["count"] == 7
+    assert report["differences"]["total"]["scanned"]["count"] == 2
+
+    counters = asyncio.run(rebuild_library_stats())
+    assert counters["total_items"] == 2
+    assert asyncio.run(check_library_stats())["consistent"]
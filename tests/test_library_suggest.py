@@ -0,0 +1,106 @@
+"""Tests for the in-memory suggestion index."""
+
+import asyncio
+from unittest import mock
+
+from doctor_who_library.application.services import library_suggest
+from doctor_who_library.application.services.library_service import LibraryService
+from doctor_who_library.application.services.library_suggest import (
+    LibrarySuggestIndex,
+    normalize_title,
+)
+from doctor_who_library.shared.database.connection import execute_query, execute_update
+
+
+def loaded_index() -> LibrarySuggestIndex:
+    index = LibrarySuggestIndex()
+    index.load_sync()
+    return index
+
+
+def titles(index: LibrarySuggestIndex, query: str, limit: int = 8) -> list[str]:
+    return [suggestion["title"] for suggestion in index.suggest(query, limit)]
+
+
+def test_titles_are_normalized_for_matching():
+    assert normalize_title("  The Daleks' Master Plan ") == "the daleks master plan"
+    assert normalize_title("Éléments") == "elements"
+    assert normalize_title(None) == ""
+
+
+def test_field_starts_rank_above_later_words(add_items):
+    add_items(
+        {"title": "Revelation of the Daleks"},
+        {"title": "Dalek"},
+        {"title": "Daleks in Manhattan"},
+    )
+    index = loaded_index()
+
+    assert titles(index, "dalek") == [
+        "Dalek",
+        "Daleks in Manhattan",
+        "Revelation of the Daleks",
+    ]
+    assert titles(index, "the") == []
+    assert index.suggest("dal", limit=1)[0]["matched_field"] == "title"
+
+
+def test_popular_stories_rank_first_within_a_tier(add_items):
+    add_items(
+        {"title": "Marco Polo"},
+        *(
+            {"title": f"Part {n}", "story_title": "Mission to the Unknown"}
+            for n in range(1, 3)
+        ),
+    )
+
+    assert titles(loaded_index(), "m") == ["Part 1", "Part 2", "Marco Polo"]
+
+
+def test_refresh_updates_keys_and_short_prefixes(add_items):
+    ids = add_items({"title": "The Time Meddler"}, {"title": "Galaxy 4"})
+    index = loaded_index()
+
+    execute_update(
+        "UPDATE library_items SET title = 'The Tenth Planet' WHERE id = ?", (ids[0],)
+    )
+    execute_update("DELETE FROM library_items WHERE id = ?", (ids[1],))
+    index.refresh_items(ids)
+
+    assert titles(index, "meddler") == []
+    assert titles(index, "ga") == []
+    assert titles(index, "te") == ["The Tenth Planet"]
+    assert titles(index, "tenth planet") == ["The Tenth Planet"]
+    assert index.loaded
+
+
+def test_refresh_during_a_load_leaves_the_index_stale(add_items):
+    (hex_id,) = add_items({"title": "The Ark"})
+    index = LibrarySuggestIndex()
+
+    def read_then_write(sql, params=()):
+        rows = execute_query(sql, params)
+        index.refresh_items([hex_id])
+        return rows
+
+    with mock.patch.object(library_suggest, "execute_query", read_then_write):
+        index.load_sync()
+
+    assert not index.loaded
+
+
+def test_service_falls_back_to_full_text_search(add_items):
+    add_items({"title": "The Gunfighters"})
+
+    (suggestion,) = asyncio.run(LibraryService().suggest("gunf"))
+
+    assert suggestion["title"] == "The Gunfighters"
+    assert suggestion["matched_field"] == "title"
+
+
+def test_suggest_endpoint(client, add_items):
+    add_items({"title": "The Savages"})
+
+    response = client.get("/api/library/suggest", params={"q": "sav"})
+
+    assert [item["title"] for item in response.json()] == ["The Savages"]
@@ -0,0 +1,80 @@
+"""Tests for the Alembic schema upgrades."""
+
+import sqlite3
+
+from alembic import command
+
+from doctor_who_library.infrastructure.database.migrate import (
+    get_alembic_config,
+    upgrade_database,
+)
+
+HEAD = "0005"
+
+INDEXES = {
+    "ix_library_items_status_updated_id",
+    "ix_library_items_updated_id",
+    "ix_library_items_section_name",
+    "ix_library_items_group_name",
+    "ix_library_items_pending",
+}
+
+
+def schema(path: str) -> tuple[str, set[str], set[str]]:
+    conn = sqlite3.connect(path)
+    try:
+        (version,) = conn.execute("SELECT version_num FROM alembic_version").fetchone()
+        objects = conn.execute("SELECT type, name FROM sqlite_master").fetchall()
+    finally:
+        conn.close()
+    tables = {name for kind, name in objects if kind == "table"}
+    indexes = {name for kind, name in objects if kind == "index"}
+    return version, tables, indexes
+
+
+def test_new_database_is_upgraded_to_head(database):
+    version, tables, indexes = schema(database)
+
+    assert version == HEAD
+    assert {
+        "library_items",
+        "library_sections",
+        "library_groups",
+        "library_stats",
+        "library_items_fts",
+        "wiki_pages",
+        "wiki_page_redirects",
+    } <= tables
+    assert INDEXES <= indexes
+
+
+def test_database_without_alembic_version_is_stamped_at_baseline(tmp_path):
+    path = tmp_path / "legacy.db"
+    url = f"sqlite:///{path}"
+    # The tables create_all used to build, without Alembic's bookkeeping
+    upgrade_database(url, revision="0001")
+    conn = sqlite3.connect(path)
+    conn.execute("DROP TABLE alembic_version")
+    conn.close()
+
+    upgrade_database(url)
+
+    version, tables, indexes = schema(str(path))
+    assert version == HEAD
+    assert "library_stats" in tables
+    assert INDEXES <= indexes
+
+
+def test_downgrade_and_upgrade_round_trip(tmp_path):
+    path = tmp_path / "library.db"
+    url = f"sqlite:///{path}"
+    upgrade_database(url)
+
+    command.downgrade(get_alembic_config(url), "0001")
+    version, tables, indexes = schema(str(path))
+    assert version == "0001"
+    assert not {"library_stats", "library_items_fts", "wiki_pages"} & tables
+    assert not INDEXES & indexes
+
+    upgrade_database(url)
+    assert schema(str(path))[0] == HEAD
@@ -0,0 +1,293 @@
+"""Tests for fetching and resolving TARDIS Wiki pages over a mocked API."""
+
+import asyncio
+
+import httpx
+
+from doctor_who_library.domain.entities.library_item import LibraryItem
+from doctor_who_library.infrastructure.database.wiki_page_store import WikiPageStore
+from doctor_who_library.infrastructure.external.tardis_wiki_service import (
+    API_TITLES_PER_REQUEST,
+)
+
+EXTRACT = (
+    "Rose was the first episode of series 1 of Doctor Who, in which the Ninth "
+    "Doctor met Rose Tyler."
+)
+
+PAGE_HTML = """
+<html><body><div class="mw-parser-output">
+<p>Marco Polo was the fourth serial of season 1 of Doctor Who, and is missing.</p>
+<a href="/wiki/Category:Missing_stories">Missing stories</a>
+</div></body></html>
+"""
+
+
+def api_page(title: str, **fields) -> dict:
+    return {"title": title, "pageid": 1, "lastrevid": 7, **fields}
+
+
+def titles_of(request: httpx.Request) -> list[str]:
+    return request.url.params["titles"].split("|")
+
+
+def test_pages_are_fetched_in_one_api_query(wiki_service):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "query": {
+                    "normalized": [{"from": "rose", "to": "Rose"}],
+                    "redirects": [{"from": "Rose", "to": "Rose (TV story)"}],
+                    "pages": [
+                        api_page(
+                            "Rose (TV story)",
+                            extract=f"Short.\n{EXTRACT}",
+                            fullurl="https://tardis.fandom.com/wiki/Rose_(TV_story)",
+                            thumbnail={"source": "https://img/rose.jpg"},
+                            categories=[{"title": "Category:Series 1 stories"}],
+                        ),
+                        {"title": "Nope", "missing": True},
+                    ],
+                }
+            },
+        )
+
+    service = wiki_service(handler)
+    contents = asyncio.run(service._get_pages_content(["rose", "Nope", "rose"]))
+
+    assert len(requests) == 1
+    assert titles_of(requests[0]) == ["rose", "Nope"]
+    assert contents["Nope"] is None
+    assert contents["rose"] == {
+        "title": "rose",
+        "url": "https://tardis.fandom.com/wiki/Rose_(TV_story)",
+        "content": "",
+        "infobox": {},
+        "categories": ["Series 1 stories"],
+        "summary": EXTRACT,
+        "images": ["https://img/rose.jpg"],
+    }
+
+
+def test_continuations_are_merged(wiki_service):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "clcontinue" not in request.url.params:
+            page = api_page("Rose", extract=EXTRACT, categories=[{"title": "C:A"}])
+            return httpx.Response(
+                200,
+                json={"continue": {"clcontinue": "1|B"}, "query": {"pages": [page]}},
+            )
+        page = api_page("Rose", categories=[{"title": "C:B"}])
+        return httpx.Response(200, json={"query": {"pages": [page]}})
+
+    contents = asyncio.run(wiki_service(handler)._get_pages_content(["Rose"]))
+
+    assert contents["Rose"]["categories"] == ["A", "B"]
+    assert contents["Rose"]["summary"] == EXTRACT
+
+
+def test_titles_are_chunked_per_api_limit(wiki_service):
+    batches = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        batch = titles_of(request)
+        batches.append(batch)
+        pages = [api_page(title, extract=EXTRACT) for title in batch]
+        return httpx.Response(200, json={"query": {"pages": pages}})
+
+    titles = [f"Story {n}" for n in range(API_TITLES_PER_REQUEST + 10)]
+    contents = asyncio.run(wiki_service(handler)._get_pages_content(titles))
+
+    assert [len(batch) for batch in batches] == [API_TITLES_PER_REQUEST, 10]
+    assert all(contents[title] for title in titles)
+
+
+def test_pages_without_an_extract_fall_back_to_html(wiki_service):
+    html_requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api.php":
+            page = api_page("Marco Polo", extract="")
+            return httpx.Response(200, json={"query": {"pages": [page]}})
+        html_requests.append(request.url.path)
+        return httpx.Response(200, html=PAGE_HTML)
+
+    contents = asyncio.run(wiki_service(handler)._get_pages_content(["Marco Polo"]))
+
+    assert html_requests == ["/wiki/Marco_Polo"]
+    assert contents["Marco Polo"]["summary"].startswith("Marco Polo was the fourth")
+    assert contents["Marco Polo"]["categories"] == ["Missing stories"]
+
+
+def resolution_handler(searches: list[str]):
+    """Resolve "Rose (TV story)" directly, redirect "Rose" to a character."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        if params.get("list") == "search":
+            searches.append(params["srsearch"])
+            return httpx.Response(200, json={"query": {"search": []}})
+        titles = titles_of(request)
+        if "prop" in params:
+            pages = [
+                api_page(title, extract=EXTRACT, categories=[{"title": "C:Stories"}])
+                for title in titles
+            ]
+            return httpx.Response(200, json={"query": {"pages": pages}})
+        pages = [
+            {"title": title, "missing": True}
+            for title in titles
+            if title not in ("Rose (TV story)", "Rose")
+        ]
+        pages += [api_page("Rose (TV story)"), api_page("Rose Tyler")]
+        return httpx.Response(
+            200,
+            json={
+                "query": {
+                    "redirects": [{"from": "Rose", "to": "Rose Tyler"}],
+                    "pages": pages,
+                }
+            },
+        )
+
+    return handler
+
+
+def test_titles_resolve_through_redirects(wiki_service):
+    service = wiki_service(resolution_handler([]))
+
+    resolved = asyncio.run(
+        service._resolve_titles(["Rose (TV story)", "Rose (novel)", "Rose"])
+    )
+
+    assert resolved == {"Rose (TV story)": "Rose (TV story)", "Rose": "Rose Tyler"}
+
+
+def test_direct_title_match_skips_full_text_search(wiki_service):
+    searches: list[str] = []
+    service = wiki_service(resolution_handler(searches))
+
+    result = asyncio.run(service.search_for_item(LibraryItem(title="Rose")))
+
+    assert result.title == "Rose (TV story)"
+    assert result.confidence >= service.config.confidence_threshold
+    assert searches == []
+
+
+def test_stored_candidates_resolve_without_network(database, wiki_service):
+    requests = []
+    store = WikiPageStore()
+    service = wiki_service(
+        lambda request: requests.append(request) or httpx.Response(500),
+        page_store=store,
+    )
+    item = LibraryItem(title="Rose")
+    content = {
+        "title": "Rose",
+        "url": "https://tardis.fandom.com/wiki/Rose_(TV_story)",
+        "summary": EXTRACT,
+        "categories": ["Series 1 stories"],
+    }
+
+    async def scenario():
+        for title in service._generate_search_queries(item):
+            await store.put(title, content, canonical_title="Rose (TV story)")
+        return await service.search_for_item(item)
+
+    result = asyncio.run(scenario())
+
+    assert requests == []
+    assert result.title == "Rose (TV story)"
+
+
+def candidate_handler(delays: dict[str, float], log: dict[str, list]):
+    """Search results name the query itself; queries take ``delays`` seconds.
+
+    Queries without a delay run for 5s. No candidate is a page title, and
+    queries in ``log["misses"]`` find nothing.
+    """
+    in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight
+        params = request.url.params
+        if params.get("list") == "search":
+            query = params["srsearch"]
+            log["started"].append(query)
+            in_flight += 1
+            log["max_in_flight"].append(in_flight)
+            try:
+                await asyncio.sleep(delays.get(query, 5))
+            except asyncio.CancelledError:
+                log["cancelled"].append(query)
+                raise
+            finally:
+                in_flight -= 1
+            hits = [] if query in log["misses"] else [{"title": query}]
+            return httpx.Response(200, json={"query": {"search": hits}})
+        titles = titles_of(request)
+        if "prop" in params:
+            pages = [
+                api_page(title, extract=EXTRACT, categories=[{"title": "C:Stories"}])
+                for title in titles
+            ]
+            return httpx.Response(200, json={"query": {"pages": pages}})
+        pages = [{"title": title, "missing": True} for title in titles]
+        return httpx.Response(200, json={"query": {"pages": pages}})
+
+    return handler
+
+
+def new_log(*misses: str) -> dict[str, list]:
+    return {"started": [], "cancelled": [], "max_in_flight": [], "misses": [*misses]}
+
+
+def test_candidate_queries_respect_the_concurrency_cap(wiki_service):
+    item = LibraryItem(title="Rose")
+    log = new_log()
+    delays: dict[str, float] = {}
+    service = wiki_service(candidate_handler(delays, log))
+    log["misses"] = service._generate_search_queries(item)
+    delays.update((query, 0.01) for query in log["misses"])
+
+    result = asyncio.run(service.search_for_item(item))
+
+    assert result is None
+    assert log["started"] == list(log["misses"])
+    assert max(log["max_in_flight"]) == service.config.candidate_concurrency
+
+
+def test_earlier_queries_win_over_faster_later_ones(wiki_service):
+    log = new_log()
+    delays = {"Rose (TV story)": 0.1, "Rose (audio story)": 0}
+    service = wiki_service(candidate_handler(delays, log))
+
+    result = asyncio.run(
+        asyncio.wait_for(service.search_for_item(LibraryItem(title="Rose")), 2)
+    )
+
+    assert result.title == result.search_term == "Rose (TV story)"
+    assert log["started"] == [
+        "Rose (TV story)",
+        "Rose (audio story)",
+        "Rose (comic story)",
+        "Rose (novel)",
+    ]
+    assert sorted(log["cancelled"]) == ["Rose (comic story)", "Rose (novel)"]
+
+
+def test_later_match_wins_once_earlier_queries_miss(wiki_service):
+    log = new_log("Rose (TV story)")
+    delays = {"Rose (TV story)": 0.1, "Rose (audio story)": 0}
+    service = wiki_service(candidate_handler(delays, log))
+
+    result = asyncio.run(
+        asyncio.wait_for(service.search_for_item(LibraryItem(title="Rose")), 2)
+    )
+
+    assert result.title == "Rose (audio story)"
+    assert sorted(log["cancelled"]) == ["Rose (comic story)", "Rose (novel)"]
@@ -0,0 +1,111 @@
+"""Tests for wiki request retries and the circuit breaker."""
+
+import asyncio
+from unittest import mock
+
+import httpx
+import pytest
+
+from doctor_who_library.infrastructure.external.wiki_circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    WikiCircuitBreaker,
+)
+from doctor_who_library.shared.config.settings import WikiSettings
+from doctor_who_library.shared.exceptions.infrastructure import WikiUnavailableException
+
+URL = "https://tardis.fandom.com/api.php"
+
+
+def test_circuit_opens_after_consecutive_failures():
+    breaker = WikiCircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    with pytest.raises(WikiUnavailableException):
+        breaker.before_request()
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_single_probe_closes_or_reopens_the_circuit():
+    breaker = WikiCircuitBreaker(failure_threshold=1, reset_timeout=30)
+    with mock.patch("time.monotonic", return_value=100.0):
+        breaker.record_failure()
+
+    with mock.patch("time.monotonic", return_value=130.0):
+        breaker.before_request()
+        assert breaker.state == HALF_OPEN
+        with pytest.raises(WikiUnavailableException):
+            breaker.before_request()
+
+        breaker.record_failure()
+        assert breaker.state == OPEN
+
+    with mock.patch("time.monotonic", return_value=160.0):
+        breaker.before_request()
+        breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.stats()["trips"] == 2
+
+
+def test_transient_errors_are_retried(wiki_service):
+    outcomes = iter(["connect", 502, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        outcome = next(outcomes)
+        if outcome == "connect":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(outcome)
+
+    breaker = WikiCircuitBreaker(failure_threshold=1, reset_timeout=30)
+    service = wiki_service(handler, circuit_breaker=breaker)
+
+    response = asyncio.run(service._send(URL))
+
+    assert response.status_code == 200
+    assert breaker.state == CLOSED
+
+
+def test_exhausted_retries_trip_the_breaker(wiki_service):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(500)
+
+    config = WikiSettings(max_retries=2, backoff_base=0.001, backoff_max=0.001)
+    breaker = WikiCircuitBreaker(failure_threshold=1, reset_timeout=30)
+    service = wiki_service(handler, config=config, circuit_breaker=breaker)
+
+    with pytest.raises(WikiUnavailableException) as error:
+        asyncio.run(service._send(URL))
+    assert error.value.details["status_code"] == 500
+    assert len(requests) == 3
+    assert breaker.state == OPEN
+
+    # While open, requests fail fast without reaching the wiki
+    with pytest.raises(WikiUnavailableException):
+        asyncio.run(service._send(URL))
+    assert len(requests) == 3
+
+
+def test_client_errors_are_not_retried(wiki_service):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(404)
+
+    breaker = WikiCircuitBreaker(failure_threshold=1, reset_timeout=30)
+    service = wiki_service(handler, circuit_breaker=breaker)
+
+    assert asyncio.run(service._send(URL)).status_code == 404
+    assert len(requests) == 1
+    assert breaker.state == CLOSED
@@ -0,0 +1,139 @@
+"""Tests for importing a wiki dump and enriching from it offline."""
+
+import asyncio
+import gzip
+import shutil
+from pathlib import Path
+
+import pytest
+
+from doctor_who_library.domain.entities.library_item import LibraryItem
+from doctor_who_library.infrastructure.external.offline_wiki_service import (
+    OfflineWikiService,
+)
+from doctor_who_library.infrastructure.external.wiki_dump import (
+    iter_dump_pages,
+    parse_wikitext,
+)
+from doctor_who_library.infrastructure.external.wiki_dump_store import WikiDumpStore
+from doctor_who_library.shared.config.settings import WikiSettings
+from doctor_who_library.shared.exceptions.infrastructure import ExternalServiceException
+
+DUMP = Path(__file__).parent / "fixtures" / "wiki_dump.xml"
+
+ROSE_SUMMARY = (
+    "Rose was the first episode of series 1 of Doctor Who. "
+    "It introduced the Ninth Doctor and Rose Tyler."
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = WikiDumpStore(str(tmp_path / "dump" / "wiki.db"))
+    store.import_dump(str(DUMP))
+    yield store
+    store.close()
+
+
+def test_only_main_namespace_pages_are_read():
+    with open(DUMP, "rb") as stream:
+        pages = [(title, redirect) for title, redirect, _ in iter_dump_pages(stream)]
+
+    assert pages == [
+        ("Rose (TV story)", None),
+        ("Rose", "Rose Tyler"),
+        ("Rose Tyler", None),
+        ("The Web Planet", "The Web Planet (TV story)"),
+        ("The Web Planet (TV story)", None),
+    ]
+
+
+def test_wikitext_fields_are_extracted():
+    with open(DUMP, "rb") as stream:
+        title, _, text = next(iter_dump_pages(stream))
+
+    page = parse_wikitext(title, text)
+
+    assert page.summary == ROSE_SUMMARY
+    assert page.infobox == {
+        "name": "Rose",
+        "image": "Rose title card.jpg",
+        "doctor": "Ninth Doctor",
+        "companions": "Rose Tyler",
+        "writer": "Russell T Davies",
+    }
+    assert page.image == "Rose title card.jpg"
+    assert page.categories == ["Series 1 stories", "Stories set in London"]
+
+
+def test_import_counts_pages_and_redirects(store):
+    stats = store.stats()
+
+    assert (stats["pages"], stats["redirects"]) == ("3", "2")
+    assert stats["with_summary"] == "3"
+    assert stats["with_infobox"] == "1"
+
+
+def test_compressed_dumps_import_the_same(tmp_path, store):
+    compressed = tmp_path / "wiki.xml.gz"
+    with open(DUMP, "rb") as source, gzip.open(compressed, "wb") as target:
+        shutil.copyfileobj(source, target)
+    other = WikiDumpStore(str(tmp_path / "other.db"))
+
+    counts = other.import_dump(str(compressed))
+
+    assert (counts["pages"], counts["redirects"]) == (3, 2)
+    assert other.get_pages(["Rose Tyler"]) == store.get_pages(["Rose Tyler"])
+    other.close()
+
+
+def test_titles_resolve_through_normalization_and_redirects(store):
+    resolved = store.resolve_titles(
+        ["rose (TV story)", "Rose", "The_Web_Planet", "Marco Polo"]
+    )
+
+    assert resolved == {
+        "rose (TV story)": "Rose (TV story)",
+        "Rose": "Rose Tyler",
+        "The_Web_Planet": "The Web Planet (TV story)",
+    }
+
+
+def test_search_ranks_title_matches_first(store):
+    assert store.search("rose")[:2] == ["Rose Tyler", "Rose (TV story)"]
+    assert store.search("vortis") == ["The Web Planet (TV story)"]
+    assert store.search("!!") == []
+
+
+def test_offline_service_enriches_from_the_store(store):
+    service = OfflineWikiService(WikiSettings(), store)
+
+    async def scenario():
+        async with service:
+            return await service.search_for_item(LibraryItem(title="Rose"))
+
+    result = asyncio.run(scenario())
+
+    assert result.title == "Rose (TV story)"
+    assert result.summary == ROSE_SUMMARY
+    assert result.image_url == (
+        "https://tardis.fandom.com/wiki/Special:FilePath/Rose_title_card.jpg"
+    )
+
+
+def test_offline_service_never_touches_the_network(store):
+    service = OfflineWikiService(WikiSettings(), store)
+
+    with pytest.raises(ExternalServiceException, match="offline"):
+        asyncio.run(service._send("https://tardis.fandom.com/wiki/Rose"))
+
+
+def test_offline_service_needs_an_imported_store(tmp_path):
+    service = OfflineWikiService(WikiSettings(), WikiDumpStore(str(tmp_path / "x")))
+
+    async def scenario():
+        async with service:
+            pass
+
+    with pytest.raises(ExternalServiceException, match="import-dump"):
+        asyncio.run(scenario())
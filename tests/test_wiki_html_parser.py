@@ -0,0 +1,69 @@
+"""Tests for the interchangeable wiki HTML parser backends."""
+
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from doctor_who_library.infrastructure.external.wiki_html_parser import (
+    ScrapedPage,
+    SoupHtmlParser,
+    available_backends,
+    get_html_parser,
+)
+
+PAGE = (Path(__file__).parent / "fixtures" / "wiki_page.html").read_text()
+
+BACKENDS = available_backends()
+
+
+@pytest.fixture(params=BACKENDS)
+def parser(request):
+    return get_html_parser(request.param)
+
+
+def test_reference_backend_reads_the_scraped_regions():
+    page = SoupHtmlParser().parse(PAGE)
+
+    assert page.summary == (
+        "The Web Planet was the fifth serial of season 2 of Doctor Who. "
+        "It was set on the planet Vortis."
+    )
+    assert page.infobox == [
+        ("Doctor", "First Doctor"),
+        ("Companions", "Ian ChestertonBarbara WrightVicki"),
+        ("Writer", "Bill Strutton"),
+    ]
+    assert page.categories == [
+        "First Doctor television stories",
+        "Stories set on Vortis",
+    ]
+    assert page.images == [
+        "https://static.wikia.nocookie.net/web_planet.jpg",
+        "https://static.wikia.nocookie.net/zarbi.png",
+        "https://static.wikia.nocookie.net/menoptra.gif",
+    ]
+
+
+def test_backends_match_the_reference(parser):
+    assert parser.parse(PAGE) == SoupHtmlParser().parse(PAGE)
+
+
+def test_content_text_div_is_used_without_parser_output(parser):
+    html = PAGE.replace('class="mw-parser-output"', 'class="article"')
+
+    assert parser.parse(html).summary.startswith("The Web Planet was")
+
+
+@pytest.mark.parametrize("html", ["", "<script>only()</script>", "<p>tiny</p>"])
+def test_pages_without_content_parse_empty(parser, html):
+    assert parser.parse(html) == ScrapedPage()
+
+
+def test_missing_backend_falls_back():
+    # A None entry makes the import raise ImportError
+    with mock.patch.dict(sys.modules, {"selectolax.lexbor": None}):
+        assert get_html_parser("selectolax").name == "html.parser"
+        assert "selectolax" not in available_backends()
+        assert get_html_parser("auto").name != "selectolax"
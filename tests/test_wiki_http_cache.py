@@ -0,0 +1,117 @@
+"""Tests for the persistent wiki HTTP cache."""
+
+import asyncio
+import itertools
+import os
+from unittest import mock
+
+import httpx
+import pytest
+
+from doctor_who_library.infrastructure.external.wiki_http_cache import (
+    WikiHttpCache,
+    cache_key,
+)
+
+URL = "https://tardis.fandom.com/api.php"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = WikiHttpCache(str(tmp_path / "http.db"), max_bytes=1024 * 1024)
+    yield cache
+    cache.close()
+
+
+def test_keys_ignore_parameter_order():
+    assert cache_key(URL, {"b": 2, "a": 1}) == cache_key(URL, {"a": 1, "b": 2})
+    assert cache_key(URL) == URL
+
+
+def test_stored_responses_round_trip(cache):
+    headers = {"content-type": "text/html", "etag": '"v1"', "set-cookie": "x"}
+    cache.put("k", headers, b"<html>" * 100, ttl=60)
+
+    cached = cache.get("k")
+
+    assert cached.fresh
+    assert cached.body == b"<html>" * 100
+    assert cached.headers == {"content-type": "text/html", "etag": '"v1"'}
+    assert cache.stats()["size_bytes"] < 600
+
+
+def test_no_store_responses_are_skipped(cache):
+    cache.put("k", {"cache-control": "private, no-store"}, b"x", ttl=60)
+
+    assert cache.get("k") is None
+
+
+def test_stale_entries_carry_their_validators(cache):
+    cache.put("k", {"etag": '"v1"', "last-modified": "Sat, 01 Jan 2000"}, b"x", ttl=0)
+
+    cached = cache.get("k")
+
+    assert not cached.fresh
+    assert cached.conditional_headers() == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Sat, 01 Jan 2000",
+    }
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = WikiHttpCache(str(tmp_path / "http.db"), max_bytes=1000)
+    clock = itertools.count(1_000_000)
+    with mock.patch("time.time", side_effect=lambda: next(clock)):
+        # Random bytes do not compress, so each entry stores ~400 bytes
+        cache.put("a", {}, os.urandom(400), ttl=3600)
+        cache.put("b", {}, os.urandom(400), ttl=3600)
+        cache.get("a")
+        cache.put("c", {}, os.urandom(400), ttl=3600)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size_bytes"] <= 900
+    cache.close()
+
+
+def test_not_modified_renews_the_cached_response(cache, wiki_service):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"etag": '"v1"'}, content=b"page")
+
+    service = wiki_service(handler, http_cache=cache)
+
+    async def scenario():
+        first = await service._get(URL, params={"page": "Rose"}, ttl=0)
+        revalidated = await service._get(URL, params={"page": "Rose"}, ttl=60)
+        fresh = await service._get(URL, params={"page": "Rose"}, ttl=60)
+        return first, revalidated, fresh
+
+    responses = asyncio.run(scenario())
+
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    assert {response.content for response in responses} == {b"page"}
+    assert len(requests) == 2
+    assert "If-None-Match" not in requests[0].headers
+    stats = cache.stats()
+    assert (stats["stale"], stats["revalidated"], stats["hits"]) == (1, 1, 1)
+
+
+def test_changed_page_replaces_the_cached_response(cache, wiki_service):
+    versions = iter([b"old", b"new"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"etag": '"v"'}, content=next(versions))
+
+    service = wiki_service(handler, http_cache=cache)
+    asyncio.run(service._get(URL, ttl=0))
+    response = asyncio.run(service._get(URL, ttl=60))
+
+    assert response.content == b"new"
+    assert cache.get(URL).body == b"new"
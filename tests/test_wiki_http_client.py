@@ -0,0 +1,56 @@
+"""Tests for the shared wiki HTTP client."""
+
+import asyncio
+
+import httpx
+
+from doctor_who_library.infrastructure.external.wiki_http_client import WikiHttpClient
+from doctor_who_library.shared.config.settings import WikiSettings
+
+
+def test_one_client_per_event_loop():
+    http_client = WikiHttpClient(WikiSettings(http2=False))
+
+    async def clients():
+        return http_client.get(), http_client.get()
+
+    first, again = asyncio.run(clients())
+    (second, _) = asyncio.run(clients())
+
+    assert first is again
+    assert second is not first
+    assert http_client.stats()["clients_created"] == 2
+
+
+def test_closed_client_is_rebuilt():
+    http_client = WikiHttpClient(WikiSettings(http2=False))
+
+    async def scenario():
+        await http_client.start()
+        first = http_client.get()
+        await http_client.aclose()
+        return first, http_client.get()
+
+    first, second = asyncio.run(scenario())
+
+    assert first.is_closed
+    assert second is not first
+    assert second.timeout.read == WikiSettings().timeout
+
+
+def test_services_share_the_client_and_its_stats(wiki_service):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200)
+
+    service = wiki_service(handler)
+    other = type(service)(service.config, http_client=service.http_client)
+
+    async def scenario():
+        await service._send("https://tardis.fandom.com/api.php")
+        await other._send("https://tardis.fandom.com/api.php")
+        return service._session is other._session
+
+    assert asyncio.run(scenario())
+    stats = service.http_client.stats()
+    assert stats["requests"] == 2
+    assert stats["http_versions"] == {"HTTP/1.1": 2}
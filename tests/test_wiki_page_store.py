@@ -0,0 +1,146 @@
+"""Tests for the store of parsed wiki pages."""
+
+import asyncio
+
+import httpx
+
+from doctor_who_library.domain.entities.library_item import LibraryItem
+from doctor_who_library.infrastructure.database.wiki_page_store import WikiPageStore
+from doctor_who_library.infrastructure.external.tardis_wiki_service import (
+    TardisWikiService,
+)
+from doctor_who_library.shared.database.connection import execute_update
+
+DALEKS = {
+    "title": "The Daleks (TV story)",
+    "url": "https://tardis.fandom.com/wiki/The_Daleks_(TV_story)",
+    "summary": "The Daleks was the second serial of season 1 of Doctor Who.",
+    "categories": ["Season 1 stories"],
+}
+
+EXTRACT = (
+    "The Daleks was the second serial of season 1 of Doctor Who, and the "
+    "first to feature the Daleks."
+)
+
+
+def test_pages_round_trip_under_their_canonical_title(database):
+    store = WikiPageStore()
+
+    async def scenario():
+        await store.put("The Daleks (TV story)", DALEKS, revision_id=7)
+        return await store.get("The Daleks (TV story)"), await store.get("Nope")
+
+    page, missing = asyncio.run(scenario())
+
+    assert page == DALEKS
+    assert missing is None
+    assert store.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "stores": 1}
+
+
+def test_requested_titles_redirect_to_the_stored_page(database):
+    store = WikiPageStore()
+
+    async def scenario():
+        await store.put(
+            "The Dead Planet", DALEKS, canonical_title="The Daleks (TV story)"
+        )
+        by_redirect = await store.get("The Dead Planet")
+        return by_redirect, await store.get("The Daleks (TV story)")
+
+    by_redirect, by_title = asyncio.run(scenario())
+
+    assert by_redirect == by_title == DALEKS
+    assert store.stats()["stores"] == 1
+
+
+def test_pages_older_than_max_age_are_misses(database):
+    title = "The Daleks (TV story)"
+    asyncio.run(WikiPageStore().put(title, DALEKS))
+    execute_update("UPDATE wiki_pages SET fetched_at = datetime('now', '-2 hours')")
+
+    def lookup(max_age_seconds: int):
+        return asyncio.run(WikiPageStore(max_age_seconds).get(title))
+
+    assert lookup(3600) is None
+    assert lookup(86400) == DALEKS
+    assert lookup(0) == DALEKS
+
+
+def test_missing_tables_miss_and_skip_writes(database):
+    execute_update("DROP TABLE wiki_page_redirects")
+    execute_update("DROP TABLE wiki_pages")
+    store = WikiPageStore()
+
+    async def scenario():
+        await store.put("The Daleks (TV story)", DALEKS)
+        return await store.get("The Daleks (TV story)")
+
+    assert asyncio.run(scenario()) is None
+    assert store.stats() == {"hits": 0, "misses": 1, "hit_rate": 0.0, "stores": 0}
+
+
+def test_page_identity_comes_from_the_page_config():
+    html = (
+        '<script>RLCONF={"wgPageName":"The_Daleks_(TV_story)",'
+        '"wgRevisionId":12345,"wgTitle":"The \\"Daleks\\""};</script>'
+    )
+
+    assert TardisWikiService._page_identity(html) == ("The Daleks (TV story)", 12345)
+    assert TardisWikiService._page_identity("<html></html>") == (None, None)
+
+
+def test_stored_pages_are_scored_under_the_requested_title(database, wiki_service):
+    store = WikiPageStore()
+    asyncio.run(
+        store.put("The Dead Planet", DALEKS, canonical_title="The Daleks (TV story)")
+    )
+    service = wiki_service(lambda request: httpx.Response(500), page_store=store)
+
+    page = asyncio.run(service._get_stored_page("The Dead Planet"))
+
+    assert page == {**DALEKS, "title": "The Dead Planet"}
+
+
+def test_episodes_of_one_story_share_a_single_fetch(database, wiki_service):
+    content_requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        titles = params["titles"].split("|")
+        if "prop" in params:
+            content_requests.append(titles)
+            pages = [
+                {
+                    "title": title,
+                    "pageid": 1,
+                    "lastrevid": 7,
+                    "extract": EXTRACT,
+                    "categories": [{"title": "Category:Season 1 stories"}],
+                }
+                for title in titles
+            ]
+            return httpx.Response(200, json={"query": {"pages": pages}})
+        # Every episode title redirects to the story's page
+        redirects = [
+            {"from": title, "to": "The Daleks (TV story)"}
+            for title in titles
+            if "(" not in title
+        ]
+        pages = [{"title": title, "missing": True} for title in titles if "(" in title]
+        pages.append({"title": "The Daleks (TV story)", "pageid": 1})
+        return httpx.Response(
+            200, json={"query": {"redirects": redirects, "pages": pages}}
+        )
+
+    service = wiki_service(handler, page_store=WikiPageStore())
+
+    async def scenario():
+        first = await service.search_for_item(LibraryItem(title="The Dead Planet"))
+        second = await service.search_for_item(LibraryItem(title="The Survivors"))
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first.title == second.title == "The Daleks (TV story)"
+    assert content_requests == [["The Daleks (TV story)"]]
@@ -0,0 +1,106 @@
+"""Tests for the shared wiki rate limiter."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest import mock
+
+import httpx
+import pytest
+
+from doctor_who_library.infrastructure.external.wiki_rate_limiter import (
+    WikiRateLimiter,
+    parse_retry_after,
+)
+
+
+@pytest.fixture
+def clock():
+    with mock.patch("time.monotonic", return_value=100.0) as monotonic:
+        yield monotonic
+
+
+def test_burst_then_one_request_per_interval(clock):
+    limiter = WikiRateLimiter(max_rate=10, min_rate=1, burst=2)
+
+    waits = [limiter._reserve() for _ in range(4)]
+
+    assert waits == pytest.approx([0.0, 0.0, 0.1, 0.2])
+
+
+def test_throttling_halves_the_rate_and_pauses_traffic(clock):
+    limiter = WikiRateLimiter(max_rate=8, min_rate=3)
+
+    assert limiter.record_throttled(retry_after=5) == 5
+    assert limiter.stats()["rate_limit"] == 4
+    assert limiter._reserve() == pytest.approx(5.0)
+
+    limiter.record_throttled(retry_after=0)
+    assert limiter.stats()["rate_limit"] == 3
+
+
+def test_successes_recover_the_rate_gradually(clock):
+    limiter = WikiRateLimiter(max_rate=10, min_rate=1)
+    limiter.record_throttled(retry_after=0)
+
+    limiter.record_success()
+    assert limiter.stats()["rate_limit"] == pytest.approx(5.2)
+
+    for _ in range(100):
+        limiter.record_success()
+    assert limiter.stats()["rate_limit"] == 10
+
+
+def test_retry_after_accepts_seconds_and_dates():
+    later = datetime.now(UTC) + timedelta(seconds=30)
+
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after("-3") == 0.0
+    assert 25 < parse_retry_after(format_datetime(later, usegmt=True)) <= 30
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_throttled_response_is_retried_after_the_pause(wiki_service):
+    statuses = iter([429, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), headers={"Retry-After": "0"})
+
+    limiter = WikiRateLimiter(max_rate=100, min_rate=1)
+    service = wiki_service(handler, rate_limiter=limiter)
+
+    response = asyncio.run(service._send("https://tardis.fandom.com/api.php"))
+
+    assert response.status_code == 200
+    stats = limiter.stats()
+    assert (stats["requests"], stats["throttled"]) == (2, 1)
+    assert stats["rate_limit"] == pytest.approx(52.0)
+
+
+def test_queued_requests_wait_out_a_throttle():
+    limiter = WikiRateLimiter(max_rate=20, min_rate=1)
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        sent = []
+
+        async def request():
+            await limiter.acquire()
+            sent.append(loop.time())
+
+        tasks = [asyncio.create_task(request()) for _ in range(4)]
+        await asyncio.sleep(0.01)
+        throttled_at = loop.time()
+        limiter.record_throttled(retry_after=0.2)
+        await asyncio.gather(*tasks)
+        return throttled_at, sorted(sent)
+
+    throttled_at, sent = asyncio.run(scenario())
+
+    assert sent[0] < throttled_at
+    assert all(at >= throttled_at + 0.2 for at in sent[1:])
+    # Re-queued at the halved rate, one per 0.1s
+    assert sent[3] - sent[1] == pytest.approx(0.2, abs=0.05)
+    stats = limiter.stats()
+    assert (stats["requests"], stats["queue_depth"]) == (4, 0)